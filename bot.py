@@ -1,7 +1,12 @@
+import os
+import sys
+import runpy
 import threading
 import time
+from abc import ABCMeta, abstractmethod
 from subprocess import PIPE, Popen
 from log import logger
+from reaper import reaper
 import config
 import copy
 
@@ -17,6 +22,10 @@ class ExecuteError(OSError):
     def __init__(self):
         super().__init__('can\'t start bot process')
 
+    def __reduce__(self):
+        # Recorded replies of the game keep these exceptions
+        return type(self), ()
+
 
 class ProcessNotRunningException(OSError):
     '''
@@ -26,6 +35,10 @@ class ProcessNotRunningException(OSError):
     def __init__(self):
         super().__init__('process isn\'t running')
 
+    def __reduce__(self):
+        # Recorded replies of the game keep these exceptions
+        return type(self), ()
+
 
 class TimeLimitException(OSError):
     '''
@@ -34,6 +47,10 @@ class TimeLimitException(OSError):
     def __init__(self):
         super().__init__('time limit exceeded')
 
+    def __reduce__(self):
+        # Recorded replies of the game keep these exceptions
+        return type(self), ()
+
 
 class BaseBot:
     '''
@@ -57,7 +74,13 @@ class BaseBot:
         '''
         self._player_command = player_command
         self._process = None
+        self._is_killed = False
+        self._is_reaped = False
+        self._reap_callbacks = []
+        self._reap_lock = threading.Lock()
         self._count_of_moves = 0
+        self.exit_status = None
+        self.resource_usage = None
 
     def create_process(self):
         '''
@@ -65,7 +88,7 @@ class BaseBot:
         '''
         logger.info('executing \'%s\'', self._player_command)
         try:
-            self._process = psutil.Popen(
+            self._process = Popen(
                 self._player_command.split(),
                 stdout=PIPE,
                 stdin=PIPE,
@@ -75,6 +98,8 @@ class BaseBot:
             logger.critical('executing of \'%s\' failed: invalid command',
                             self._player_command)
             raise ExecuteError
+        self._is_killed = False
+        self._is_reaped = False
 
         logger.info('executing successful')
 
@@ -84,6 +109,38 @@ class BaseBot:
         '''
         return time.time()
 
+    def wait_ready(self):
+        '''
+        Waits until bot prints `config.ready_message` line after start.
+        Does nothing if game config has no `ready_message`.
+        Time spent here isn't counted against the move time limit,
+        bot's start is limited by `config.ready_time_limit_seconds`
+        (`config.real_time_limit_seconds` by default).
+        '''
+        if not hasattr(config, 'ready_message'):
+            return
+        if self._process is None:
+            raise ProcessNotRunningException()
+        time_limit = getattr(config, 'ready_time_limit_seconds',
+                             config.real_time_limit_seconds)
+        ready_line = []
+        ready_thread = threading.Thread(
+            target=lambda: ready_line.append(self._process.stdout.readline())
+        )
+        ready_thread.start()
+        ready_thread.join(time_limit)
+        if ready_thread.is_alive():
+            self.kill_process()
+            logger.error('bot with cmd \'%s\' exceeded start time limit',
+                         self._player_command)
+            raise TimeLimitException
+        if ready_line[0].decode().strip() != config.ready_message:
+            self.kill_process()
+            logger.error('bot with cmd \'%s\' didn\'t report readiness',
+                         self._player_command)
+            raise ExecuteError
+        logger.info('bot with cmd \'%s\' is ready', self._player_command)
+
     def get_move(self, player_state, serialize, deserialize):
         '''
         Serialize player_state and transfer it to bot,
@@ -165,20 +222,56 @@ class BaseBot:
         except (BaseException, Exception) as exc:
             self._get_move_exception = exc
 
-    def kill_process(self):
+    def kill_process(self, callback=None):
         '''
         Kills bot's process if it is running or does nothing
         if the process was already killed.
+        The process is reaped asynchronously, its exit status and
+        resource usage are stored to `exit_status` and `resource_usage`,
+        then `callback(exit_status, resource_usage)` is called (also if
+        the process was killed before).
         '''
-        if self._process is not None:
+        if self._process is not None and not self._is_killed:
             try:
                 self._process.kill()
-                self._process.communicate()
             except OSError:
                 pass
+            self._reap()
+        self._add_reap_callback(callback)
         logger.info('process with cmd line \'%s\' was killed',
                     self._player_command)
 
+    def _reap(self):
+        '''
+        Passes killed process to the reaper.
+        '''
+        self._is_killed = True
+        reaper.reap(self._process, self._on_reaped)
+
+    def _add_reap_callback(self, callback):
+        if callback is None or self._process is None:
+            return
+        with self._reap_lock:
+            if not self._is_reaped:
+                self._reap_callbacks.append(callback)
+                return
+        callback(self.exit_status, self.resource_usage)
+
+    def _on_reaped(self, exit_status, resource_usage):
+        '''
+        Invoked by the reaper when bot's process is reaped.
+        '''
+        with self._reap_lock:
+            self.exit_status = exit_status
+            self.resource_usage = resource_usage
+            self._is_reaped = True
+            callbacks, self._reap_callbacks = self._reap_callbacks, []
+        logger.debug('process with cmd line \'%s\' exited with %s, '
+                     'resource usage: %s', self._player_command,
+                     exit_status, resource_usage)
+        for callback in callbacks:
+            callback(exit_status, resource_usage)
+
     def __del__(self):
         '''
         Destructor for class bot.
@@ -220,6 +313,8 @@ class ComplexBot(BaseBot):
             logger.critical('executing of \'%s\' failed: invalid command',
                             self._player_command)
             raise ExecuteError
+        self._is_killed = False
+        self._is_reaped = False
 
         logger.info('executing successful')
 
@@ -319,22 +414,225 @@ class ComplexBot(BaseBot):
         except psutil.NoSuchProcess:
             raise ProcessNotRunningException()
 
-    def kill_process(self):
+    def kill_process(self, callback=None):
         '''
         Kills bot's process if it is running or does nothing
         if the process was already killed.
+        The process is reaped asynchronously, see BaseBot.kill_process.
         '''
         import psutil
-        if self._process is not None:
+        if self._process is not None and not self._is_killed:
             try:
                 self._process.kill()
-                self._process.communicate()
             except (OSError, psutil.NoSuchProcess):
                 pass
+            self._reap()
+        self._add_reap_callback(callback)
         logger.info('process with cmd line \'%s\' was killed',
                     self._player_command)
 
 
+class ForfeitedBot:
+    '''
+    Stands in for a quarantined bot: no process is spawned and every
+    request of a move fails immediately with ExecuteError.
+    '''
+    def __init__(self, player_command):
+        self._player_command = player_command
+
+    def create_process(self):
+        logger.info('bot with cmd \'%s\' is quarantined, not executing',
+                    self._player_command)
+
+    def get_move(self, player_state, serialize, deserialize):
+        raise ExecuteError
+
+    def kill_process(self, callback=None):
+        pass
+
+
+IN_PROCESS_PREFIX = 'inprocess:'
+
+
+class _ThreadLocalStream:
+    '''
+    Replaces `sys.stdin` or `sys.stdout`: threads of in-process bots
+    get their own streams, other threads get the original one.
+    '''
+    def __init__(self, default):
+        self._default = default
+        self._streams = {}
+
+    def set_stream(self, stream):
+        self._streams[threading.get_ident()] = stream
+
+    def remove_stream(self):
+        self._streams.pop(threading.get_ident(), None)
+
+    def __getattr__(self, name):
+        stream = self._streams.get(threading.get_ident(), self._default)
+        return getattr(stream, name)
+
+
+def _install_thread_local_stdio():
+    '''
+    Installs _ThreadLocalStream as `sys.stdin` and `sys.stdout`
+    if it isn't installed yet. Returns both of them.
+    '''
+    if not isinstance(sys.stdin, _ThreadLocalStream):
+        sys.stdin = _ThreadLocalStream(sys.stdin)
+    if not isinstance(sys.stdout, _ThreadLocalStream):
+        sys.stdout = _ThreadLocalStream(sys.stdout)
+    return sys.stdin, sys.stdout
+
+
+class _InProcessRunner:
+    '''
+    Runs bot's script in a thread of the referee. Plays the role of the
+    bot's process for BaseBot: `stdin` and `stdout` are the referee's
+    ends of the pipes connected to the script's `sys.stdin`/`sys.stdout`.
+    '''
+    def __init__(self, path):
+        self._path = path
+        bot_stdin_fd, stdin_fd = os.pipe()
+        stdout_fd, bot_stdout_fd = os.pipe()
+        self.stdin = open(stdin_fd, 'wb')
+        self.stdout = open(stdout_fd, 'rb')
+        self._bot_stdin = open(bot_stdin_fd, 'r')
+        self._bot_stdout = open(bot_stdout_fd, 'w', buffering=1)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._stdin_proxy, self._stdout_proxy = _install_thread_local_stdio()
+        directory = os.path.dirname(os.path.abspath(self._path))
+        if directory not in sys.path:
+            # Modules next to the script are importable, as when it is run
+            # by `python3 bot.py`; modules of the referee go first
+            sys.path.append(directory)
+        self._thread.start()
+
+    def _run(self):
+        self._stdin_proxy.set_stream(self._bot_stdin)
+        self._stdout_proxy.set_stream(self._bot_stdout)
+        try:
+            runpy.run_path(self._path, run_name='__main__')
+        except (BaseException, Exception) as exc:
+            logger.info('in-process bot \'%s\' stopped: %r',
+                        self._path, exc)
+        finally:
+            self._stdin_proxy.remove_stream()
+            self._stdout_proxy.remove_stream()
+            self._close(self._bot_stdout)
+            self._close(self._bot_stdin)
+
+    def _close(self, stream):
+        try:
+            stream.close()
+        except OSError:
+            pass
+
+    def kill(self):
+        '''
+        Closes the referee's ends of the pipes, so the script stops on
+        its next input or output. A script which does neither keeps
+        running, that's why only trusted bots may be run in-process.
+        '''
+        self._close(self.stdin)
+        self._close(self.stdout)
+
+
+class WaitingBot(BaseBot, metaclass=ABCMeta):
+    '''
+    Base class for bots which don't run in a process of their own,
+    subclasses implement _stop.
+    Waits for the move with Thread.join instead of polling, so the bot
+    isn't slowed down; only real time limit is checked.
+    '''
+    def get_move(self, player_state, serialize, deserialize):
+        '''
+        Same as BaseBot.get_move.
+        '''
+        if self._process is None or self._is_killed:
+            raise ProcessNotRunningException()
+
+        if self._count_of_moves % config.time_limit_count_of_moves == 0:
+            self._real_time_remainder = 0
+        self._count_of_moves += 1
+        self._get_move_exception = None
+
+        get_move_thread = threading.Thread(
+            target=self._get_move,
+            args=(player_state, serialize, deserialize),
+            daemon=True
+        )
+        real_time_start = self._get_real_time()
+        get_move_thread.start()
+        get_move_thread.join(config.real_time_limit_seconds -
+                             self._real_time_remainder)
+        self._real_time_remainder += self._get_real_time() - real_time_start
+
+        if get_move_thread.is_alive():
+            self.kill_process()
+            logger.error('bot with cmd \'%s\' exceeded time limit',
+                         self._player_command)
+            raise TimeLimitException
+
+        if self._get_move_exception:
+            logger.error('exception has been raised during '
+                         'interaction with bot')
+            raise self._get_move_exception
+        return self._deserialize_result
+
+    @abstractmethod
+    def _stop(self):
+        '''
+        Stops the bot, called once by kill_process.
+        '''
+        pass
+
+    def kill_process(self, callback=None):
+        '''
+        Stops the bot. There is no process to reap, so `callback`
+        gets None as exit status and resource usage.
+        '''
+        if self._process is not None and not self._is_killed:
+            self._stop()
+            self._is_killed = True
+            self._on_reaped(None, None)
+        self._add_reap_callback(callback)
+        logger.info('bot with cmd \'%s\' was stopped', self._player_command)
+
+
+class InProcessBot(WaitingBot):
+    '''
+    Runs trusted Python bot inside the referee instead of a separate
+    process, which saves process start and pipe round-trips.
+    It is used for players whose command line is
+    `inprocess:path/to/bot.py` (see `create_bot`).
+    '''
+    def __init__(self, player_command):
+        super().__init__(player_command)
+        self._bot_path = player_command[len(IN_PROCESS_PREFIX):].strip()
+
+    def create_process(self):
+        '''
+        Starts bot's script in a thread.
+        '''
+        logger.info('executing \'%s\' in-process', self._bot_path)
+        if not os.path.isfile(self._bot_path):
+            logger.critical('executing of \'%s\' failed: no such file',
+                            self._bot_path)
+            raise ExecuteError
+        self._process = _InProcessRunner(self._bot_path)
+        self._process.start()
+        self._is_killed = False
+        self._is_reaped = False
+        logger.info('executing successful')
+
+    def _stop(self):
+        self._process.kill()
+
+
 def is_psutil():
     '''
     Returns if psutil is installed.
@@ -348,3 +646,17 @@ def is_psutil():
 
 
 Bot = ComplexBot if is_psutil() else BaseBot
+
+
+def create_bot(player_command):
+    '''
+    Returns InProcessBot for commands starting with IN_PROCESS_PREFIX,
+    multiplexed_bot.ChannelBot for commands starting with
+    MULTIPLEXED_PREFIX and Bot otherwise.
+    '''
+    if player_command.startswith(IN_PROCESS_PREFIX):
+        return InProcessBot(player_command)
+    import multiplexed_bot
+    if player_command.startswith(multiplexed_bot.MULTIPLEXED_PREFIX):
+        return multiplexed_bot.ChannelBot(player_command)
+    return Bot(player_command)
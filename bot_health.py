@@ -0,0 +1,60 @@
+from copy import copy
+from log import logger
+import threading
+
+
+class BotHealthTracker:
+    '''
+    Tracks consecutive failures of every player during the tournament.
+    A player whose bot failed (`ExecuteError` or `TimeLimitException`)
+    in `max_failures` games in a row is quarantined: in later games
+    the bot isn't spawned and the player forfeits immediately.
+    Outcomes are added from threads of concurrent games, so updates
+    are locked.
+
+    Usage:
+        >> health = BotHealthTracker(3)
+        >> health.add_game_outcome(player, failed=True)
+        >> health.is_quarantined(player)
+        False
+        >> health.add_forfeit(game_signature, player)
+    '''
+    def __init__(self, max_failures):
+        self._max_failures = max_failures
+        self._failures = {}
+        self._lock = threading.Lock()
+        self.forfeits = []
+
+    def add_game_outcome(self, player, failed):
+        '''
+        Stores outcome of one game for `player`.
+        Successful game resets counter of consecutive failures.
+        '''
+        with self._lock:
+            if failed:
+                self._failures[player] = self._failures.get(player, 0) + 1
+                if self._failures[player] == self._max_failures:
+                    logger.warning('bot \'%s\' is quarantined after %d '
+                                   'consecutive failures', player.bot_name,
+                                   self._max_failures)
+            else:
+                self._failures[player] = 0
+
+    def is_quarantined(self, player):
+        '''
+        Returns True if bot of `player` shouldn't be spawned anymore.
+        '''
+        return self._failures.get(player, 0) >= self._max_failures
+
+    def add_forfeit(self, game_signature, player):
+        '''
+        Records that `player` forfeited the game `game_signature`.
+        '''
+        with self._lock:
+            self.forfeits.append((copy(game_signature), player))
+
+    def get_forfeits(self):
+        '''
+        Returns list of tuples (game_signature, player) of all forfeits.
+        '''
+        return self.forfeits
@@ -0,0 +1,43 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from player import Player
+from bot_health import BotHealthTracker
+from tournament_stages.game_signature import GameSignature
+
+
+class BotHealthTrackerTest(unittest.TestCase):
+    def setUp(self):
+        self.player = Player('python3 bot.py', 'John Doe', 'Bot')
+        self.health = BotHealthTracker(2)
+
+    def test_quarantine_after_consecutive_failures(self):
+        self.health.add_game_outcome(self.player, failed=True)
+        self.assertFalse(self.health.is_quarantined(self.player))
+        self.health.add_game_outcome(self.player, failed=True)
+        self.assertTrue(self.health.is_quarantined(self.player))
+
+    def test_success_resets_failures(self):
+        self.health.add_game_outcome(self.player, failed=True)
+        self.health.add_game_outcome(self.player, failed=False)
+        self.health.add_game_outcome(self.player, failed=True)
+        self.assertFalse(self.health.is_quarantined(self.player))
+
+    def test_forfeits(self):
+        signature = GameSignature(1, 2, 3, 4)
+        self.health.add_forfeit(signature, self.player)
+        signature.game_id = 5
+        ((forfeit_signature, player),) = self.health.get_forfeits()
+        self.assertEqual(forfeit_signature.game_id, 4)
+        self.assertEqual(player, self.player)
+
+    def test_concurrent_games(self):
+        health = BotHealthTracker(1000)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(
+                lambda _: health.add_game_outcome(self.player, failed=True),
+                range(1000)))
+        self.assertTrue(health.is_quarantined(self.player))
+
+
+if __name__ == '__main__':
+    unittest.main()
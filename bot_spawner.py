@@ -0,0 +1,60 @@
+import threading
+from log import logger
+import bot
+
+
+class BotSpawner:
+    '''
+    Launches bots of one game in background, so the game can start
+    with already running bots.
+    Usage:
+        >> spawner = BotSpawner(players)  # while previous game runs
+        >> eng = GameSimulator(players, start_state, signature,
+                               spawner=spawner)
+    Examples:
+    # Getting started bot, re-raises error of its start if any
+    >> spawner.take(player)
+    # Killing bots that weren't taken
+    >> spawner.release()
+    '''
+    def __init__(self, players):
+        self._players = players
+        self._bots = {}
+        self._errors = {}
+        self._thread = threading.Thread(target=self._spawn)
+        self._thread.start()
+
+    def _spawn(self):
+        '''
+        Creates bot's process and waits until it is ready
+        for each player.
+        '''
+        for player in self._players:
+            new_bot = bot.create_bot(player.command_line)
+            try:
+                new_bot.create_process()
+                new_bot.wait_ready()
+            except OSError as exception:
+                self._errors[player] = exception
+            else:
+                self._bots[player] = new_bot
+                logger.debug('pre-spawned bot \'%s\'', player.bot_name)
+
+    def take(self, player):
+        '''
+        Waits for spawning to finish and returns bot of `player`.
+        Raises exception which was raised while starting the bot.
+        '''
+        self._thread.join()
+        if player in self._errors:
+            raise self._errors.pop(player)
+        return self._bots.pop(player)
+
+    def release(self):
+        '''
+        Kills all bots which weren't taken.
+        '''
+        self._thread.join()
+        for spawned_bot in self._bots.values():
+            spawned_bot.kill_process()
+        self._bots = {}
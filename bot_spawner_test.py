@@ -0,0 +1,42 @@
+import sys
+
+GAME_PATH = 'games/pepelac'
+
+import config_helpers
+config_helpers.initialize_game_environment(GAME_PATH)
+import unittest
+import bot
+from player import Player
+from bot_spawner import BotSpawner
+
+
+PLAYER_COMMAND = sys.executable + ' test_game.py'
+WRONG_PLAYER_COMMAND = 'fffaaasd test_game.py'
+
+
+class BotSpawnerTest(unittest.TestCase):
+    def setUp(self):
+        self.player = Player(PLAYER_COMMAND, 'John Doe', 'Bot #1')
+        self.wrong_player = Player(WRONG_PLAYER_COMMAND, 'John Doe', 'Bot #2')
+
+    def test_take(self):
+        spawner = BotSpawner([self.player])
+        spawned_bot = spawner.take(self.player)
+        self.assertIsNotNone(spawned_bot._process)
+        spawned_bot.kill_process()
+
+    def test_take_wrong_command(self):
+        spawner = BotSpawner([self.wrong_player, self.player])
+        with self.assertRaises(bot.ExecuteError):
+            spawner.take(self.wrong_player)
+        spawner.release()
+
+    def test_release(self):
+        spawner = BotSpawner([self.player])
+        spawner.release()
+        with self.assertRaises(KeyError):
+            spawner.take(self.player)
+
+
+if __name__ == '__main__':
+    unittest.main()
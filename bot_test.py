@@ -13,6 +13,7 @@ import time
 import psutil
 from unittest.mock import Mock
 from bot import TimeLimitException
+from reaper import reaper
 
 
 PLAYER_COMMAND = sys.executable + ' test_game.py'
@@ -50,8 +51,24 @@ class BotTest(unittest.TestCase):
         test_bot = bot.Bot(PLAYER_COMMAND)
         test_bot.create_process()
         test_bot.kill_process()
+        # The process is reaped asynchronously
+        reaper.wait_all()
         self.assertFalse(test_bot._process.is_running())
 
+    def test_resource_usage(self):
+        ''' This test checks if exit status and resource usage of the
+        killed process are recorded '''
+        callback = Mock()
+        test_bot = bot.Bot(PLAYER_COMMAND)
+        test_bot.create_process()
+        test_bot.kill_process(callback)
+        reaper.wait_all()
+        self.assertIsNotNone(test_bot.exit_status)
+        callback.assert_called_once_with(test_bot.exit_status,
+                                         test_bot.resource_usage)
+        test_bot.kill_process(callback)
+        self.assertEqual(callback.call_count, 2)
+
     def test_get_move(self):
         ''' This test checks whether bot's IO is working properly '''
         def side_effect_for_deserialize(pipe):
@@ -108,5 +125,56 @@ class BotTest(unittest.TestCase):
         test_without_timelimit_error()
         test_with_timelimit_error()
 
+
+class InProcessBotTest(unittest.TestCase):
+    def test_create_bot(self):
+        self.assertIsInstance(bot.create_bot('inprocess:test_game.py'),
+                              bot.InProcessBot)
+        self.assertIsInstance(bot.create_bot(PLAYER_COMMAND), bot.Bot)
+
+    def test_get_move(self):
+        ''' This test checks whether in-process bot's IO is working '''
+        def serialize(player_state, stream):
+            stream.write(player_state)
+            stream.flush()
+
+        def deserialize(stream):
+            return stream.readline()
+
+        test_bot = bot.create_bot('inprocess:test_game.py')
+        test_bot.create_process()
+        move = test_bot.get_move(b'abc\n', serialize, deserialize)
+        self.assertEqual(move, b'abc\n')
+        test_bot.kill_process()
+        with self.assertRaises(bot.ProcessNotRunningException):
+            test_bot.get_move(b'abc\n', serialize, deserialize)
+
+    def test_bot_modules(self):
+        ''' In-process bot imports modules from its directory '''
+        from move import deserialize_start, deserialize_move
+        from player_state import IncrementalPlayerState, \
+            serialize_field_side, serialize_incremental_pstate
+        test_bot = bot.create_bot('inprocess:games/pepelac/bots/stand.py')
+        test_bot.create_process()
+        test_bot.get_move(10, serialize_field_side, deserialize_start)
+        for is_full in (True, False):
+            player_state = IncrementalPlayerState(is_full)
+            player_state.explosion_time = 5
+            player_state.players = [(1, 2, 3, 0)]
+            self.assertEqual(test_bot.get_move(
+                player_state, serialize_incremental_pstate,
+                deserialize_move), (0, 0))
+        test_bot.kill_process()
+
+    def test_waiting_bot_is_abstract(self):
+        with self.assertRaises(TypeError):
+            bot.WaitingBot(PLAYER_COMMAND)
+
+    def test_wrong_path(self):
+        test_bot = bot.create_bot('inprocess:no_such_bot.py')
+        with self.assertRaises(bot.ExecuteError):
+            test_bot.create_process()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,155 @@
+'''
+Live stream of tournament events for dashboards and the website.
+
+Every event is one JSON object per line with fields `event` (its type),
+`time` (unix time) and fields of the event:
+    game_scheduled - signature, players
+    game_started - signature, players
+    tick - signature, tick
+    bot_time_limit - signature, player
+    game_finished - signature, scores, ticks, adjudicated; games taken
+        from the result cache or from results of the previous runs of
+        incremental tournament have `cached` or `reused` set instead
+        of ticks and adjudicated
+    round_finished - tournament_id, round_id, games
+
+Tournament opens the stream, events are written to the file
+`events_file` and/or sent to the Unix socket `events_socket` (a dashboard
+listens on it) from game config.
+The referee only puts events to a bounded queue, writing is done by a
+background thread; if the queue is full, events are dropped.
+
+Example:
+    {"event": "tick", "time": 1468000000.0, "signature": [1, 0, 2, 0],
+     "tick": 15}
+'''
+import json
+import queue
+import socket
+import threading
+import time
+from log import logger
+
+QUEUE_SIZE = 100000
+
+
+class EventStream:
+    '''
+    Usage:
+        >> stream = EventStream(path='logs/events.jsonl')
+        >> stream.emit('tick', signature=[1, 0, 2, 0], tick=15)
+        >> stream.close()  # writes the rest of events
+    '''
+    def __init__(self, path=None, socket_path=None, queue_size=QUEUE_SIZE):
+        self._queue = queue.Queue(queue_size)
+        self._file = open(path, 'a') if path is not None else None
+        self._socket = None
+        if socket_path is not None:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                self._socket.connect(socket_path)
+            except OSError as exception:
+                logger.warning('can\'t connect to events socket %s: %s',
+                               socket_path, exception)
+                self._socket.close()
+                self._socket = None
+        self.dropped_count = 0
+        self._thread = threading.Thread(target=self._write, daemon=True)
+        self._thread.start()
+
+    def emit(self, event, **fields):
+        '''
+        Queues the event, never blocks.
+        '''
+        fields['event'] = event
+        fields['time'] = time.time()
+        try:
+            self._queue.put_nowait(fields)
+        except queue.Full:
+            self.dropped_count += 1
+
+    def _write(self):
+        '''
+        Writes queued events until None is taken from the queue.
+        '''
+        while True:
+            events = [self._queue.get()]
+            # Writes everything which is queued at once
+            while events[-1] is not None and not self._queue.empty():
+                events.append(self._queue.get())
+            finished = events[-1] is None
+            if finished:
+                events.pop()
+            data = ''.join(json.dumps(event, default=str) + '\n'
+                           for event in events)
+            self._send(data)
+            if finished:
+                return
+
+    def _send(self, data):
+        if self._file is not None:
+            self._file.write(data)
+            self._file.flush()
+        if self._socket is not None:
+            try:
+                self._socket.sendall(data.encode())
+            except OSError as exception:
+                logger.warning('events socket is closed: %s', exception)
+                self._socket.close()
+                self._socket = None
+
+    def close(self):
+        '''
+        Writes queued events and closes the stream.
+        '''
+        self._queue.put(None)
+        self._thread.join()
+        if self._file is not None:
+            self._file.close()
+        if self._socket is not None:
+            self._socket.close()
+        if self.dropped_count:
+            logger.warning('%d events were dropped', self.dropped_count)
+
+
+_stream = None
+_stream_lock = threading.Lock()
+
+
+def open_stream(path=None, socket_path=None):
+    '''
+    Opens the stream of the tournament, events emitted before it
+    is opened are ignored.
+    '''
+    global _stream
+    with _stream_lock:
+        if _stream is None and (path is not None or socket_path is not None):
+            _stream = EventStream(path, socket_path)
+
+
+def emit(event, signature=None, **fields):
+    '''
+    Emits the event to the opened stream, if any.
+    `signature` (GameSignature) is written as list of ids.
+    '''
+    stream = _stream
+    if stream is None:
+        return
+    if signature is not None:
+        fields['signature'] = list(signature.get_key())
+    stream.emit(event, **fields)
+
+
+def is_open():
+    return _stream is not None
+
+
+def shutdown():
+    '''
+    Writes the rest of events and closes the stream.
+    '''
+    global _stream
+    with _stream_lock:
+        if _stream is not None:
+            _stream.close()
+            _stream = None
@@ -0,0 +1,88 @@
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+import event_stream
+from event_stream import EventStream
+from tournament_stages.game_signature import GameSignature
+
+
+def read_events(path):
+    with open(path) as events_file:
+        return [json.loads(line) for line in events_file]
+
+
+class EventStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'events.jsonl')
+
+    def tearDown(self):
+        event_stream.shutdown()
+        self.directory.cleanup()
+
+    def test_file(self):
+        stream = EventStream(self.path)
+        for tick in range(1, 4):
+            stream.emit('tick', signature=[1, 0, 2, 0], tick=tick)
+        stream.close()
+        events = read_events(self.path)
+        self.assertEqual([event['tick'] for event in events], [1, 2, 3])
+        self.assertEqual(events[0]['event'], 'tick')
+        self.assertEqual(events[0]['signature'], [1, 0, 2, 0])
+        self.assertIn('time', events[0])
+
+    def test_full_queue(self):
+        stream = EventStream(self.path, queue_size=1)
+        for tick in range(1000):
+            stream.emit('tick', tick=tick)
+        stream.close()
+        self.assertEqual(len(read_events(self.path)) + stream.dropped_count,
+                         1000)
+
+    def test_socket(self):
+        socket_path = os.path.join(self.directory.name, 'events.sock')
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen(1)
+        received = []
+
+        def accept():
+            connection, _ = server.accept()
+            with connection:
+                while True:
+                    data = connection.recv(4096)
+                    if not data:
+                        break
+                    received.append(data)
+
+        thread = threading.Thread(target=accept)
+        thread.start()
+        stream = EventStream(socket_path=socket_path)
+        stream.emit('round_finished', round_id=0, games=4)
+        stream.close()
+        thread.join()
+        server.close()
+        event = json.loads(b''.join(received).decode())
+        self.assertEqual(event['event'], 'round_finished')
+        self.assertEqual(event['games'], 4)
+
+    def test_module_stream(self):
+        event_stream.emit('tick', tick=1)
+        self.assertFalse(event_stream.is_open())
+        event_stream.open_stream(self.path)
+        self.assertTrue(event_stream.is_open())
+        event_stream.emit('game_started', GameSignature(1, 0, 2, 0),
+                          players=['first', 'second'])
+        event_stream.shutdown()
+        self.assertFalse(event_stream.is_open())
+        events = read_events(self.path)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['signature'], [1, 0, 2, 0])
+        self.assertEqual(events[0]['players'], ['first', 'second'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,27 @@ class GameNotFinishedException(Exception):
     pass
 
 
+class GameTimeLimitException(BaseException):
+    '''
+    This exception is raised by get_move of the simulator when the game
+    exceeded `max_game_seconds`, it unwinds the tick of the game master.
+    Game masters catch Exception on errors of bots, so it derives
+    from BaseException.
+    '''
+    pass
+
+
+def get_adjudicated_scores(game_master, jury_state, players):
+    '''
+    Returns scores of the game stopped by a cap: computed by
+    `game_master.adjudicate(jury_state)` if the game master has such
+    a method, otherwise every player gets 0.
+    '''
+    if hasattr(game_master, 'adjudicate'):
+        return game_master.adjudicate(jury_state)
+    return dict.fromkeys(players, 0)
+
+
 class GameController:
     '''
     GameController is a class, which controls game manager.
@@ -28,6 +49,16 @@ class GameController:
         self.signature = signature
         self.jury_states = [jury_state]
         self.is_finished = False
+        self.is_adjudicated = False
+        self.forfeited_players = []
+        self.resource_usage = {}
+        # Number of ticks played and raw replies of bots
+        # (if `record_replies` is set in game config)
+        self.ticks = 0
+        self.replies = None
+        # Number of recorded replies when the game was stopped by
+        # `max_game_seconds` inside a tick
+        self.interrupted_reply = None
         self.simulator = _simulator
 
     def __getstate__(self):
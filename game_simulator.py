@@ -1,7 +1,11 @@
-from game_controller import GameController
+from game_controller import GameController, GameTimeLimitException, \
+    get_adjudicated_scores
+from replay_simulator import ReplyRecorder
 from log import logger
+import event_stream
 import config
 import bot
+import functools
 import copy
 import time
 import sys
@@ -17,15 +21,37 @@ class GameSimulator:
     # Getting class to Bot instance
     >> game_simulator.get_move(player, player_state, serializer, deserializer)
     '''
-    def __init__(self, players, start_state, game_signature):
+    def __init__(self, players, start_state, game_signature,
+                 bot_health=None, spawner=None):
         '''
         Constructor of class GameSimulator.
         Creates an object of the class, gets config, players list,
-        jury_state and game_signature
+        jury_state and game_signature.
+        `bot_health` is an optional BotHealthTracker: bots of quarantined
+        players aren't spawned and forfeit the game.
+        `spawner` is an optional BotSpawner which has already started
+        bots for this game.
+        If `record_replies` is set in game config, raw replies of bots
+        are stored in game controller's `replies` for ReplaySimulator.
         '''
         self._start_state = start_state
+        self._game_signature = game_signature
+        self._bot_health = bot_health
+        self._failed_players = set()
+        self._quarantined_players = set()
+        # Players whose bots crashed and whether the game was stopped
+        # by `max_game_seconds`, see is_reproducible
+        self._crashed_players = set()
+        self._is_time_cap_hit = False
+        self._spawner = spawner
         self._game_controller = GameController(players,
             game_signature, start_state, self)
+        self._recorder = None
+        # Start of the game, set when the game master starts ticking
+        self._start_time = None
+        if getattr(config, 'record_replies', False):
+            self._recorder = ReplyRecorder(players)
+            self._game_controller.replies = self._recorder.replies
 
     def _create_bots(self):
         '''
@@ -33,30 +59,130 @@ class GameSimulator:
         '''
         self.bots = {}
         for player in self._game_controller._players:
-            self.bots[player] = bot.Bot(player.command_line)
-            self.bots[player].create_process()
+            if (self._bot_health is not None and
+                    self._bot_health.is_quarantined(player)):
+                self._quarantined_players.add(player)
+                self._forfeit(player)
+                continue
+            try:
+                self.bots[player] = self._launch_bot(player)
+            except (bot.ExecuteError, bot.TimeLimitException):
+                if self._bot_health is None:
+                    raise
+                self._failed_players.add(player)
+                self._forfeit(player)
+                continue
             logger.debug('created bot \'%s\'', player.bot_name)
+        if self._spawner is not None:
+            self._spawner.release()
         logger.info('all bots created')
 
+    def _launch_bot(self, player):
+        '''
+        Returns running bot of `player`, takes it from the spawner
+        if bots were started in advance.
+        '''
+        if self._spawner is not None:
+            return self._spawner.take(player)
+        new_bot = bot.create_bot(player.command_line)
+        new_bot.create_process()
+        new_bot.wait_ready()
+        return new_bot
+
+    def _forfeit(self, player):
+        '''
+        Replaces bot of `player` with a ForfeitedBot
+        and records the forfeit.
+        '''
+        self.bots[player] = bot.ForfeitedBot(player.command_line)
+        self.bots[player].create_process()
+        self._game_controller.forfeited_players.append(player)
+        self._bot_health.add_forfeit(self._game_signature, player)
+        logger.info('bot \'%s\' forfeits the game', player.bot_name)
+
+    def _report_bots_health(self):
+        '''
+        Reports outcome of the game for every spawned bot
+        to the health tracker.
+        '''
+        if self._bot_health is None:
+            return
+        for player in self._game_controller._players:
+            if player not in self._quarantined_players:
+                self._bot_health.add_game_outcome(
+                    player, player in self._failed_players)
+
     def get_move(self, player, player_state, serializer, deserializer):
         '''
-        Gets move to Bot instance
+        Gets move to Bot instance. Raises GameTimeLimitException if the
+        game exceeded `max_game_seconds`, so games played in one tick
+        are stopped too.
+        '''
+        if (self._start_time is not None and
+                self._is_time_cap_reached(self._start_time)):
+            raise GameTimeLimitException()
+        if self._recorder is not None:
+            return self._get_recorded_move(player, player_state,
+                                           serializer, deserializer)
+        return self._get_move(player, player_state, serializer, deserializer)
+
+    def _get_recorded_move(self, player, player_state, serializer,
+                           deserializer):
+        '''
+        Gets move and records bot's reply
         '''
-        new_move = self.bots[player].get_move(player_state,
-                                              serializer, deserializer)
+        reply = self._recorder.start(player, deserializer)
+        try:
+            new_move = self._get_move(player, player_state, serializer,
+                                      reply.deserialize)
+        except Exception as exception:
+            self._recorder.finish(reply, exception)
+            raise
+        self._recorder.finish(reply)
+        return new_move
+
+    def _get_move(self, player, player_state, serializer, deserializer):
+        try:
+            new_move = self.bots[player].get_move(player_state,
+                                                  serializer, deserializer)
+        except (bot.ExecuteError, bot.TimeLimitException) as exception:
+            self._failed_players.add(player)
+            if isinstance(exception, bot.TimeLimitException):
+                event_stream.emit('bot_time_limit', self._game_signature,
+                                  player=str(player))
+            raise
+        except OSError:
+            # Bot's process died or closed its pipes
+            self._crashed_players.add(player)
+            raise
         logger.debug('bot \'%s\' made a move', player.bot_name)
-        print('.', end='')
-        sys.stdout.flush()
+        if not event_stream.is_open():
+            # Dashboards follow the event stream instead
+            print('.', end='')
+            sys.stdout.flush()
         return new_move
 
     def _kill_bots(self):
         '''
         Killes ALL running bots
         '''
-        for bot in self.bots.values():
-            bot.kill_process()
+        for player, bot in self.bots.items():
+            bot.kill_process(functools.partial(self._record_resource_usage,
+                                               player))
+        if self._spawner is not None:
+            self._spawner.release()
         logger.info('all bots killed')
 
+    def _record_resource_usage(self, player, exit_status, resource_usage):
+        '''
+        Stores exit status and resource usage of the bot of `player`
+        when its process is reaped.
+        '''
+        self._game_controller.resource_usage[player] = {
+            'exit_status': exit_status,
+            'resource_usage': resource_usage,
+        }
+
     def report_state(self, jury_state):
         '''
         Saves jury states to array
@@ -72,28 +198,93 @@ class GameSimulator:
         '''
         try:
             self._create_bots()
+            event_stream.emit('game_started', self._game_signature,
+                              players=[str(player)
+                                       for player in self.get_players()])
             start_time = time.time()
             #game_master = config.GameMaster(self._game_controller,
             #                                self._start_state)
             game_master = config.GameMaster(self, self._start_state)
+            self._start_time = start_time
+            ticks = 0
             while not self._game_controller.is_finished:
+                if self._is_cap_reached(ticks, start_time):
+                    self._adjudicate(game_master)
+                    break
                 copied_js =\
                            copy.deepcopy(self._game_controller.jury_states[-1])
                 try:
                     game_master.tick(copied_js)
+                except GameTimeLimitException:
+                    if self._recorder is not None:
+                        self._game_controller.interrupted_reply = \
+                            len(self._recorder.replies)
+                    self._adjudicate(game_master)
+                    break
                 except:
                     logger.critical('game master was raised an '
                                     'unhandled exception, aborting')
                     self._kill_bots()
                     logger.critical('re-raising game master\'s exception')
                     raise
+                ticks += 1
+                self._game_controller.ticks = ticks
+                event_stream.emit('tick', self._game_signature, tick=ticks)
             end_time = time.time()
             logger.info('time spent on the game: %f sec',
                         end_time - start_time)
+            event_stream.emit(
+                'game_finished', self._game_signature,
+                scores={str(player): score for player, score
+                        in self._game_controller.get_scores().items()},
+                ticks=ticks,
+                adjudicated=self._game_controller.is_adjudicated)
+            self._report_bots_health()
             return self._game_controller
         finally:
             self._kill_bots()
 
+    def _is_cap_reached(self, ticks, start_time):
+        '''
+        Checks whether the game exceeded `max_ticks` or `max_game_seconds`
+        from game config. Both options are optional.
+        '''
+        max_ticks = getattr(config, 'max_ticks', None)
+        if max_ticks is not None and ticks >= max_ticks:
+            logger.warning('game exceeded %d ticks', max_ticks)
+            return True
+        return self._is_time_cap_reached(start_time)
+
+    def _is_time_cap_reached(self, start_time):
+        max_game_seconds = getattr(config, 'max_game_seconds', None)
+        if (max_game_seconds is not None and
+                time.time() - start_time > max_game_seconds):
+            logger.warning('game exceeded %f sec', max_game_seconds)
+            self._is_time_cap_hit = True
+            return True
+        return False
+
+    def is_reproducible(self):
+        '''
+        Returns False if the outcome of the played game depends on the
+        environment: a bot exceeded time limit, crashed, couldn't start
+        or forfeited, or the game was stopped by `max_game_seconds`.
+        '''
+        return not (self._failed_players or self._crashed_players or
+                    self._game_controller.forfeited_players or
+                    self._is_time_cap_hit)
+
+    def _adjudicate(self, game_master):
+        '''
+        Finishes the game which was stopped by a cap with scores
+        of get_adjudicated_scores.
+        '''
+        jury_state = copy.deepcopy(self._game_controller.jury_states[-1])
+        self.finish_game(get_adjudicated_scores(game_master, jury_state,
+                                                self.get_players()))
+        self._game_controller.is_adjudicated = True
+        logger.info('game adjudicated')
+
     def get_players(self):
         '''
         Gets players list as an list of instances
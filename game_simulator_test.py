@@ -6,11 +6,13 @@ config_helpers.initialize_game_environment(GAME_PATH)
 import game_simulator
 import unittest
 import game_controller
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import os
 import player
 from games.pepelac import generator
 import subprocess
+import bot
+from bot_health import BotHealthTracker
 
 helloworld = '''
 int main()
@@ -51,7 +53,7 @@ class GameSimulatorTest(unittest.TestCase):
         else:
             config = [player.Player('./a.out') for i in range(2)]
         gen = generator.Generator()
-        start_state = next(gen.generate_start_positions(' ', 2))
+        start_state = next(gen.generate_start_positions(None, 2))
         eng = game_simulator.GameSimulator(config, start_state, '')
         result = eng.play()
         game_master.tick.assert_called_once()
@@ -60,6 +62,74 @@ class GameSimulatorTest(unittest.TestCase):
         answer.is_finished = True
         self.assertEqual(answer.is_finished, result.is_finished)
 
+    def test_max_ticks(self):
+        game_master = Mock()
+        game_master.adjudicate.return_value = {'winner': 1}
+        if os.name == 'nt':
+            config = [player.Player('a.exe') for i in range(2)]
+        else:
+            config = [player.Player('./a.out') for i in range(2)]
+        gen = generator.Generator()
+        start_state = next(gen.generate_start_positions(None, 2))
+        eng = game_simulator.GameSimulator(config, start_state, '')
+        with patch.object(game_simulator.config, 'GameMaster',
+                          return_value=game_master), \
+                patch.object(game_simulator.config, 'max_ticks', 3,
+                             create=True):
+            result = eng.play()
+        self.assertEqual(game_master.tick.call_count, 3)
+        self.assertTrue(result.is_finished)
+        self.assertTrue(result.is_adjudicated)
+        self.assertEqual(result.get_scores(), {'winner': 1})
+        self.assertTrue(eng.is_reproducible())
+
+    def test_max_game_seconds_in_tick(self):
+        def game_side_effect(jury_state):
+            # The whole game in one tick, errors of bots are ignored
+            while True:
+                try:
+                    eng.get_move(config[0], None, None, None)
+                except Exception:
+                    pass
+        game_master = Mock()
+        game_master.tick.side_effect = game_side_effect
+        game_master.adjudicate.return_value = {'winner': 1}
+        config = [player.Player('./a.out') for i in range(2)]
+        gen = generator.Generator()
+        start_state = next(gen.generate_start_positions(None, 2))
+        eng = game_simulator.GameSimulator(config, start_state, '')
+        with patch.object(game_simulator.config, 'GameMaster',
+                          return_value=game_master), \
+                patch.object(game_simulator.config, 'max_game_seconds', 0.1,
+                             create=True), \
+                patch.object(eng, '_get_move', return_value=(0, 0)):
+            result = eng.play()
+        game_master.tick.assert_called_once()
+        self.assertTrue(result.is_adjudicated)
+        self.assertEqual(result.get_scores(), {'winner': 1})
+        self.assertFalse(eng.is_reproducible())
+
+    def test_quarantined_bot_forfeits(self):
+        def game_side_effect(jury_state):
+            with self.assertRaises(bot.ExecuteError):
+                eng.get_move(config[0], None, None, None)
+            eng.finish_game({})
+        game_master = Mock()
+        game_master.tick.side_effect = game_side_effect
+        config = [player.Player('./quarantined'), player.Player('./a.out')]
+        health = BotHealthTracker(1)
+        health.add_game_outcome(config[0], failed=True)
+        gen = generator.Generator()
+        start_state = next(gen.generate_start_positions(None, 2))
+        eng = game_simulator.GameSimulator(config, start_state, '', health)
+        with patch.object(game_simulator.config, 'GameMaster',
+                          return_value=game_master):
+            result = eng.play()
+        self.assertEqual(result.forfeited_players, [config[0]])
+        self.assertFalse(eng.is_reproducible())
+        self.assertEqual(len(health.get_forfeits()), 1)
+        self.assertFalse(health.is_quarantined(config[1]))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,161 @@
+'''
+Vectorized batch engine for nim: plays many games at once on NumPy
+arrays of heap sizes with in-process strategies, so strategies can be
+evaluated on millions of games without bots' processes.
+
+Strategy is a callable `strategy(heap_sizes, rng)`, where `heap_sizes`
+is an int array of shape (games, heaps) of the games in which it is the
+strategy's turn, and `rng` is numpy.random.Generator. It returns two int
+arrays of shape (games,): numbers of heaps and numbers of removed stones.
+
+Usage:
+    >> simulator = BatchSimulator([ideal_strategy, random_strategy])
+    >> result = simulator.play(100000)
+    >> result.win_rates()
+    [1.0, 0.0]
+'''
+import numpy as np
+from generator import Generator
+
+
+def generate_heap_sizes(games_count, rng):
+    '''
+    Returns heap sizes of `games_count` start positions distributed
+    like the ones of Generator.
+    '''
+    return rng.integers(1, Generator._max_stones_count + 1,
+                        size=(games_count, Generator._heaps_count))
+
+
+def is_valid_move(heap_sizes, heap_numbers, removed_stones):
+    '''
+    Vectorized GameMaster._is_valid_move, returns bool array.
+    '''
+    valid = (heap_numbers >= 0) & (heap_numbers < heap_sizes.shape[1])
+    sizes = np.take_along_axis(
+        heap_sizes, np.where(valid, heap_numbers, 0)[:, None], axis=1
+    )[:, 0]
+    return valid & (removed_stones >= 1) & (removed_stones <= sizes)
+
+
+def random_strategy(heap_sizes, rng):
+    '''
+    Port of bots/random_bot.py: removes random number of stones
+    from random non-empty heap.
+    '''
+    weights = rng.random(heap_sizes.shape)
+    weights[heap_sizes == 0] = -1
+    heap_numbers = weights.argmax(axis=1)
+    sizes = heap_sizes[np.arange(len(heap_sizes)), heap_numbers]
+    removed_stones = (rng.random(len(sizes)) * sizes).astype(int) + 1
+    return heap_numbers, removed_stones
+
+
+def ideal_strategy(heap_sizes, rng):
+    '''
+    Port of bots/ideal_bot.py: makes xor of heap sizes zero if it
+    is possible, otherwise makes random move.
+    '''
+    global_xor = np.bitwise_xor.reduce(heap_sizes, axis=1)
+    new_sizes = heap_sizes ^ global_xor[:, None]
+    # The first heap which can be reduced to make xor zero
+    heap_numbers = (new_sizes < heap_sizes).argmax(axis=1)
+    rows = np.arange(len(heap_sizes))
+    removed_stones = heap_sizes[rows, heap_numbers] - \
+        new_sizes[rows, heap_numbers]
+    losing = global_xor == 0
+    if losing.any():
+        random_heaps, random_removed = random_strategy(heap_sizes[losing],
+                                                       rng)
+        heap_numbers[losing] = random_heaps
+        removed_stones[losing] = random_removed
+    return heap_numbers, removed_stones
+
+
+class BatchResult:
+    '''
+    Aggregate results of the games played by BatchSimulator.
+    wins[i] - number of games won by strategy i
+    invalid_moves[i] - number of games lost by strategy i
+    because of the invalid move
+    moves_count - total number of moves in all games
+    '''
+    def __init__(self, games_count, wins, invalid_moves, moves_count):
+        self.games_count = games_count
+        self.wins = wins
+        self.invalid_moves = invalid_moves
+        self.moves_count = moves_count
+
+    def win_rates(self):
+        return [wins / self.games_count for wins in self.wins]
+
+    def __repr__(self):
+        return ('BatchResult(games_count={0}, wins={1}, invalid_moves={2}, '
+                'moves_count={3})'.format(self.games_count, self.wins,
+                                          self.invalid_moves,
+                                          self.moves_count))
+
+
+class BatchSimulator:
+    '''
+    Plays games of two strategies by the rules of GameMaster:
+    the first strategy moves first, the player who can't move
+    or makes invalid move loses.
+    '''
+    def __init__(self, strategies, seed=None):
+        if len(strategies) != 2:
+            raise ValueError('Number of strategies should be equal to 2')
+        self._strategies = strategies
+        self._rng = np.random.default_rng(seed)
+
+    def play(self, games_count=None, heap_sizes=None):
+        '''
+        Plays games from `heap_sizes` (array of shape (games, heaps))
+        or from `games_count` generated start positions.
+        Returns BatchResult.
+        '''
+        if heap_sizes is None:
+            heap_sizes = generate_heap_sizes(games_count, self._rng)
+        heap_sizes = np.array(heap_sizes, dtype=np.int64)
+        games_count = len(heap_sizes)
+        # Number of the player who lost every game, -1 while it goes on
+        losers = np.full(games_count, -1)
+        invalid_moves = [0, 0]
+        games = np.flatnonzero(heap_sizes.sum(axis=1) == 0)
+        losers[games] = 0
+        games = np.flatnonzero(losers == -1)
+        heap_sizes = heap_sizes[games]
+        moves_count = 0
+        turn = 0
+        while len(games):
+            heap_numbers, removed_stones = self._strategies[turn](
+                heap_sizes.copy(), self._rng
+            )
+            heap_numbers = np.asarray(heap_numbers)
+            removed_stones = np.asarray(removed_stones)
+            valid = is_valid_move(heap_sizes, heap_numbers, removed_stones)
+            invalid_moves[turn] += int((~valid).sum())
+            losers[games[~valid]] = turn
+            moves_count += int(valid.sum())
+
+            games = games[valid]
+            heap_sizes = heap_sizes[valid]
+            heap_sizes[np.arange(len(games)), heap_numbers[valid]] -= \
+                removed_stones[valid]
+            finished = heap_sizes.sum(axis=1) == 0
+            turn = 1 - turn
+            losers[games[finished]] = turn
+            games = games[~finished]
+            heap_sizes = heap_sizes[~finished]
+
+        wins = [int((losers == 1).sum()), int((losers == 0).sum())]
+        return BatchResult(games_count, wins, invalid_moves, moves_count)
+
+
+if __name__ == '__main__':
+    import time
+    start_time = time.time()
+    result = BatchSimulator([ideal_strategy, random_strategy]).play(100000)
+    print(result)
+    print('win rates: {0}, {1:.2f} sec'.format(result.win_rates(),
+                                              time.time() - start_time))
@@ -0,0 +1,66 @@
+import unittest
+from functools import reduce
+from operator import xor
+from unittest.mock import Mock
+import numpy as np
+from batch_simulator import *
+from game_master import GameMaster
+from jury_state import JuryState
+
+
+class BatchSimulatorTest(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(1)
+
+    def test_is_valid_move(self):
+        simulator = Mock()
+        simulator.get_players.return_value = [Mock(), Mock()]
+        master = GameMaster(simulator, None)
+        heap_sizes = np.array([[0, 3, 5]] * 16)
+        heap_numbers = np.array([-1, 0, 1, 2, 3] * 3 + [1])
+        removed_stones = np.array([1] * 5 + [0] * 5 + [5] * 5 + [3])
+        expected = [master._is_valid_move(JuryState(list(sizes)), move)
+                    for sizes, move in zip(heap_sizes,
+                                           zip(heap_numbers, removed_stones))]
+        self.assertEqual(list(is_valid_move(heap_sizes, heap_numbers,
+                                            removed_stones)), expected)
+
+    def test_strategies(self):
+        heap_sizes = generate_heap_sizes(1000, self.rng)
+        for strategy in (random_strategy, ideal_strategy):
+            moves = strategy(heap_sizes, self.rng)
+            self.assertTrue(is_valid_move(heap_sizes, *moves).all())
+        heap_numbers, removed_stones = ideal_strategy(heap_sizes, self.rng)
+        for sizes, heap, removed in zip(heap_sizes, heap_numbers,
+                                        removed_stones):
+            if reduce(xor, sizes) != 0:
+                sizes = list(sizes)
+                sizes[heap] -= removed
+                self.assertEqual(reduce(xor, sizes), 0)
+
+    def test_play(self):
+        simulator = BatchSimulator([ideal_strategy, random_strategy], seed=1)
+        result = simulator.play(heap_sizes=[[1, 2], [3, 3], [0, 0]])
+        # The second game starts from zero xor, the last one is lost
+        # by the first player who can't move
+        self.assertEqual(result.games_count, 3)
+        self.assertEqual(result.wins[0] + result.wins[1], 3)
+        self.assertGreaterEqual(result.wins[1], 1)
+        self.assertEqual(result.invalid_moves, [0, 0])
+
+        result = simulator.play(1000)
+        self.assertEqual(sum(result.wins), 1000)
+        self.assertGreater(result.win_rates()[0], 0.9)
+
+    def test_invalid_move(self):
+        def wrong_strategy(heap_sizes, rng):
+            return (np.zeros(len(heap_sizes), dtype=int),
+                    np.full(len(heap_sizes), 1000))
+
+        simulator = BatchSimulator([random_strategy, wrong_strategy])
+        result = simulator.play(heap_sizes=[[5, 5], [1, 0]])
+        self.assertEqual(result.wins, [2, 0])
+        self.assertEqual(result.invalid_moves, [0, 1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+# Ideal bot speaking multiplexed protocol (see multiplexed_bot.py):
+# every line starts with the id of the game.
+
+import sys
+import random
+import operator
+from functools import reduce
+
+
+def get_move(heap_sizes):
+    global_xor = reduce(operator.xor, heap_sizes)
+    if global_xor != 0:
+        for heap_number, size in enumerate(heap_sizes):
+            new_size = global_xor ^ size
+            if size > new_size:
+                return heap_number, size - new_size
+    # Random move
+    allowed = [i for i, size in enumerate(heap_sizes) if size > 0]
+    heap_number = random.choice(allowed)
+    return heap_number, random.randint(1, heap_sizes[heap_number])
+
+
+for line in sys.stdin:
+    game_id, representation = line.split(' ', 1)
+    if representation.strip() == 'END':
+        continue
+    heap_sizes = [int(n) for n in representation.split(' ')]
+    print(game_id, *get_move(heap_sizes))
+    sys.stdout.flush()
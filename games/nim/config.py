@@ -15,4 +15,26 @@ cpu_time_limit_seconds = 10.0
 time_limit_count_of_moves = 50
 memory_limit_mb = 15.0
 
+# Bot which failed to start or exceeded time limit in this number
+# of games in a row forfeits the rest of the tournament, None never
+# quarantines bots
+max_consecutive_failures = None
+
+# Start bots of the next game while the current game runs
+prespawn_bots = False
+
+# Play up to this number of series of a round at once, each in its own
+# thread (see Round._run_concurrently); bots aren't pre-spawned then
+# concurrent_games = 4
+
+# Take results of the games which were already played by the same bots
+# from the same start state from the cache (see result_cache.py), only
+# for deterministic bots like ideal_bot and idle_bot
+cache_results = False
+
 tournament_system = 'olympic'
+
+# Write live events of the tournament (see event_stream.py) as JSON lines
+# to the file `events_file` and/or to the Unix socket `events_socket`
+events_file = None
+events_socket = None
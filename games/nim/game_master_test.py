@@ -9,7 +9,7 @@ class GameMasterTests(unittest.TestCase):
     def setUp(self):
         players = [Mock(name='player 0'), Mock(name='player 1')]
         generator = Generator()
-        start_states = list(generator.generate_start_positions(Mock(),
+        start_states = list(generator.generate_start_positions(None,
                                                                len(players)))
         self._start_state = random.choice(start_states)
         self._controller = self._get_controller(players)
@@ -8,9 +8,16 @@ class Generator:
     _heaps_count = 15
 
     def generate_start_positions(self, game_signature, players_count):
-        '''Generates a list of start positions (Jury states)'''
+        '''
+        Generates a list of start positions (Jury states), seeded by
+        the round of `game_signature` (random without signature).
+        '''
+        if game_signature is None:
+            rng = random.Random()
+        else:
+            rng = random.Random(game_signature.get_seed())
         for game in range(self._games_count):
             heap_sizes = []
             for heap in range(self._heaps_count):
-                heap_sizes.append(random.randint(1, self._max_stones_count))
+                heap_sizes.append(rng.randint(1, self._max_stones_count))
             yield JuryState(heap_sizes)
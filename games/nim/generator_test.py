@@ -27,5 +27,15 @@ class GeneratorTests(unittest.TestCase):
                     self.assertTrue(1 <= heap_size <=
                                     generator_state._max_stones_sizes)
 
+    def test_seeded_positions(self):
+        signature = Mock()
+        signature.get_seed.return_value = 42
+        positions = [
+            [js.heap_sizes for js in Generator().generate_start_positions(
+                signature, 2)]
+            for attempt in range(2)
+        ]
+        self.assertEqual(positions[0], positions[1])
+
 if __name__ == '__main__':
     unittest.main()
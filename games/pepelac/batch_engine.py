@@ -0,0 +1,247 @@
+'''
+Batched rules engine for pepelac: advances many independent boards in
+lockstep on NumPy arrays, for fast evaluation of in-process strategies
+and regression testing of rule changes. The rules are the ones of
+GameMaster: players move in turn, pick up bullets, fight with adjacent
+players, and after the explosion time one cell per tick explodes along
+the spiral of GameMaster._explode_cell.
+
+Strategy is a callable `strategy(view, rng)`, where `view` is BoardsView
+of the boards in which it is the strategy's turn and `rng` is
+numpy.random.Generator. It returns int array of move codes (STAND, RIGHT,
+LEFT, DOWN, UP) of shape (boards,), any other code is a presentation
+error.
+
+Usage:
+    >> states = list(Generator().generate_start_positions(None, 2))
+    >> engine = BatchEngine(states * 1000, [random_strategy, stand_strategy])
+    >> engine.run()
+    >> engine.win_rates()
+    [0.9, 0.05]
+'''
+import numpy as np
+from game_master import EMPTY, BULLET, EXPLODED, MOVES
+
+STAND, RIGHT, LEFT, DOWN, UP = range(5)
+# Deltas of move codes, in the order of move.deserialize_move
+MOVE_DELTAS = np.array([(0, 0), (0, 1), (0, -1), (1, 0), (-1, 0)])
+
+# Reasons of death, see JuryState
+INCORRECT_MOVE = -1
+ARMAGEDDON = 0
+SHOT = 1
+
+
+def explosion_spiral(side):
+    '''
+    Returns array of cells in the order they are exploded
+    by GameMaster._explode_cell on the field without exploded cells.
+    '''
+    exploded = np.zeros((side, side), dtype=bool)
+    cells = [(0, 0)]
+    exploded[0, 0] = True
+    direction = 1
+    for _ in range(side * side - 1):
+        row, col = cells[-1]
+        while True:
+            new_row = row + MOVES[direction][0]
+            new_col = col + MOVES[direction][1]
+            if (0 <= new_row < side and 0 <= new_col < side and
+                    not exploded[new_row, new_col]):
+                break
+            direction = (direction + 1) % len(MOVES)
+        cells.append((new_row, new_col))
+        exploded[new_row, new_col] = True
+    return np.array(cells)
+
+
+class BoardsView:
+    '''
+    Part of the boards given to a strategy (arrays are copies):
+    field - (boards, side, side), cells like JuryState.field
+    positions - (boards, players, 2), 0-based positions of players
+    bullets - (boards, players)
+    alive - (boards, players) bool
+    explosion_time - (boards,), like PlayerState.explosion_time
+    boards - indexes of the boards in the engine
+    turn - index of the moving player
+    tick - number of the tick
+    '''
+    def __init__(self, engine, boards, turn):
+        self.field = engine.field[boards]
+        self.positions = engine.positions[boards]
+        self.bullets = engine.bullets[boards]
+        self.alive = engine.alive[boards]
+        self.explosion_time = engine.explosion_time[boards] + 1
+        self.boards = boards
+        self.turn = turn
+        self.tick = engine.ticks
+
+
+def stand_strategy(view, rng):
+    '''
+    Never moves.
+    '''
+    return np.full(len(view.boards), STAND)
+
+
+def random_strategy(view, rng):
+    '''
+    Makes random correct move: stays in the field, doesn't step
+    on exploded cells and other players.
+    '''
+    count, side = len(view.boards), view.field.shape[1]
+    targets = view.positions[:, view.turn, None, :] + MOVE_DELTAS[None]
+    inside = ((targets >= 0) & (targets < side)).all(axis=2)
+    clipped = np.clip(targets, 0, side - 1)
+    cells = view.field[np.arange(count)[:, None],
+                       clipped[..., 0], clipped[..., 1]]
+    correct = inside & ((cells == EMPTY) | (cells == BULLET))
+    correct[:, STAND] = True
+    weights = rng.random(correct.shape)
+    weights[~correct] = -1
+    return weights.argmax(axis=1)
+
+
+class BatchEngine:
+    '''
+    Plays games from `jury_states` (start states with the same field
+    side, like the ones of Generator) by `strategies`, one per player.
+    After `run` scores, alive players and reasons of death
+    are in `scores`, `alive` and `dead_reasons`.
+    '''
+    def __init__(self, jury_states, strategies, seed=None):
+        side = jury_states[0].field_side
+        if any(js.field_side != side for js in jury_states):
+            raise ValueError('All boards should have the same field side')
+        self._strategies = strategies
+        self._rng = np.random.default_rng(seed)
+        self._spiral = explosion_spiral(side)
+        self.side = side
+        self.players_count = len(strategies)
+        boards_count = len(jury_states)
+
+        self.field = np.array([[list(row) for row in js.field]
+                               for js in jury_states], dtype=np.int8)
+        self.bullets = np.array([js.bullets for js in jury_states],
+                                dtype=np.int64)
+        self.explosion_time = np.array(
+            [js.explosion_time for js in jury_states], dtype=np.int64
+        )
+        self.positions = np.zeros((boards_count, self.players_count, 2),
+                                  dtype=np.int64)
+        self.alive = np.zeros((boards_count, self.players_count), dtype=bool)
+        for player in range(self.players_count):
+            boards, rows, cols = np.nonzero(self.field == player + 1)
+            self.positions[boards, player] = np.stack([rows, cols], axis=1)
+            self.alive[boards, player] = True
+        self.dead_reasons = np.full((boards_count, self.players_count),
+                                    INCORRECT_MOVE, dtype=np.int8)
+        self.scores = np.zeros((boards_count, self.players_count),
+                               dtype=np.int64)
+        self.exploded_count = np.zeros(boards_count, dtype=np.int64)
+        self.finished = np.zeros(boards_count, dtype=bool)
+        self.ticks = 0
+
+    def run(self, max_ticks=None):
+        '''
+        Ticks until all games are finished or `max_ticks` is reached.
+        Returns scores.
+        '''
+        while not self.finished.all():
+            if max_ticks is not None and self.ticks >= max_ticks:
+                break
+            self.tick()
+        return self.scores
+
+    def win_rates(self):
+        '''
+        Returns share of the boards in which each player has
+        the only maximal score.
+        '''
+        best = self.scores.max(axis=1, keepdims=True)
+        only_best = (self.scores == best) & \
+            ((self.scores == best).sum(axis=1, keepdims=True) == 1)
+        return [float(rate) for rate in only_best.mean(axis=0)]
+
+    def tick(self):
+        '''
+        GameMaster.tick for all unfinished boards.
+        '''
+        self.explosion_time[~self.finished] -= 1
+        for turn in range(self.players_count):
+            self.finished |= ((self.exploded_count == self.side ** 2) |
+                              ~self.alive.any(axis=1))
+            boards = np.flatnonzero(~self.finished & self.alive[:, turn])
+            if len(boards):
+                self._move(turn, boards)
+
+        active = ~self.finished
+        self.scores[active] += self.alive[active]
+        self._explode(np.flatnonzero(active & (self.explosion_time < 0)))
+        self.ticks += 1
+
+    def _move(self, turn, boards):
+        codes = np.asarray(self._strategies[turn](
+            BoardsView(self, boards, turn), self._rng
+        ))
+        known = (codes >= 0) & (codes < len(MOVE_DELTAS))
+        old = self.positions[boards, turn]
+        new = old + MOVE_DELTAS[np.where(known, codes, STAND)]
+        inside = ((new >= 0) & (new < self.side)).all(axis=1)
+        clipped = np.clip(new, 0, self.side - 1)
+        cells = self.field[boards, clipped[:, 0], clipped[:, 1]]
+        correct = (known & inside & (cells != EXPLODED) &
+                   ((cells <= 0) | (cells == turn + 1)))
+        self._kill(boards[~correct], turn, INCORRECT_MOVE)
+
+        boards, old, new = boards[correct], old[correct], new[correct]
+        picked = self.field[boards, new[:, 0], new[:, 1]] == BULLET
+        self.bullets[boards[picked], turn] += 1
+        self.field[boards, old[:, 0], old[:, 1]] = EMPTY
+        self.field[boards, new[:, 0], new[:, 1]] = turn + 1
+        self.positions[boards, turn] = new
+
+        for move in MOVES:
+            boards_alive = self.alive[boards, turn]
+            neighbours = new[boards_alive] + move
+            fighting = boards[boards_alive]
+            inside = ((neighbours >= 0) & (neighbours < self.side)).all(axis=1)
+            fighting, neighbours = fighting[inside], neighbours[inside]
+            cells = self.field[fighting, neighbours[:, 0], neighbours[:, 1]]
+            self._fight(fighting[cells > 0], turn, cells[cells > 0] - 1)
+
+    def _fight(self, boards, player, others):
+        '''
+        GameMaster._fight of `player` and `others` on `boards`.
+        '''
+        bullets = self.bullets[boards, player]
+        others_bullets = self.bullets[boards, others]
+        fight = np.maximum(bullets, others_bullets) > 0
+        boards, others = boards[fight], others[fight]
+        delta = np.minimum(bullets, others_bullets)[fight]
+        self.bullets[boards, player] -= delta
+        self.bullets[boards, others] -= delta
+
+        empty = self.bullets[boards, player] == 0
+        others_empty = self.bullets[boards, others] == 0
+        self._kill(boards[empty & ~others_empty], player, SHOT)
+        killed = others_empty & ~empty
+        self._kill(boards[killed], others[killed], SHOT)
+
+    def _kill(self, boards, players, reason):
+        self.alive[boards, players] = False
+        self.dead_reasons[boards, players] = reason
+        positions = self.positions[boards, players]
+        self.field[boards, positions[:, 0], positions[:, 1]] = EMPTY
+
+    def _explode(self, boards):
+        '''
+        GameMaster._explode_cell on `boards`.
+        '''
+        cells = self._spiral[self.exploded_count[boards]]
+        players = self.field[boards, cells[:, 0], cells[:, 1]]
+        with_player = players > 0
+        self._kill(boards[with_player], players[with_player] - 1, ARMAGEDDON)
+        self.field[boards, cells[:, 0], cells[:, 1]] = EXPLODED
+        self.exploded_count[boards] += 1
@@ -0,0 +1,105 @@
+import copy
+import unittest
+from unittest.mock import Mock
+import numpy as np
+from batch_engine import *
+from game_master import GameMaster
+from generator import Generator
+from move import DeserializeMoveException
+from player_state import serialize_field_side
+
+
+class BatchEngineTest(unittest.TestCase):
+    def _generate_states(self, boards_count, players_count):
+        generator = Generator(field_size=13)
+        return [next(generator.generate_start_positions(None, players_count))
+                for board in range(boards_count)]
+
+    def _recording_strategy(self, moves, rng):
+        def strategy(view, strategy_rng):
+            codes = random_strategy(view, strategy_rng)
+            # Incorrect moves and presentation errors from time to time
+            wrong = rng.random(len(codes)) < 0.005
+            codes[wrong] = rng.integers(0, len(MOVE_DELTAS) + 1, wrong.sum())
+            for board, code in zip(view.boards, codes):
+                moves.setdefault((view.tick, view.turn, board), code)
+            return codes
+        return strategy
+
+    def _play_game_master(self, state, moves, board, players_count):
+        players = [Mock(name='player {0}'.format(i))
+                   for i in range(players_count)]
+        controller = Mock()
+        controller.get_players.return_value = players
+        ticks = [0]
+        scores = []
+
+        def get_move(player, ps, serialize, deserialize):
+            if serialize is serialize_field_side:
+                return None
+            code = moves[(ticks[0], players.index(player), board)]
+            if code >= len(MOVE_DELTAS):
+                raise DeserializeMoveException('Presentation error')
+            return tuple(int(x) for x in MOVE_DELTAS[code])
+
+        controller.get_move.side_effect = get_move
+        controller.finish_game.side_effect = scores.append
+        master = GameMaster(controller, state)
+        while not scores:
+            master.tick(state)
+            ticks[0] += 1
+        return players, state, scores[0]
+
+    def _check_against_game_master(self, boards_count, players_count):
+        states = self._generate_states(boards_count, players_count)
+        moves = {}
+        rng = np.random.default_rng(players_count)
+        engine = BatchEngine(
+            states, [self._recording_strategy(moves, rng)] * players_count,
+            seed=players_count
+        )
+        engine.run()
+        self.assertTrue(engine.finished.all())
+        for board, state in enumerate(states):
+            players, state, scores = self._play_game_master(
+                copy.deepcopy(state), moves, board, players_count
+            )
+            self.assertEqual([list(row) for row in state.field],
+                             engine.field[board].tolist())
+            self.assertEqual(state.bullets, engine.bullets[board].tolist())
+            self.assertEqual([scores[player] for player in players],
+                             engine.scores[board].tolist())
+            for player_id, player in enumerate(players):
+                self.assertEqual(player not in state.dead_players,
+                                 engine.alive[board, player_id])
+                if player in state.dead_players:
+                    reason = state.dead_reasons[player]
+                    if isinstance(reason, str):
+                        reason = INCORRECT_MOVE
+                    self.assertEqual(reason,
+                                     engine.dead_reasons[board, player_id])
+
+    def test_two_players(self):
+        self._check_against_game_master(20, 2)
+
+    def test_four_players(self):
+        self._check_against_game_master(20, 4)
+
+    def test_explosion_spiral(self):
+        self.assertEqual(explosion_spiral(3).tolist(), [
+            [0, 0], [0, 1], [0, 2], [1, 2], [2, 2],
+            [2, 1], [2, 0], [1, 0], [1, 1]
+        ])
+
+    def test_win_rates(self):
+        states = self._generate_states(50, 2)
+        engine = BatchEngine(states, [random_strategy, stand_strategy],
+                             seed=1)
+        engine.run(max_ticks=10)
+        self.assertEqual(engine.ticks, 10)
+        engine.run()
+        self.assertTrue(engine.finished.all())
+        self.assertLessEqual(sum(engine.win_rates()), 1)
+
+if __name__ == '__main__':
+    unittest.main()
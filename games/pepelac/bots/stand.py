@@ -1,6 +1,9 @@
 import sys
+from state_view import StateView
 
+view = StateView()
+input()
 while True:
-    input()
+    view.read(sys.stdin)
     print('STAND')
     sys.stdout.flush()
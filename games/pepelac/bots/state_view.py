@@ -0,0 +1,82 @@
+'''
+View of the game for Python bots, read from the player states sent by
+the referee. Both protocols are supported: the full one (default) and
+the incremental one (`incremental_player_state` in config), which is
+recognized by the FULL/DIFF header. With the incremental protocol the
+view is updated only by the changes since the previous move, so reading
+a state costs as much as the changes, not as the whole field.
+Usage:
+    >> view = StateView()
+    >> field_side = int(input())
+    >> while True:
+    >>     view.read(sys.stdin)
+    >>     view.players[view.my_id]  # (row, col, bullets) of the bot
+    >>     print('STAND')
+'''
+
+
+def _read_numbers(stream):
+    return tuple(map(int, stream.readline().split()))
+
+
+class StateView:
+    '''
+    players - {id: (row, col, bullets)} of living players
+    bullets - set of (row, col) of bullets
+    exploded - set of (row, col) of exploded cells (known only with
+    the incremental protocol)
+    my_id - id of the bot in `players`
+    Cells are 1-based as in the protocol.
+    '''
+    def __init__(self):
+        self.explosion_time = None
+        self.my_id = None
+        self.players = {}
+        self.bullets = set()
+        self.exploded = set()
+
+    def read(self, stream):
+        '''
+        Reads the next player state from text `stream`.
+        '''
+        header = stream.readline().split()
+        if header[0] in ('FULL', 'DIFF'):
+            self._read_incremental(header, stream)
+        else:
+            self._read_full(header, stream)
+
+    def _read_full(self, header, stream):
+        players_count, bullets_count, self.explosion_time = map(int, header)
+        self.my_id = 0
+        self.players = {player_id: _read_numbers(stream)[:3]
+                        for player_id in range(players_count)}
+        self.bullets = {_read_numbers(stream)[:2]
+                        for _ in range(bullets_count)}
+
+    def _read_incremental(self, header, stream):
+        (players_count, bullets_count, exploded_count,
+         dead_count) = map(int, header[2:])
+        is_full = header[0] == 'FULL'
+        self.explosion_time = int(header[1])
+        if is_full:
+            self.players = {}
+            self.exploded = set()
+            self.my_id = None
+        for _ in range(players_count):
+            player_id, row, col, bullets = _read_numbers(stream)
+            if self.my_id is None:
+                # Current player goes first in the full state
+                self.my_id = player_id
+            self.players[player_id] = (row, col, bullets)
+        bullets = {_read_numbers(stream) for _ in range(bullets_count)}
+        if is_full:
+            self.bullets = bullets
+        else:
+            # The diff lists picked up bullets
+            self.bullets -= bullets
+        for _ in range(exploded_count):
+            cell = _read_numbers(stream)
+            self.exploded.add(cell)
+            self.bullets.discard(cell)
+        for _ in range(dead_count):
+            self.players.pop(int(stream.readline()), None)
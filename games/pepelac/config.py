@@ -44,4 +44,54 @@ cpu_time_limit_seconds = 1.0
 time_limit_count_of_moves = 50
 memory_limit_mb = 15.0
 
+# The game is adjudicated by GameMaster.adjudicate when one of these is hit
+max_ticks = 1000
+max_game_seconds = 1800.0
+
+# Bot which failed to start or exceeded time limit in this number
+# of games in a row forfeits the rest of the tournament, None never
+# quarantines bots
+max_consecutive_failures = None
+
+# Play up to this number of series of a round at once, each in its own
+# thread (see Round._run_concurrently); bots aren't pre-spawned then
+# concurrent_games = 4
+
+# Store JuryState.field in one compact buffer (see Field in jury_state.py),
+# so snapshots and replays copy a single buffer instead of lists of ints
+compact_field = False
+
+# Send only changes of the field since the previous move of the player
+# (see IncrementalPlayerState in player_state.py) instead of the full field
+incremental_player_state = False
+
+# Start positions of every round are generated from this seed together
+# with tournament and round ids, None keeps them unique per tournament id
+random_seed = None
+
 tournament_system = 'olympic'
+
+# Record raw replies of bots and save them next to the game logs
+# (see replay_simulator.py), so the game can be re-simulated without bots
+record_replies = False
+
+# Stop the series as soon as its winner is known with this confidence
+# (see is_series_decided in tournament_stages/series.py), round-robin
+# counts points of its played games as of all games; None plays all
+# games; `max_series_games` limits number of games of a series
+series_confidence = None
+
+# Take results of the games which were already played by the same bots
+# from the same start state from the cache (see result_cache.py), only
+# for deterministic bots; `results_cache_max_entries` and
+# `results_cache_max_age_seconds` limit the cache
+cache_results = False
+
+# Keep results of the tournament in memory ('memory') or in SQLite
+# database `results_store_path` ('sqlite') for very large tournaments
+results_store = 'memory'
+
+# Write live events of the tournament (see event_stream.py) as JSON lines
+# to the file `events_file` and/or to the Unix socket `events_socket`
+events_file = None
+events_socket = None
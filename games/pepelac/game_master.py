@@ -1,5 +1,6 @@
 from player_state import *
 from move import *
+import config
 
 EMPTY = 0
 BULLET = -1
@@ -15,14 +16,27 @@ class GameMaster:
     def __init__(self, controller, start_state):
         self._controller = controller
         self._players = controller.get_players()
+        self._players_ids = {
+            player: player_id for player_id, player in enumerate(self._players)
+        }
         side = start_state.field_side
         self._number_of_correct_cells = side ** 2
         self._last_exploded_cell = (-1, -1)
         self._direction = 0
         self._scores = {}
         self._state = start_state
+        # Indexes of the field, kept up to date by every change of it,
+        # so views of the players are built without scanning the field
         self._players_poses = {}
-        self._calc_players_poses()
+        self._bullets_poses = set()
+        self._exploded_cells = set()
+        self._build_indexes()
+        # Changes of the game for the incremental protocol:
+        # ('player', id), ('bullet', pos), ('explode', pos), ('dead', id)
+        self._incremental = getattr(config, 'incremental_player_state',
+                                    False)
+        self._events = []
+        self._seen_events = {}
 
         for player in self._players:
             self._scores[player] = 0
@@ -41,7 +55,6 @@ class GameMaster:
 
     def tick(self, state):
         self._state = state
-        self._calc_players_poses()
         self._state.explosion_time -= 1
 
         for turn, cur_player in enumerate(self._players):
@@ -53,26 +66,18 @@ class GameMaster:
             if cur_player in self._state.dead_players:
                 continue
 
-            ps = PlayerState()
-            ps.explosion_time = self._state.explosion_time + 1
-
-            for i, row in enumerate(self._state.field):
-                for j, cell in enumerate(row):
-                    if cell == BULLET:
-                        ps.bullets.append((i + 1, j + 1))
-                    elif cell > 0:
-                        player_id = cell - 1
-                        player = (i + 1, j + 1, self._state.bullets[player_id])
-                        if player_id == turn:
-                            ps.current_player = player
-                        else:
-                            ps.players.append(player)
+            if self._incremental:
+                ps = self._get_incremental_pstate(turn, cur_player)
+                serialize = serialize_incremental_pstate
+            else:
+                ps = self._get_pstate(turn)
+                serialize = serialize_pstate
 
             old_row, old_col = old_pos = self._players_poses[cur_player]
             killed = True
             try:
                 move = self._controller.get_move(
-                    cur_player, ps, serialize_pstate, deserialize_move
+                    cur_player, ps, serialize, deserialize_move
                 )
 
                 if not self._is_correct_cell(old_pos, move):
@@ -94,6 +99,10 @@ class GameMaster:
 
             if cell == BULLET:
                 self._state.bullets[turn] += 1
+                self._bullets_poses.discard(new_pos)
+                self._add_event('bullet', new_pos)
+            if new_pos != old_pos or cell == BULLET:
+                self._add_event('player', turn)
 
             self._state.field[old_row][old_col] = EMPTY
             self._state.field[new_row][new_col] = turn + 1
@@ -119,11 +128,98 @@ class GameMaster:
 
         self._controller.report_state(self._state)
 
-    def _calc_players_poses(self):
+    def _get_pstate(self, turn):
+        '''
+        Returns full PlayerState for the player `turn`.
+        '''
+        ps = PlayerState()
+        ps.explosion_time = self._state.explosion_time + 1
+        ps.bullets = sorted((row + 1, col + 1)
+                            for row, col in self._bullets_poses)
+        for player_id, (row, col) in self._get_living_players():
+            player = (row + 1, col + 1, self._state.bullets[player_id])
+            if player_id == turn:
+                ps.current_player = player
+            else:
+                ps.players.append(player)
+        return ps
+
+    def _get_living_players(self):
+        '''
+        Returns list of (player_id, position) of living players
+        in the order of their positions.
+        '''
+        return sorted(
+            ((self._players_ids[player], pos)
+             for player, pos in self._players_poses.items()),
+            key=lambda player: player[1]
+        )
+
+    def _get_incremental_pstate(self, turn, player):
+        '''
+        Returns IncrementalPlayerState for the player `turn`: full one
+        for the first move, otherwise changes since the previous move.
+        '''
+        cursor = self._seen_events.get(player)
+        self._seen_events[player] = len(self._events)
+        ips = IncrementalPlayerState(is_full=cursor is None)
+        ips.explosion_time = self._state.explosion_time + 1
+        if cursor is None:
+            ips.bullets = self._get_pstate(turn).bullets
+            ips.exploded = sorted((row + 1, col + 1)
+                                  for row, col in self._exploded_cells)
+            for player_id, (row, col) in self._get_living_players():
+                ips.players.append((player_id + 1, row + 1, col + 1,
+                                    self._state.bullets[player_id]))
+            ips.players.sort(key=lambda player: player[0] != turn + 1)
+            return ips
+
+        changed = set()
+        for kind, value in self._events[cursor:]:
+            if kind == 'player':
+                changed.add(value)
+            elif kind == 'dead':
+                ips.dead.append(value + 1)
+            elif kind == 'bullet':
+                ips.bullets.append((value[0] + 1, value[1] + 1))
+            elif kind == 'explode':
+                ips.exploded.append((value[0] + 1, value[1] + 1))
+        for player_id in sorted(changed):
+            if self._players[player_id] not in self._players_poses:
+                continue
+            row, col = self._players_poses[self._players[player_id]]
+            ips.players.append((player_id + 1, row + 1, col + 1,
+                                self._state.bullets[player_id]))
+        return ips
+
+    def _add_event(self, kind, value):
+        '''
+        Records the change for the incremental protocol.
+        '''
+        if self._incremental:
+            self._events.append((kind, value))
+
+    def adjudicate(self, state):
+        '''
+        Called by the simulator when the game was stopped by
+        `max_ticks` or `max_game_seconds`. Every player is scored by
+        the number of ticks survived so far.
+        '''
+        return dict(self._scores)
+
+    def _build_indexes(self):
+        '''
+        Scans the field once to fill positions of living players,
+        bullets and exploded cells.
+        '''
         for i, row in enumerate(self._state.field):
             for j, cell in enumerate(row):
                 if cell > 0:
                     self._players_poses[self._players[cell - 1]] = (i, j)
+                elif cell == BULLET:
+                    self._bullets_poses.add((i, j))
+                elif cell == EXPLODED:
+                    self._exploded_cells.add((i, j))
 
     def _make_move(self, position, move):
         return tuple(x + dx for x, dx in zip(position, move))
@@ -153,6 +249,9 @@ class GameMaster:
             self._kill_player(self._players[cell - 1], 0)
 
         self._state.field[new_pos[0]][new_pos[1]] = EXPLODED
+        self._bullets_poses.discard(new_pos)
+        self._exploded_cells.add(new_pos)
+        self._add_event('explode', new_pos)
         self._last_exploded_cell = new_pos
         self._direction = direction
         self._number_of_correct_cells -= 1
@@ -177,6 +276,7 @@ class GameMaster:
         kill = False
         for player_id in players:
             self._state.bullets[player_id] -= delta
+            self._add_event('player', player_id)
             if self._state.bullets[player_id] == 0:
                 kill = not kill
                 kill_player_id = player_id
@@ -187,5 +287,7 @@ class GameMaster:
     def _kill_player(self, player, reason):
         self._state.dead_players.append(player)
         self._state.dead_reasons[player] = reason
-        pos = self._players_poses[player]
-        self._state.field[pos[0]][pos[1]] = EMPTY
+        self._add_event('dead', self._players_ids[player])
+        pos = self._players_poses.pop(player, None)
+        if pos is not None:
+            self._state.field[pos[0]][pos[1]] = EMPTY
@@ -1,7 +1,7 @@
 import random
 import unittest
 from unittest.mock import Mock
-from game_master import GameMaster
+from game_master import GameMaster, BULLET, EXPLODED
 from generator import Generator
 
 
@@ -10,7 +10,7 @@ class GameMasterTests(unittest.TestCase):
         players = [Mock(name='player 0'), Mock(name='player 1')]
         generator = Generator()
         start_states = list(
-            generator.generate_start_positions(Mock(), len(players))
+            generator.generate_start_positions(None, len(players))
         )
         self._start_state = random.choice(start_states)
         self._simulator = self._get_simulator(players)
@@ -32,6 +32,64 @@ class GameMasterTests(unittest.TestCase):
 #        self.assertEqual(set(players), set(scores.keys()))
 #        print(scores)
 
+    def test_incremental_player_state(self):
+        players = self._simulator.get_players()
+        known = {player: None for player in players}
+
+        def get_move(player, ps, serialize, deserialize):
+            turn = players.index(player)
+            self.assertEqual(ps.is_full, known[player] is None)
+            if known[player] is None:
+                known[player] = ({}, set(), set())
+            ps_players, bullets, exploded = known[player]
+            for player_id, row, col, player_bullets in ps.players:
+                ps_players[player_id] = (row, col, player_bullets)
+            for player_id in ps.dead:
+                ps_players.pop(player_id, None)
+            if ps.is_full:
+                bullets.update(ps.bullets)
+            else:
+                bullets.difference_update(ps.bullets)
+            exploded.update(ps.exploded)
+            bullets.difference_update(exploded)
+
+            full = self._master._get_pstate(turn)
+            self.assertEqual(set(full.bullets), bullets)
+            self.assertEqual(ps_players.get(turn + 1), full.current_player)
+            self.assertEqual(
+                sorted(full.players),
+                sorted(pos for player_id, pos in ps_players.items()
+                       if player_id != turn + 1)
+            )
+            return random.choice([(0, 0), (-1, 0), (0, 1), (1, 0), (0, -1)])
+
+        self._simulator.get_move.side_effect = get_move
+        self._master._incremental = True
+        while not self._simulator.is_finished:
+            self._master.tick(self._start_state)
+
+    def test_indexes(self):
+        players = self._simulator.get_players()
+
+        def get_move(player, ps, serialize, deserialize):
+            field = self._master._state.field
+            cells = {BULLET: set(), EXPLODED: set()}
+            poses = {}
+            for i, row in enumerate(field):
+                for j, cell in enumerate(row):
+                    if cell > 0:
+                        poses[players[cell - 1]] = (i, j)
+                    elif cell in cells:
+                        cells[cell].add((i, j))
+            self.assertEqual(self._master._players_poses, poses)
+            self.assertEqual(self._master._bullets_poses, cells[BULLET])
+            self.assertEqual(self._master._exploded_cells, cells[EXPLODED])
+            return random.choice([(0, 0), (-1, 0), (0, 1), (1, 0), (0, -1)])
+
+        self._simulator.get_move.side_effect = get_move
+        while not self._simulator.is_finished:
+            self._master.tick(self._start_state)
+
     def _get_simulator(self, players):
         simulator = Mock()
         simulator._states = []
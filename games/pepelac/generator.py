@@ -1,69 +1,104 @@
 import random
 import copy
-from jury_state import JuryState
+import config
+from jury_state import JuryState, Field
 from math import sqrt, ceil
 
-_field_size = random.randint(10, 20)
+
+def get_random(game_signature):
+    '''
+    Returns random.Random seeded by the round of `game_signature`,
+    so every process generates the same positions for the round.
+    Without signature positions are random.
+    '''
+    if game_signature is None:
+        return random.Random()
+    return random.Random(game_signature.get_seed())
 
 
 class Generator:
-    def generate_players(self, field, players_count):
+    def __init__(self, field_size=None, games_count=1):
+        '''
+        field_size - side of the field, random from 10 to 20 if None
+        games_count - number of positions generated per call,
+        e.g. for pools of pre-generated positions
+        '''
+        self._field_size = field_size
+        self._games_count = games_count
+
+    def generate_players(self, field, players_count, rng=random):
         new_field = copy.deepcopy(field)
-        field_size_in_cells = int(ceil(sqrt(players_count)))
-        cell_size = _field_size // field_size_in_cells
+        self._place_players(new_field, players_count, rng)
+        return new_field
+
+    def generate_bullets(self, field, bullets_count, rng=random):
+        new_field = copy.deepcopy(field)
+        self._place_bullets(new_field, bullets_count, rng)
+        return new_field
 
-        for ind, cell in enumerate(random.sample(
+    def _place_players(self, field, players_count, rng):
+        '''
+        Places players on `field` in distinct blocks of the field,
+        returns their positions.
+        '''
+        field_size = len(field)
+        field_size_in_cells = int(ceil(sqrt(players_count)))
+        cell_size = field_size // field_size_in_cells
+        positions = []
+        for ind, cell in enumerate(rng.sample(
                                    range(field_size_in_cells ** 2),
                                    players_count)):
             cell_x = cell // field_size_in_cells
             cell_y = cell % field_size_in_cells
-            x = int(cell_x * cell_size + random.random() * cell_size)
-            y = int(cell_y * cell_size + random.random() * cell_size)
-            player_x = min(_field_size - 1, x)
-            player_y = min(_field_size - 1, y)
+            x = int(cell_x * cell_size + rng.random() * cell_size)
+            y = int(cell_y * cell_size + rng.random() * cell_size)
+            player_x = min(field_size - 1, x)
+            player_y = min(field_size - 1, y)
 
-            assert(0 <= player_x < _field_size)
-            assert(0 <= player_y < _field_size)
-            assert(new_field[player_x][player_y] == 0)
+            assert(0 <= player_x < field_size)
+            assert(0 <= player_y < field_size)
+            assert(field[player_x][player_y] == 0)
 
-            new_field[player_x][player_y] = ind + 1
-        return new_field
+            field[player_x][player_y] = ind + 1
+            positions.append((player_x, player_y))
+        return positions
 
-    def generate_bullets(self, field, bullets_count):
-        new_field = copy.deepcopy(field)
-        for bullet in range(bullets_count):
-            bullet_x = random.randint(0, _field_size - 1)
-            bullet_y = random.randint(0, _field_size - 1)
-            while new_field[bullet_x][bullet_y] != 0:
-                bullet_x = random.randint(0, _field_size - 1)
-                bullet_y = random.randint(0, _field_size - 1)
-            assert(0 <= bullet_x < _field_size)
-            assert(0 <= bullet_y < _field_size)
-            assert(new_field[bullet_x][bullet_y] == 0)
-            new_field[bullet_x][bullet_y] = -1
-        return new_field
+    def _place_bullets(self, field, bullets_count, rng):
+        '''
+        Places bullets on distinct empty cells of `field`
+        in a single pass.
+        '''
+        empty_cells = [(i, j) for i, row in enumerate(field)
+                       for j, cell in enumerate(row) if cell == 0]
+        for bullet_x, bullet_y in rng.sample(empty_cells, bullets_count):
+            field[bullet_x][bullet_y] = -1
 
     def generate_start_positions(self, game_signature, players_count):
-        self.players_count = players_count
-        self._games_count = 1
         '''Generates a list of start positions'''
-        random.seed()
-        self.time = random.randint(100, 140)
-        self.bullets_count = min(_field_size ** 2 - players_count,
-                                 self.players_count * 5
-                                 )
-        field = [[0 for i in range(_field_size)] for j in range(_field_size)]
-        field = self.generate_players(field, self.players_count)
-        field = self.generate_bullets(field, self.bullets_count)
+        rng = get_random(game_signature)
+        compact = getattr(config, 'compact_field', False)
+        self.players_count = players_count
         for game in range(self._games_count):
-            players = []
-            for i, row in enumerate(field):
-                for j, cell in enumerate(row):
-                    if (cell > 0):
-                        players.append((i, j, cell))
+            field_size = self._field_size
+            if field_size is None:
+                field_size = rng.randint(10, 20)
+            self.time = rng.randint(100, 140)
+            self.bullets_count = min(field_size ** 2 - players_count,
+                                     self.players_count * 5
+                                     )
+            if compact:
+                field = Field(field_size)
+            else:
+                field = [[0 for i in range(field_size)]
+                         for j in range(field_size)]
+            positions = self._place_players(field, players_count, rng)
+            self._place_bullets(field, self.bullets_count, rng)
 
-            field[players[0][0]][players[0][1]] = players[1][2]
-            field[players[1][0]][players[1][1]] = players[0][2]
+            # Players in the first two cells (in row-major order)
+            # swap their places
+            if players_count >= 2:
+                (x0, y0), (x1, y1) = sorted(positions)[:2]
+                field[x0][y0], field[x1][y1] = field[x1][y1], field[x0][y0]
 
             self.bullets = [0] * players_count
-            yield JuryState(_field_size, field, self.bullets, self.time)
+            yield JuryState(field_size, field, self.bullets, self.time)
@@ -35,5 +35,29 @@ class GeneratorTest(unittest.TestCase):
                 sum += j
         self.assertEqual(sum, -4)
 
+    def test_seeded_positions(self):
+        def generate(seed):
+            signature = unittest.mock.Mock()
+            signature.get_seed.return_value = seed
+            return [(js.field_side, js.explosion_time,
+                     [list(row) for row in js.field])
+                    for js in generator.Generator().generate_start_positions(
+                        signature, self.players_count)]
+
+        self.assertEqual(generate(1), generate(1))
+        self.assertNotEqual(generate(1), generate(2))
+
+    def test_dense_positions_pool(self):
+        players_count = 4
+        gen = generator.Generator(field_size=5, games_count=50)
+        positions = list(gen.generate_start_positions(None, players_count))
+        self.assertEqual(len(positions), 50)
+        for js in positions:
+            cells = [cell for row in js.field for cell in row]
+            self.assertEqual(sorted(cell for cell in cells if cell > 0),
+                             list(range(1, players_count + 1)))
+            self.assertEqual(cells.count(-1), 20)
+        self.assertIsNot(positions[0].field, positions[1].field)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,13 +1,14 @@
 # -*- coding: utf-8 -*-
+from array import array
 
 
 class JuryState:
     def __init__(self, field_side, field, bullets,
-                 explosion_time, dead_players=[], dead_reasons={},
-                 collision=None, scores={}):
+                 explosion_time, dead_players=None, dead_reasons=None,
+                 collision=None, scores=None):
         '''
         field_side is side of field
-        field is the current field:
+        field is the current field (list of rows or compact Field):
 
         if field[i][j] = -2 then that cell is charred
         if field[i][j] = -1 then there is a bullet in cell (i, j)
@@ -30,7 +31,70 @@ class JuryState:
         self.field = field
         self.bullets = bullets
         self.explosion_time = explosion_time
-        self.dead_players = dead_players
-        self.dead_reasons = dead_reasons
+        self.dead_players = [] if dead_players is None else dead_players
+        self.dead_reasons = {} if dead_reasons is None else dead_reasons
         self.collision = collision
-        self.scores = scores
+        self.scores = {} if scores is None else scores
+
+
+class Field:
+    '''
+    Compact square field: cells are small ints stored in one
+    array('b') buffer instead of a list of lists. Rows are accessed
+    like lists, so `field[i][j]`, `field[i][j] = cell` and
+    `for row in field` work unchanged. Copying and pickling
+    copy a single buffer.
+    Usage:
+        >> field = Field(3)
+        >> field[1][2] = -1
+        >> field.to_rows()
+        [[0, 0, 0], [0, 0, -1], [0, 0, 0]]
+        >> Field.from_rows([[0, 1], [-2, 0]])[1][0]
+        -2
+    '''
+    def __init__(self, side, cells=None):
+        self.side = side
+        if cells is None:
+            self._cells = array('b', bytes(side * side))
+        else:
+            self._cells = array('b', cells)
+
+    @classmethod
+    def from_rows(cls, rows):
+        return cls(len(rows), [cell for row in rows for cell in row])
+
+    def to_rows(self):
+        return [row.tolist() for row in self]
+
+    def __len__(self):
+        return self.side
+
+    def __getitem__(self, row):
+        '''
+        Returns writable view of the row.
+        '''
+        if row < 0:
+            row += self.side
+        if not 0 <= row < self.side:
+            raise IndexError('field row index out of range')
+        start = row * self.side
+        return memoryview(self._cells)[start:start + self.side]
+
+    def __iter__(self):
+        cells = memoryview(self._cells)
+        for start in range(0, len(self._cells), self.side):
+            yield cells[start:start + self.side]
+
+    def __eq__(self, other):
+        if isinstance(other, Field):
+            return self.side == other.side and self._cells == other._cells
+        return self.to_rows() == [list(row) for row in other]
+
+    def __copy__(self):
+        return Field(self.side, self._cells)
+
+    def __deepcopy__(self, memo):
+        return Field(self.side, self._cells)
+
+    def __repr__(self):
+        return 'Field({0}, {1})'.format(self.side, self.to_rows())
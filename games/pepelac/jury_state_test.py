@@ -0,0 +1,37 @@
+import copy
+import pickle
+import unittest
+from jury_state import Field
+
+
+class FieldTest(unittest.TestCase):
+    def setUp(self):
+        self.rows = [[0, 1, -1], [-2, 0, 2], [0, 0, -1]]
+        self.field = Field.from_rows(self.rows)
+
+    def test_access(self):
+        self.assertEqual(len(self.field), 3)
+        self.assertEqual(self.field[1][0], -2)
+        self.assertEqual(self.field[-1][-1], -1)
+        self.field[2][1] = 3
+        self.assertEqual(self.field[2][1], 3)
+        self.assertEqual([list(row) for row in self.field],
+                         [[0, 1, -1], [-2, 0, 2], [0, 3, -1]])
+        with self.assertRaises(IndexError):
+            self.field[3]
+
+    def test_equality(self):
+        self.assertEqual(self.field, self.rows)
+        self.assertEqual(self.field, Field.from_rows(self.rows))
+        self.assertNotEqual(self.field, Field(3))
+        self.assertEqual(self.field.to_rows(), self.rows)
+
+    def test_copy(self):
+        for copied in (copy.deepcopy(self.field), copy.copy(self.field),
+                       pickle.loads(pickle.dumps(self.field))):
+            self.assertEqual(copied, self.field)
+            copied[0][0] = 1
+            self.assertEqual(self.field[0][0], 0)
+
+if __name__ == '__main__':
+    unittest.main()
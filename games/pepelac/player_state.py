@@ -28,3 +28,46 @@ def serialize_pstate(ps, stream):
     ) + '\n'
     stream.write(representation.encode())
     stream.flush()
+
+
+class IncrementalPlayerState:
+    '''
+    Player state of the incremental protocol (`incremental_player_state`
+    in config). The first state sent to the player is full, the next
+    ones contain only the changes since the previous move of the player.
+
+    players - list of (id, row, col, bullets) of all players if the state
+    is full (current player goes first) or of the players which moved or
+    whose bullets changed
+    bullets - all bullets if the state is full or picked up bullets
+    exploded - exploded cells (all or new ones)
+    dead - ids of players who died since the previous move
+    '''
+    def __init__(self, is_full):
+        self.is_full = is_full
+        self.explosion_time = None
+        self.players = []
+        self.bullets = []
+        self.exploded = []
+        self.dead = []
+
+
+def serialize_incremental_pstate(ps, stream):
+    '''
+    Header line is `FULL|DIFF explosion_time P B E D`, then follow
+    P lines `id row col bullets`, B lines `row col` of bullets,
+    E lines `row col` of exploded cells and D lines with ids.
+    '''
+    header = [
+        'FULL' if ps.is_full else 'DIFF', ps.explosion_time,
+        len(ps.players), len(ps.bullets), len(ps.exploded), len(ps.dead)
+    ]
+    representation = '\n'.join(
+        [list_to_str(header)] +
+        [list_to_str(player) for player in ps.players] +
+        [list_to_str(bullet) for bullet in ps.bullets] +
+        [list_to_str(cell) for cell in ps.exploded] +
+        [str(player_id) for player_id in ps.dead]
+    ) + '\n'
+    stream.write(representation.encode())
+    stream.flush()
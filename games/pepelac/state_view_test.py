@@ -0,0 +1,91 @@
+import io
+import os
+import random
+import subprocess
+import sys
+import unittest
+from unittest.mock import Mock
+from game_master import GameMaster
+from generator import Generator
+
+BOTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bots')
+sys.path.insert(0, BOTS_PATH)
+from state_view import StateView
+
+
+class StateViewTests(unittest.TestCase):
+    def setUp(self):
+        self._players = [Mock(name='player 0'), Mock(name='player 1')]
+        self._start_state = random.choice(list(
+            Generator().generate_start_positions(None, len(self._players))))
+
+    def _play(self, get_move, incremental):
+        '''
+        Plays the game, `get_move` gets the master as the first argument
+        (None for the start of the game, the state is the field side).
+        '''
+        simulator = Mock()
+        simulator.get_players.return_value = self._players
+        simulator.is_finished = False
+        master = None
+
+        def finish_game(scores):
+            simulator.is_finished = True
+
+        simulator.get_move.side_effect = \
+            lambda *args: get_move(master, *args)
+        simulator.finish_game.side_effect = finish_game
+        master = GameMaster(simulator, self._start_state)
+        master._incremental = incremental
+        while not simulator.is_finished:
+            master.tick(self._start_state)
+
+    def _check_view(self, incremental):
+        views = {player: StateView() for player in self._players}
+
+        def get_move(master, player, ps, serialize, deserialize):
+            if master is None:
+                return None
+            stream = io.BytesIO()
+            serialize(ps, stream)
+            view = views[player]
+            view.read(io.StringIO(stream.getvalue().decode()))
+            full = master._get_pstate(self._players.index(player))
+            self.assertEqual(view.players[view.my_id], full.current_player)
+            self.assertEqual(
+                sorted(position for player_id, position
+                       in view.players.items() if player_id != view.my_id),
+                sorted(full.players))
+            self.assertEqual(view.bullets, set(full.bullets))
+            self.assertEqual(view.explosion_time, full.explosion_time)
+            return random.choice([(0, 0), (-1, 0), (0, 1), (1, 0), (0, -1)])
+
+        self._play(get_move, incremental)
+
+    def test_full_protocol(self):
+        self._check_view(incremental=False)
+
+    def test_incremental_protocol(self):
+        self._check_view(incremental=True)
+
+    def test_stand_bot(self):
+        bots = {}
+        for player in self._players:
+            bots[player] = subprocess.Popen(
+                [sys.executable, os.path.join(BOTS_PATH, 'stand.py')],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            self.addCleanup(bots[player].stdout.close)
+            self.addCleanup(bots[player].stdin.close)
+            self.addCleanup(bots[player].kill)
+
+        def get_move(master, player, ps, serialize, deserialize):
+            serialize(ps, bots[player].stdin)
+            return deserialize(bots[player].stdout)
+
+        self._play(get_move, incremental=True)
+        for bot in bots.values():
+            self.assertIsNone(bot.poll())
+
+
+if __name__ == '__main__':
+    unittest.main()
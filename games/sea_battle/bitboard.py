@@ -0,0 +1,114 @@
+'''
+Bitboards of sea battle: a set of cells of the field is one integer
+mask, cell (row, col) is the bit `row * cols + col`. Masks are immutable
+ints, so copying a state made of masks costs nothing.
+'''
+
+
+def popcount(mask):
+    '''
+    Returns number of cells in `mask`.
+    '''
+    return bin(mask).count('1')
+
+
+class BitBoard:
+    '''
+    Geometry of the grid `rows` x `cols`.
+    Usage:
+        >> board = BitBoard(10)
+        >> ship = board.from_cells([(0, 0), (0, 1)])
+        >> board.is_segment(ship)
+        True
+        >> board.cells(board.neighbourhood(ship))
+        [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)]
+    '''
+    def __init__(self, rows, cols=None):
+        self.rows = rows
+        self.cols = rows if cols is None else cols
+        self.full = (1 << (self.rows * self.cols)) - 1
+        self._columns = [
+            sum(1 << (row * self.cols + col) for row in range(self.rows))
+            for col in range(self.cols)
+        ]
+        self._sources = {}
+
+    def contains(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def bit(self, row, col):
+        '''
+        Returns mask of the cell (row, col).
+        '''
+        return 1 << (row * self.cols + col)
+
+    def from_cells(self, cells):
+        mask = 0
+        for row, col in cells:
+            mask |= self.bit(row, col)
+        return mask
+
+    def cells(self, mask):
+        '''
+        Returns list of (row, col) of the cells of `mask`
+        in row-major order.
+        '''
+        cells = []
+        while mask:
+            low = mask & -mask
+            cells.append(divmod(low.bit_length() - 1, self.cols))
+            mask ^= low
+        return cells
+
+    def shift(self, mask, drow, dcol):
+        '''
+        Moves every cell of `mask` by (drow, dcol),
+        cells moved out of the grid are dropped.
+        '''
+        if dcol not in self._sources:
+            self._sources[dcol] = sum(
+                column for col, column in enumerate(self._columns)
+                if 0 <= col + dcol < self.cols
+            )
+        mask &= self._sources[dcol]
+        delta = drow * self.cols + dcol
+        if delta >= 0:
+            return (mask << delta) & self.full
+        return mask >> -delta
+
+    def neighbourhood(self, mask):
+        '''
+        Returns `mask` with all cells adjacent to it,
+        diagonally adjacent ones included.
+        '''
+        result = mask
+        for drow in (-1, 0, 1):
+            for dcol in (-1, 0, 1):
+                result |= self.shift(mask, drow, dcol)
+        return result
+
+    def is_segment(self, mask):
+        '''
+        Returns True if `mask` is non-empty horizontal or vertical
+        segment of adjacent cells.
+        '''
+        if not mask:
+            return False
+        low = mask & -mask
+        row, col = divmod(low.bit_length() - 1, self.cols)
+        length = popcount(mask)
+        horizontal = ((1 << length) - 1) * low
+        vertical = sum(low << (i * self.cols) for i in range(length))
+        return ((mask == horizontal and col + length <= self.cols) or
+                (mask == vertical and row + length <= self.rows))
+
+    def to_rows(self, layers, empty=0):
+        '''
+        Returns field as list of rows, cell is the value of the last
+        layer (tuple (mask, value)) containing it or `empty`.
+        '''
+        rows = [[empty] * self.cols for row in range(self.rows)]
+        for mask, value in layers:
+            for row, col in self.cells(mask):
+                rows[row][col] = value
+        return rows
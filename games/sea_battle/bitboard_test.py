@@ -0,0 +1,54 @@
+import unittest
+from bitboard import BitBoard, popcount
+
+
+class BitBoardTest(unittest.TestCase):
+    def setUp(self):
+        self.board = BitBoard(3)
+
+    def test_cells(self):
+        cells = [(0, 2), (1, 0), (2, 1)]
+        mask = self.board.from_cells(cells)
+        self.assertEqual(popcount(mask), 3)
+        self.assertEqual(self.board.cells(mask), cells)
+        self.assertEqual(self.board.cells(self.board.full),
+                         [(row, col) for row in range(3) for col in range(3)])
+
+    def test_shift(self):
+        board = BitBoard(3, 4)
+        mask = board.from_cells([(0, 3), (1, 0), (2, 2)])
+        self.assertEqual(board.cells(board.shift(mask, 0, 1)),
+                         [(1, 1), (2, 3)])
+        self.assertEqual(board.cells(board.shift(mask, -1, -1)), [(1, 1)])
+        self.assertEqual(board.cells(board.shift(mask, 1, 0)),
+                         [(1, 3), (2, 0)])
+
+    def test_neighbourhood(self):
+        mask = self.board.neighbourhood(self.board.bit(0, 0))
+        self.assertEqual(self.board.cells(mask),
+                         [(0, 0), (0, 1), (1, 0), (1, 1)])
+        self.assertEqual(
+            self.board.neighbourhood(self.board.bit(1, 1)), self.board.full
+        )
+
+    def test_is_segment(self):
+        board = BitBoard(4)
+        self.assertTrue(board.is_segment(board.from_cells([(1, 1), (1, 2)])))
+        self.assertTrue(board.is_segment(board.from_cells([(0, 3), (1, 3),
+                                                           (2, 3)])))
+        self.assertTrue(board.is_segment(board.bit(3, 3)))
+        self.assertFalse(board.is_segment(0))
+        # Wraps to the next row
+        self.assertFalse(board.is_segment(board.from_cells([(0, 3), (1, 0)])))
+        self.assertFalse(board.is_segment(board.from_cells([(0, 0), (0, 2)])))
+        self.assertFalse(board.is_segment(board.from_cells([(0, 0), (1, 1)])))
+
+    def test_to_rows(self):
+        rows = self.board.to_rows([(self.board.bit(0, 0), 'X'),
+                                   (self.board.bit(2, 1), 'O')], '.')
+        self.assertEqual(rows, [['X', '.', '.'], ['.', '.', '.'],
+                                ['.', 'O', '.']])
+
+
+if __name__ == '__main__':
+    unittest.main()
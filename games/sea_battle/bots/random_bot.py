@@ -1,3 +1,45 @@
 import random
 import sys
 
+FLEET = [4, 3, 3, 2, 2, 2, 1, 1, 1, 1]
+
+
+def place_ships(side):
+    '''
+    Places ships of FLEET randomly, so they don't touch each other.
+    '''
+    while True:
+        busy = set()
+        ships = []
+        for size in FLEET:
+            for attempt in range(100):
+                horizontal = random.random() < 0.5
+                row = random.randint(1, side - (0 if horizontal else size - 1))
+                col = random.randint(1, side - (size - 1 if horizontal else 0))
+                ship = [(row, col + i) if horizontal else (row + i, col)
+                        for i in range(size)]
+                if not busy.intersection(ship):
+                    break
+            else:
+                break
+            ships.append(ship)
+            for row, col in ship:
+                busy.update((row + dr, col + dc)
+                            for dr in (-1, 0, 1) for dc in (-1, 0, 1))
+        if len(ships) == len(FLEET):
+            return ships
+
+
+side = int(input())
+ships = place_ships(side)
+print(len(ships))
+for ship in ships:
+    print(' '.join('{0} {1}'.format(row, col) for row, col in ship))
+sys.stdout.flush()
+
+while True:
+    field = [input() for row in range(side)]
+    unknown = [(row + 1, col + 1) for row in range(side)
+               for col in range(side) if field[row][col] == '.']
+    print('{0} {1}'.format(*random.choice(unknown)))
+    sys.stdout.flush()
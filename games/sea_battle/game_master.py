@@ -1,6 +1,122 @@
 from move import *
 from player_state import *
+from bitboard import popcount
+from jury_state import get_board
 
+# Sizes of ships of every player
+FLEET = [4, 3, 3, 2, 2, 2, 1, 1, 1, 1]
 
-class GameMaster:
+
+class NumberOfPlayersException(Exception):
     pass
+
+
+class IncorrectMoveException(Exception):
+    pass
+
+
+class GameMaster:
+    '''
+    Players place their ships at the start of the game, then shoot
+    in turn, a player who hit shoots again. A player who sank all ships
+    of the opponent wins, a player who made incorrect move loses.
+    One tick is one turn of a player.
+    '''
+    def __init__(self, simulator, start_state):
+        self._simulator = simulator
+        self._players = simulator.get_players()
+        if len(self._players) != 2:
+            raise NumberOfPlayersException(
+                'Number of players should be equal to 2')
+        self._board = get_board(start_state.field_side)
+        self._turn = 0
+        self._failed = []
+        for idx, player in enumerate(self._players):
+            try:
+                ships = self._simulator.get_move(
+                    player, start_state.field_side,
+                    serialize_field_side, deserialize_ships
+                )
+                start_state.ships[idx] = self._place_ships(ships)
+            except Exception:
+                self._failed.append(idx)
+        self._simulator.report_state(start_state)
+
+    def tick(self, state):
+        if self._failed:
+            if len(self._failed) == 2:
+                self._simulator.finish_game(dict.fromkeys(self._players, 0))
+            else:
+                self._finish(state, 1 - self._failed[0])
+            return
+
+        shooter = self._turn
+        target = 1 - shooter
+        fleet = state.get_fleet_mask(target)
+        while True:
+            hits = state.shots[target] & fleet
+            sunk = 0
+            for ship in state.ships[target]:
+                if ship & hits == ship:
+                    sunk |= ship
+            ps = PlayerState(self._board, state.shots[target], hits, sunk)
+            try:
+                move = self._simulator.get_move(
+                    self._players[shooter], ps, serialize, deserialize
+                )
+                cell = self._get_shot(state, target, move)
+            except Exception:
+                self._finish(state, target)
+                return
+
+            state.shots[target] |= cell
+            self._simulator.report_state(state)
+            if not cell & fleet:
+                break
+            if fleet & ~state.shots[target] == 0:
+                self._finish(state, shooter)
+                return
+        self._turn = target
+
+    def _get_shot(self, state, target, move):
+        '''
+        Returns mask of the cell shot by `move` (1-based row and column).
+        '''
+        if len(move) != 2 or not self._board.contains(move[0] - 1,
+                                                      move[1] - 1):
+            raise IncorrectMoveException('Incorrect move')
+        cell = self._board.bit(move[0] - 1, move[1] - 1)
+        if cell & state.shots[target]:
+            raise IncorrectMoveException('Incorrect move')
+        return cell
+
+    def _place_ships(self, ships):
+        '''
+        Checks placement of ships (lists of 1-based cells) and returns
+        masks of ships. Ships are straight, don't touch each other
+        even diagonally and have sizes of FLEET.
+        '''
+        if sorted(map(len, ships), reverse=True) != FLEET:
+            raise IncorrectMoveException('Incorrect fleet')
+        masks = []
+        occupied = 0
+        for ship in ships:
+            if not all(self._board.contains(row - 1, col - 1)
+                       for row, col in ship):
+                raise IncorrectMoveException('Ship is out of the field')
+            mask = self._board.from_cells((row - 1, col - 1)
+                                          for row, col in ship)
+            if popcount(mask) != len(ship) or not self._board.is_segment(mask):
+                raise IncorrectMoveException('Ship is not straight')
+            if self._board.neighbourhood(mask) & occupied:
+                raise IncorrectMoveException('Ships touch each other')
+            occupied |= mask
+            masks.append(mask)
+        return masks
+
+    def _finish(self, state, winner):
+        state.winner = self._players[winner]
+        self._simulator.report_state(state)
+        scores = dict.fromkeys(self._players, 0)
+        scores[self._players[winner]] = 1
+        self._simulator.finish_game(scores)
@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import Mock
+from game_master import GameMaster, FLEET
+from generator import Generator
+from player_state import serialize_field_side
+
+# 1-based cells of the ships
+SHIPS = [[(1, 1), (1, 2), (1, 3), (1, 4)],
+         [(3, 1), (3, 2), (3, 3)], [(3, 5), (3, 6), (3, 7)],
+         [(5, 1), (6, 1)], [(5, 3), (6, 3)], [(5, 5), (6, 5)],
+         [(10, 10)], [(8, 8)], [(10, 1)], [(8, 3)]]
+
+
+class GameMasterTests(unittest.TestCase):
+    def setUp(self):
+        self._players = [Mock(name='player 0'), Mock(name='player 1')]
+        self._state = next(Generator().generate_start_positions(None, 2))
+
+    def _play(self, placements, shots):
+        simulator = Mock()
+        simulator.get_players.return_value = self._players
+        simulator.is_finished = False
+        shots = {player: iter(player_shots)
+                 for player, player_shots in zip(self._players, shots)}
+
+        def get_move(player, ps, serialize, deserialize):
+            if serialize is serialize_field_side:
+                return placements[self._players.index(player)]
+            return next(shots[player])
+
+        def finish_game(scores):
+            simulator.is_finished = True
+            simulator.scores = scores
+
+        simulator.get_move.side_effect = get_move
+        simulator.finish_game.side_effect = finish_game
+        master = GameMaster(simulator, self._state)
+        while not simulator.is_finished:
+            master.tick(self._state)
+        return simulator.scores
+
+    def test_sink_all_ships(self):
+        all_cells = [cell for ship in SHIPS for cell in ship]
+        misses = [(row, 10) for row in range(1, 8)]
+        # The first player misses every time, the second one
+        # hits every ship's cell after the first miss
+        scores = self._play([SHIPS, SHIPS], [misses, all_cells])
+        self.assertEqual(scores, {self._players[0]: 0,
+                                  self._players[1]: 1})
+        self.assertEqual(self._state.winner, self._players[1])
+        self.assertEqual(self._state.get_fleet_mask(0) & ~self._state.shots[0],
+                         0)
+
+    def test_incorrect_placement(self):
+        touching = SHIPS[:-1] + [[(7, 1)]]
+        scores = self._play([SHIPS, touching], [[], []])
+        self.assertEqual(scores, {self._players[0]: 1,
+                                  self._players[1]: 0})
+        curved = [[(1, 1), (1, 2), (2, 2), (2, 3)]] + SHIPS[1:]
+        self.setUp()
+        scores = self._play([curved, SHIPS], [[], []])
+        self.assertEqual(scores, {self._players[0]: 0,
+                                  self._players[1]: 1})
+
+    def test_repeated_shot(self):
+        scores = self._play([SHIPS, SHIPS], [[(1, 1), (1, 1)], []])
+        self.assertEqual(scores, {self._players[0]: 0,
+                                  self._players[1]: 1})
+
+    def test_fleet(self):
+        self.assertEqual(sorted(map(len, SHIPS), reverse=True), FLEET)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,9 +5,8 @@ import random
 class Generator:
     _games_count = 1
 
-    def generate_start_positions(self):
+    def generate_start_positions(self, game_signature, players_count):
         for game in range(self._games_count):
             field_side = 10
-            empty_list = [0 for i in range(field_side)]
-            empty_field = [empty_list for j in range(field_side)]
-            yield JuryState(field_side, [empty_field, empty_field], None)
+            # Ships are placed by the players at the start of the game
+            yield JuryState(field_side, [[], []])
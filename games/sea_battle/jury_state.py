@@ -1,27 +1,76 @@
+from bitboard import BitBoard, popcount
+
+_boards = {}
+
+
+def get_board(field_side):
+    '''
+    Returns BitBoard of the field, shared by all states.
+    '''
+    if field_side not in _boards:
+        _boards[field_side] = BitBoard(field_side)
+    return _boards[field_side]
+
+
 class JuryState:
-    def __init__(self, field_side, fields, start_fields, ships, winner=None):
+    def __init__(self, field_side, ships, shots=None, winner=None):
         '''
         field_side - The side of field
 
-        fields - fields of players:
-        field:
-            -1 - exploded
-            0 - empty
-            1-4 - ships
-
-        start_fields - start fields of players
-
-        ships - all ships:
+        ships - all ships as bitboards (see bitboard.py):
             ships[0] - ships of first player
             ships[1] - ships of second player
-        ships of player - the list of ships
-        ship - the list of cells (tuples)
+        ships of player - the list of masks of ships' cells
+
+        shots - shots[i] is mask of the cells of the field
+                of i-th player which were shot
 
         winner - Winner of the game (type is Player).
                  It is equal to None is game is not finished
         '''
         self.field_side = field_side
-        self.fields = fields
-        self.start_fields = start_fields
         self.ships = ships
+        self.shots = [0, 0] if shots is None else shots
         self.winner = winner
+
+    @property
+    def board(self):
+        return get_board(self.field_side)
+
+    @property
+    def start_fields(self):
+        '''
+        Fields of players before shots:
+            0 - empty
+            1-4 - ships (size of the ship)
+        '''
+        return [self._get_field(idx, with_shots=False) for idx in range(2)]
+
+    @property
+    def fields(self):
+        '''
+        Current fields of players:
+            -1 - exploded
+            0 - empty
+            1-4 - ships
+        '''
+        return [self._get_field(idx, with_shots=True) for idx in range(2)]
+
+    def get_ship_cells(self, idx):
+        '''
+        Returns list of ships of `idx`-th player, ship is
+        the list of cells (tuples).
+        '''
+        return [self.board.cells(ship) for ship in self.ships[idx]]
+
+    def get_fleet_mask(self, idx):
+        fleet = 0
+        for ship in self.ships[idx]:
+            fleet |= ship
+        return fleet
+
+    def _get_field(self, idx, with_shots):
+        layers = [(ship, popcount(ship)) for ship in self.ships[idx]]
+        if with_shots:
+            layers.append((self.shots[idx], -1))
+        return self.board.to_rows(layers)
@@ -1,2 +1,24 @@
+class DeserializeMoveException(Exception):
+    pass
+
+
 def deserialize(stream):
     return [int(n) for n in stream.readline().decode().split()]
+
+
+def deserialize_ships(stream):
+    '''
+    Reads placement of ships: the number of ships, then a line
+    `row1 col1 row2 col2 ...` with cells of every ship.
+    '''
+    try:
+        ships_count = int(stream.readline().decode())
+        ships = []
+        for ship in range(ships_count):
+            numbers = deserialize(stream)
+            if not numbers or len(numbers) % 2:
+                raise DeserializeMoveException('Presentation error')
+            ships.append(list(zip(numbers[::2], numbers[1::2])))
+    except ValueError:
+        raise DeserializeMoveException('Presentation error')
+    return ships
@@ -68,7 +68,7 @@ class Painter:
                            over_x + (y + 1) * self._cell_side,
                            (x + 1) * self._cell_side + Y_MARGIN
                            )
-            if js.start_fields[idx][x][y] > 0 and js.fields[idx][x][y] == -1:
+            if js.shots[idx] & js.board.bit(x, y):
                 self.draw_fire(image, coordinates[0], coordinates[1])
             else:
                 draw.rectangle(coordinates, fill='black')
@@ -99,7 +99,7 @@ class Painter:
                     y += self._cell_side // 2
                     draw.ellipse((x - 5, y - 5, x + 5,
                                  y + 5), fill='black')
-        for ship in jury_state.ships[idx]:
+        for ship in jury_state.get_ship_cells(idx):
             self.draw_ship(image, draw, ship, jury_state, over_x, idx)
 
     def draw_player_on_the_up(self, font, draw, over_x, idx):
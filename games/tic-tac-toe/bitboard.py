@@ -0,0 +1,50 @@
+'''
+Bitboards of tic-tac-toe: a set of cells of the field is one integer
+mask, cell (row, col) is the bit `row * cols + col`, so a line is
+checked with one AND.
+'''
+
+
+class BitBoard:
+    '''
+    Geometry of the grid `rows` x `cols`.
+    Usage:
+        >> board = BitBoard(3)
+        >> mask = board.from_cells([(0, 0), (1, 1), (2, 2)])
+        >> [line for line in board.lines(3) if line & mask == line]
+        [273]
+    '''
+    def __init__(self, rows, cols=None):
+        self.rows = rows
+        self.cols = rows if cols is None else cols
+
+    def contains(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def bit(self, row, col):
+        '''
+        Returns mask of the cell (row, col).
+        '''
+        return 1 << (row * self.cols + col)
+
+    def from_cells(self, cells):
+        mask = 0
+        for row, col in cells:
+            mask |= self.bit(row, col)
+        return mask
+
+    def lines(self, length):
+        '''
+        Returns masks of all lines of `length` cells: horizontal ones,
+        then vertical ones, then diagonal and anti-diagonal ones,
+        each group in row-major order of the first cell.
+        '''
+        lines = []
+        for drow, dcol in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            for row in range(self.rows):
+                for col in range(self.cols):
+                    cells = [(row + drow * i, col + dcol * i)
+                             for i in range(length)]
+                    if all(self.contains(*cell) for cell in cells):
+                        lines.append(self.from_cells(cells))
+        return lines
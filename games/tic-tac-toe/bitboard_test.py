@@ -0,0 +1,27 @@
+import unittest
+from bitboard import BitBoard
+
+
+class BitBoardTest(unittest.TestCase):
+    def test_lines(self):
+        board = BitBoard(3)
+        lines = board.lines(3)
+        self.assertEqual(lines[:3], [
+            board.from_cells([(row, 0), (row, 1), (row, 2)])
+            for row in range(3)
+        ])
+        self.assertEqual(lines[6:], [
+            board.from_cells([(0, 0), (1, 1), (2, 2)]),
+            board.from_cells([(0, 2), (1, 1), (2, 0)])
+        ])
+        self.assertEqual(len(lines), 8)
+        self.assertEqual(len(BitBoard(4, 5).lines(2)), 16 + 15 + 12 + 12)
+
+    def test_bit(self):
+        board = BitBoard(3)
+        self.assertEqual(board.bit(1, 2), 1 << 5)
+        self.assertFalse(board.contains(3, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
 from player_state import *
 from move import *
+from jury_state import BOARD
+
+WIN_LINES = BOARD.lines(3)
 
 
 class NumberOfPlayersException(Exception):
@@ -36,13 +39,8 @@ class GameMaster:
                 turn ^= 1
                 raise IncorrectMoveException('Incorrect move')
 
-            if turn == 0:
-                self._state.field[move[0] * 3 + move[1] - 4] = 'X'
-            else:
-                self._state.field[move[0] * 3 + move[1] - 4] = 'O'
-            idx = self._eq3([[0, 1, 2], [3, 4, 5], [6, 7, 8],
-                             [0, 3, 6], [1, 4, 7], [2, 5, 8],
-                             [0, 4, 8], [2, 4, 6]], self._state.field)
+            self._state.put(turn, move[0] - 1, move[1] - 1)
+            idx = self._find_line(self._state.marks[turn])
             if idx != -1:
                 self._state.line = idx
                 break
@@ -69,15 +67,15 @@ class GameMaster:
     def _is_valid_move(self, js, move):
         return (1 <= move[0] <= 3 and
                 1 <= move[1] <= 3 and
-                js.field[move[0] * 3 + move[1] - 4] == '.')
+                not (js.marks[0] | js.marks[1]) &
+                BOARD.bit(move[0] - 1, move[1] - 1))
 
-    def _eq3(self, lst, field):
-        for idx, row in enumerate(lst):
-            finish = True
-            for i in range(2):
-                if field[row[i]] != field[row[i + 1]]:
-                    finish = False
-            finish &= field[row[0]] != '.'
-            if finish:
+    def _find_line(self, marks):
+        '''
+        Returns index of the line in WIN_LINES
+        filled with `marks` or -1.
+        '''
+        for idx, line in enumerate(WIN_LINES):
+            if marks & line == line:
                 return idx
         return -1
@@ -6,7 +6,31 @@ from generator import Generator
 
 
 class GameMasterTests(unittest.TestCase):
-    pass
+    def setUp(self):
+        self._players = [Mock(name='player 0'), Mock(name='player 1')]
+        self._start_state = next(Generator().generate_start_positions(
+            None, len(self._players)))
+
+    def _play(self, moves):
+        simulator = Mock()
+        simulator.get_players.return_value = self._players
+        simulator.get_move.side_effect = moves
+        master = GameMaster(simulator, self._start_state)
+        master.tick(self._start_state)
+        return simulator.finish_game.call_args[0][0]
+
+    def test_win_line(self):
+        scores = self._play([(2, 1), (1, 1), (2, 2), (1, 3), (2, 3)])
+        self.assertEqual(scores, {self._players[0]: 1, self._players[1]: 0})
+        self.assertEqual(self._start_state.line, 1)
+        self.assertEqual(self._start_state.field,
+                         list('O.OXXX...'))
+
+    def test_diagonal(self):
+        scores = self._play([(1, 1), (1, 3), (1, 2), (2, 2), (3, 3), (3, 1)])
+        self.assertEqual(scores, {self._players[0]: 0, self._players[1]: 1})
+        self.assertEqual(self._start_state.line, 7)
+        self.assertEqual(self._start_state.winner, self._players[1])
 
 if __name__ == '__main__':
     unittest.main()
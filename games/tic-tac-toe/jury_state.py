@@ -1,3 +1,9 @@
+from bitboard import BitBoard
+
+BOARD = BitBoard(3)
+SYMBOLS = ['X', 'O']
+
+
 class JuryState:
     def __init__(self, field, winner=None, line=-1):
         '''
@@ -5,7 +11,22 @@ class JuryState:
         winner - Winner of the game (type is Player).
                   It is equal to None is game is not finished
         line - line of winner
+
+        marks[0] is bitboard of 'X' cells, marks[1] is the one of 'O'
+        cells, they are kept with `field` by `put`.
         '''
         self.field = field
         self.winner = winner
-        self.line = line
\ No newline at end of file
+        self.line = line
+        self.marks = [
+            BOARD.from_cells(divmod(idx, 3) for idx, cell in enumerate(field)
+                             if cell == symbol)
+            for symbol in SYMBOLS
+        ]
+
+    def put(self, turn, row, column):
+        '''
+        Puts the symbol of player `turn` to the cell (0-based).
+        '''
+        self.field[row * 3 + column] = SYMBOLS[turn]
+        self.marks[turn] |= BOARD.bit(row, column)
@@ -0,0 +1,114 @@
+'''
+Incremental tournaments: results of the games of the previous run are
+reused for every game whose bots and start position haven't changed, so
+after re-upload of one bot only the games of this bot are played again.
+
+Game is identified by its players and their bots' fingerprints: hash of
+the command line and of the contents of the files mentioned in it (binary
+or source of the bot), which change when the bot is re-uploaded.
+'''
+import hashlib
+import os
+import pickle
+import threading
+from log import logger
+
+
+def get_bot_fingerprint(player):
+    '''
+    Returns hex digest of `player`'s command line and of the files
+    it mentions.
+    '''
+    digest = hashlib.sha256(player.command_line.encode())
+    for token in player.command_line.split():
+        if not os.path.isfile(token):
+            # Path after prefix like 'inprocess:'
+            token = token.partition(':')[2]
+        if os.path.isfile(token):
+            with open(token, 'rb') as bot_file:
+                digest.update(hashlib.sha256(bot_file.read()).digest())
+    return digest.hexdigest()
+
+
+def get_state_fingerprint(jury_state):
+    '''
+    Returns hex digest of pickled `jury_state`.
+    '''
+    return hashlib.sha256(pickle.dumps(jury_state)).hexdigest()
+
+
+class IncrementalResults:
+    '''
+    Results of the games of previous runs and start positions of their
+    rounds, stored in the file `path`.
+    Usage:
+        >> results = IncrementalResults('logs/nim.results')
+        >> key = results.get_key(players, jury_state)  # before the game
+        >> results.get(key, players)  # None if the game should be played
+        {<player>: 1, <player>: 0}
+        >> results.add(key, players, scores)
+        >> results.save()
+    '''
+    def __init__(self, path):
+        self._path = path
+        self._results = {}
+        self._positions = {}
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+        self.reused_count = 0
+        if os.path.exists(path):
+            with open(path, 'rb') as results_file:
+                self._results, self._positions = pickle.load(results_file)
+            logger.info('loaded %d results of previous runs',
+                        len(self._results))
+
+    def _get_bot_fingerprint(self, player):
+        if player not in self._fingerprints:
+            self._fingerprints[player] = get_bot_fingerprint(player)
+        return self._fingerprints[player]
+
+    def get_key(self, players, jury_state):
+        '''
+        Returns key of the game of `players` (in their order)
+        from `jury_state`. Players are identified by their names, the
+        fingerprint only tells whether the bot of the player changed, so
+        players with the same program don't share results.
+        '''
+        return (tuple((player._as_tuple(), self._get_bot_fingerprint(player))
+                      for player in players),
+                get_state_fingerprint(jury_state))
+
+    def get(self, key, players):
+        '''
+        Returns scores {player: score} of the game with `key`
+        or None if it wasn't played.
+        '''
+        with self._lock:
+            scores = self._results.get(key)
+            if scores is None:
+                return None
+            self.reused_count += 1
+        return dict(zip(players, scores))
+
+    def add(self, key, players, scores):
+        with self._lock:
+            self._results[key] = [scores[player] for player in players]
+
+    def get_start_positions(self, round_id, players_count, generate):
+        '''
+        Returns start positions of the round `round_id` of the previous
+        run, or the ones returned by `generate()` which are stored for
+        the next runs.
+        '''
+        key = (round_id, players_count)
+        with self._lock:
+            if key not in self._positions:
+                self._positions[key] = generate()
+            return self._positions[key]
+
+    def save(self):
+        os.makedirs(os.path.dirname(self._path) or '.', exist_ok=True)
+        with self._lock, open(self._path, 'wb') as results_file:
+            pickle.dump((self._results, self._positions), results_file)
+        logger.info('saved %d results, %d of them reused',
+                    len(self._results), self.reused_count)
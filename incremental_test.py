@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+from incremental import IncrementalResults, get_bot_fingerprint, \
+    get_state_fingerprint
+from player import Player
+
+
+class IncrementalTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+        self.bot_path = os.path.join(self._directory.name, 'bot.py')
+        self._write_bot('print(1)')
+        self.path = os.path.join(self._directory.name, 'logs', 'game.results')
+        self.players = [Player('python3 ' + self.bot_path, 'A', 'a'),
+                        Player('inprocess:games/nim/bots/ideal_bot.py',
+                               'B', 'b')]
+
+    def _write_bot(self, source):
+        with open(self.bot_path, 'w') as bot_file:
+            bot_file.write(source)
+
+    def test_bot_fingerprint(self):
+        fingerprint = get_bot_fingerprint(self.players[0])
+        self.assertEqual(get_bot_fingerprint(self.players[0]), fingerprint)
+        self._write_bot('print(2)')
+        self.assertNotEqual(get_bot_fingerprint(self.players[0]),
+                            fingerprint)
+        self.assertNotEqual(get_bot_fingerprint(Player('python3 bot.py')),
+                            get_bot_fingerprint(Player('python bot.py')))
+
+    def test_state_fingerprint(self):
+        self.assertEqual(get_state_fingerprint([1, [2, 3]]),
+                         get_state_fingerprint([1, [2, 3]]))
+        self.assertNotEqual(get_state_fingerprint([1, [2, 3]]),
+                            get_state_fingerprint([1, [3, 2]]))
+
+    def test_reuse(self):
+        results = IncrementalResults(self.path)
+        key = results.get_key(self.players, [3, 5, 7])
+        self.assertIsNone(results.get(key, self.players))
+        results.add(key, self.players, {self.players[0]: 0,
+                                        self.players[1]: 1})
+        positions = results.get_start_positions(0, 2, lambda: [[3, 5, 7]])
+        results.save()
+
+        results = IncrementalResults(self.path)
+        self.assertEqual(results.get_start_positions(0, 2, lambda: None),
+                         positions)
+        self.assertEqual(results.get(key, self.players),
+                         {self.players[0]: 0, self.players[1]: 1})
+        self.assertEqual(results.reused_count, 1)
+        self.assertIsNone(results.get(
+            results.get_key(self.players, [3, 5, 8]), self.players))
+
+        self._write_bot('print(2)')
+        results = IncrementalResults(self.path)
+        self.assertIsNone(results.get(
+            results.get_key(self.players, [3, 5, 7]), self.players))
+
+    def test_same_program(self):
+        command_line = 'python3 ' + self.bot_path
+        first = [Player(command_line, 'A', 'a'),
+                 Player(command_line, 'B', 'b')]
+        second = [Player(command_line, 'C', 'c'),
+                  Player(command_line, 'D', 'd')]
+        results = IncrementalResults(self.path)
+        key = results.get_key(first, [3, 5, 7])
+        results.add(key, first, {first[0]: 1, first[1]: 0})
+        self.assertNotEqual(results.get_key(second, [3, 5, 7]), key)
+        self.assertIsNone(results.get(results.get_key(second, [3, 5, 7]),
+                                      second))
+        self.assertEqual(results.get(results.get_key(first, [3, 5, 7]),
+                                     first), {first[0]: 1, first[1]: 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
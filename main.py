@@ -22,7 +22,9 @@ if __name__ == '__main__':
 Framework runs game, placed in "game_path".
 Players in this tournament read from file
 "players_config" file, placed in "game_path"
-path. Other settings of tournament should be written
+path. Trusted Python bots may be run inside the
+referee with the command line "inprocess:path/to/bot.py".
+Other settings of tournament should be written
 in file "config.py", placed in "game_path".''')
     arg_parser.add_argument(
         'game_path',
@@ -33,6 +35,13 @@ in file "config.py", placed in "game_path".''')
         help='''
 Tournament id which is used for saving logs,
 if you don't set tournament id it will be least non-used one'''
+    )
+    arg_parser.add_argument(
+        '--incremental', action='store_true',
+        help='''
+Reuse results of the previous runs for the games whose bots (command
+lines and files) and start positions haven't changed, play only the
+games of new or changed bots'''
     )
     args = arg_parser.parse_args()
     '''
@@ -44,14 +53,16 @@ import config
 
 from tournament_stages.tournament import Tournament
 from utils import print_tournament_system_results
+from incremental import IncrementalResults
 import bot
 
 
 class Main:
-    def __init__(self, game_path, tournament_id):
+    def __init__(self, game_path, tournament_id, incremental=False):
         self._game_path = game_path
         self._players_list = None
         self._tournament_id = tournament_id
+        self._incremental = incremental
         self.tournament = None
 
     def _load_players(self):
@@ -69,11 +80,23 @@ class Main:
         '''
         Run tournament and get it's results
         '''
+        incremental_results = None
+        if self._incremental:
+            incremental_results = IncrementalResults(
+                self._get_incremental_results_path())
         self.tournament = Tournament(self._players_list,
-                                     self._tournament_id)
+                                     self._tournament_id,
+                                     incremental_results)
         self.tournament.run()
         self.tournament_results = self.tournament.get_results()
 
+    def _get_incremental_results_path(self):
+        '''
+        Results of previous runs are stored in logs, one file per game.
+        '''
+        game_name = os.path.basename(os.path.normpath(self._game_path))
+        return os.path.join('logs', game_name + '.results')
+
     def show_result(self):
         return self.tournament_results
 
@@ -103,5 +126,5 @@ class Main:
             pass
 
 if __name__ == '__main__':
-    main = Main(args.game_path, args.tournament_id)
+    main = Main(args.game_path, args.tournament_id, args.incremental)
     main.main()
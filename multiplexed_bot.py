@@ -0,0 +1,225 @@
+'''
+Multiplexed bot protocol: one bot process plays many games at once.
+
+A player opts in with the command line `multiplexed:<command>` in
+`players_config`. The bot process is shared by all games of the player.
+Every line sent to the bot is prefixed with the id of the game and a
+space, and every line of the bot's answer must be prefixed in the same
+way. When a game ends, the bot receives the line `<game id> END` and may
+forget the game. Ids of finished games aren't reused.
+
+Example of the dialogue for nim:
+    > 0 3 5 7
+    > 1 1 2
+    < 1 1 1
+    < 0 0 1
+    > 1 END
+'''
+import queue
+import threading
+from io import BytesIO
+from subprocess import PIPE, Popen
+from log import logger
+from reaper import reaper
+import bot
+
+
+MULTIPLEXED_PREFIX = 'multiplexed:'
+END_OF_GAME = b'END'
+
+
+class _ChannelStream:
+    '''
+    Readable stream of the lines the bot sent for one game.
+    '''
+    def __init__(self):
+        self._lines = queue.Queue()
+
+    def put(self, line):
+        self._lines.put(line)
+
+    def readline(self):
+        '''
+        Blocks until the next line arrives. Returns b'' if the game
+        is closed or the bot's process exited.
+        '''
+        line = self._lines.get()
+        if not line:
+            # Let following reads see the end of stream too
+            self._lines.put(line)
+        return line
+
+
+class MultiplexedProcess:
+    '''
+    Bot's process shared by many games.
+    Usage:
+        >> process = MultiplexedProcess('python3 bot.py')
+        >> game_id, stream = process.open_channel()
+        >> process.send(game_id, b'3 5 7\n')
+        >> stream.readline()
+        b'0 1\n'
+        >> process.close_channel(game_id)
+        >> process.kill()
+    '''
+    def __init__(self, command):
+        self._command = command
+        self._process = None
+        self._channels = {}
+        self._next_game_id = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def is_running(self):
+        return self._process is not None and self._process.poll() is None
+
+    def _start(self):
+        '''
+        Starts bot's process and thread reading its output.
+        '''
+        logger.info('executing multiplexed \'%s\'', self._command)
+        try:
+            self._process = Popen(self._command.split(),
+                                  stdin=PIPE, stdout=PIPE)
+        except OSError:
+            logger.critical('executing of \'%s\' failed: invalid command',
+                            self._command)
+            raise bot.ExecuteError
+        threading.Thread(target=self._read, args=(self._process,),
+                         daemon=True).start()
+
+    def _read(self, process):
+        '''
+        Dispatches lines of bot's output to the games.
+        '''
+        for line in process.stdout:
+            game_id, _, payload = line.partition(b' ')
+            try:
+                stream = self._channels.get(int(game_id))
+            except ValueError:
+                stream = None
+            if stream is None:
+                logger.error('multiplexed bot \'%s\' wrote line for '
+                             'unknown game: %r', self._command, line)
+            else:
+                stream.put(payload)
+        with self._lock:
+            for stream in self._channels.values():
+                stream.put(b'')
+
+    def open_channel(self):
+        '''
+        Registers a new game, starts bot's process if it isn't running.
+        Returns id of the game and stream of bot's answers.
+        '''
+        with self._lock:
+            if not self.is_running():
+                self._start()
+            game_id = self._next_game_id
+            self._next_game_id += 1
+            self._channels[game_id] = _ChannelStream()
+            return game_id, self._channels[game_id]
+
+    def send(self, game_id, data):
+        '''
+        Sends `data` (bytes) of the game `game_id` to the bot,
+        each line is prefixed with the id.
+        '''
+        prefix = str(game_id).encode() + b' '
+        lines = data.splitlines(keepends=True)
+        if lines and not lines[-1].endswith(b'\n'):
+            lines[-1] += b'\n'
+        with self._write_lock:
+            self._process.stdin.write(b''.join(prefix + line
+                                               for line in lines))
+            self._process.stdin.flush()
+
+    def close_channel(self, game_id):
+        '''
+        Tells the bot that the game `game_id` is over.
+        '''
+        with self._lock:
+            stream = self._channels.pop(game_id, None)
+        if stream is not None:
+            stream.put(b'')
+        try:
+            self.send(game_id, END_OF_GAME)
+        except (OSError, ValueError):
+            pass
+
+    def kill(self):
+        '''
+        Kills bot's process.
+        '''
+        if self._process is None:
+            return
+        try:
+            self._process.kill()
+        except OSError:
+            pass
+        reaper.reap(self._process)
+        self._process = None
+
+
+_processes = {}
+_processes_lock = threading.Lock()
+
+
+def get_process(command):
+    '''
+    Returns MultiplexedProcess shared by all games of `command`.
+    '''
+    with _processes_lock:
+        if command not in _processes:
+            _processes[command] = MultiplexedProcess(command)
+        return _processes[command]
+
+
+def shutdown():
+    '''
+    Kills all shared processes.
+    '''
+    with _processes_lock:
+        for process in _processes.values():
+            process.kill()
+        _processes.clear()
+
+
+class ChannelBot(bot.WaitingBot):
+    '''
+    Bot of one game which talks to a shared MultiplexedProcess.
+    Time limit exceeded in one game doesn't kill the process,
+    only the game's channel is closed.
+    '''
+    def __init__(self, player_command):
+        super().__init__(player_command)
+        self._command = player_command[len(MULTIPLEXED_PREFIX):].strip()
+
+    def create_process(self):
+        '''
+        Opens a channel of the shared process.
+        '''
+        self._process = get_process(self._command)
+        self._game_id, self._stream = self._process.open_channel()
+        self._is_killed = False
+        self._is_reaped = False
+        logger.info('opened game %d of multiplexed \'%s\'',
+                    self._game_id, self._command)
+
+    def wait_ready(self):
+        '''
+        Shared process isn't asked to report readiness for every game.
+        '''
+        pass
+
+    def _get_move(self, player_state, serialize, deserialize):
+        try:
+            buffer = BytesIO()
+            serialize(player_state, buffer)
+            self._process.send(self._game_id, buffer.getvalue())
+            self._deserialize_result = deserialize(self._stream)
+        except (BaseException, Exception) as exc:
+            self._get_move_exception = exc
+
+    def _stop(self):
+        self._process.close_channel(self._game_id)
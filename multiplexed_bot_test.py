@@ -0,0 +1,65 @@
+import sys
+
+GAME_PATH = 'games/pepelac'
+
+import config_helpers
+config_helpers.initialize_game_environment(GAME_PATH)
+import unittest
+import bot
+import multiplexed_bot
+from multiplexed_bot import MultiplexedProcess, ChannelBot
+
+
+BOT_COMMAND = sys.executable + ' games/nim/bots/multiplexed_ideal_bot.py'
+
+
+def serialize(heap_sizes, stream):
+    stream.write((' '.join(map(str, heap_sizes)) + '\n').encode())
+    stream.flush()
+
+
+def deserialize(stream):
+    return tuple(int(n) for n in stream.readline().decode().split())
+
+
+class MultiplexedProcessTest(unittest.TestCase):
+    def test_channels(self):
+        process = MultiplexedProcess(BOT_COMMAND)
+        first_id, first_stream = process.open_channel()
+        second_id, second_stream = process.open_channel()
+        self.assertNotEqual(first_id, second_id)
+        process.send(second_id, b'0 2')
+        process.send(first_id, b'3 0')
+        self.assertEqual(first_stream.readline(), b'0 3\n')
+        self.assertEqual(second_stream.readline(), b'1 2\n')
+        process.close_channel(first_id)
+        self.assertEqual(first_stream.readline(), b'')
+        process.kill()
+
+
+class ChannelBotTest(unittest.TestCase):
+    def tearDown(self):
+        multiplexed_bot.shutdown()
+
+    def test_create_bot(self):
+        test_bot = bot.create_bot(multiplexed_bot.MULTIPLEXED_PREFIX +
+                                  BOT_COMMAND)
+        self.assertIsInstance(test_bot, ChannelBot)
+
+    def test_bots_share_process(self):
+        bots = [ChannelBot(multiplexed_bot.MULTIPLEXED_PREFIX + BOT_COMMAND)
+                for i in range(3)]
+        for test_bot in bots:
+            test_bot.create_process()
+        self.assertEqual(len(set(id(test_bot._process)
+                                 for test_bot in bots)), 1)
+        for test_bot in bots:
+            self.assertEqual(test_bot.get_move([0, 5], serialize,
+                                               deserialize), (1, 5))
+            test_bot.kill_process()
+        with self.assertRaises(bot.ProcessNotRunningException):
+            bots[0].get_move([0, 5], serialize, deserialize)
+
+
+if __name__ == '__main__':
+    unittest.main()
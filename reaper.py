@@ -0,0 +1,93 @@
+import os
+import queue
+import threading
+from log import logger
+
+
+class Reaper:
+    '''
+    Collects exit status and resource usage of killed bot processes
+    in a background thread, so killing a bot doesn't block the game.
+    Usage:
+        >> process.kill()
+        >> reaper.reap(process, callback)
+    Examples:
+    # `callback(exit_status, resource_usage)` is invoked from the
+    # reaper's thread, `resource_usage` is a dict with 'utime', 'stime'
+    # (seconds) and 'maxrss' (kilobytes) or None if it is unavailable.
+    # Waiting until all queued processes are reaped
+    >> reaper.wait_all()
+    '''
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        '''
+        Starts reaper's thread if it isn't running yet.
+        '''
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                daemon=True)
+                self._thread.start()
+
+    def reap(self, process, callback=None):
+        '''
+        Queues already killed `process` to be reaped.
+        '''
+        self._start()
+        self._queue.put((process, callback))
+
+    def wait_all(self):
+        '''
+        Blocks until all queued processes are reaped.
+        '''
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            process, callback = self._queue.get()
+            try:
+                exit_status, resource_usage = self._wait(process)
+                self._close_pipes(process)
+                if callback is not None:
+                    callback(exit_status, resource_usage)
+            except Exception:
+                logger.exception('reaping of process %d failed', process.pid)
+            finally:
+                self._queue.task_done()
+
+    def _wait(self, process):
+        '''
+        Waits for `process` and returns its exit status
+        and resource usage.
+        '''
+        if not hasattr(os, 'wait4'):
+            process.wait()
+            return process.returncode, None
+        try:
+            pid, status, rusage = os.wait4(process.pid, 0)
+        except ChildProcessError:
+            # Somebody has already waited for the process
+            return process.returncode, None
+        # Negative signal number, like Popen.returncode
+        exit_status = os.waitstatus_to_exitcode(status)
+        resource_usage = {
+            'utime': rusage.ru_utime,
+            'stime': rusage.ru_stime,
+            'maxrss': rusage.ru_maxrss,
+        }
+        return exit_status, resource_usage
+
+    def _close_pipes(self, process):
+        for stream in (process.stdin, process.stdout, process.stderr):
+            if stream is not None:
+                try:
+                    stream.close()
+                except OSError:
+                    pass
+
+
+reaper = Reaper()
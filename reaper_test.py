@@ -0,0 +1,29 @@
+import sys
+import unittest
+from subprocess import PIPE, Popen
+from unittest.mock import Mock
+from reaper import Reaper
+
+
+PLAYER_COMMAND = [sys.executable, 'test_game.py']
+
+
+class ReaperTest(unittest.TestCase):
+    def test_reap(self):
+        reaper = Reaper()
+        callback = Mock()
+        process = Popen(PLAYER_COMMAND, stdin=PIPE, stdout=PIPE)
+        process.kill()
+        reaper.reap(process, callback)
+        reaper.wait_all()
+        ((exit_status, resource_usage), _) = callback.call_args
+        self.assertNotEqual(exit_status, 0)
+        self.assertTrue(process.stdout.closed)
+
+    def test_wait_all_without_processes(self):
+        reaper = Reaper()
+        reaper.wait_all()
+
+
+if __name__ == '__main__':
+    unittest.main()
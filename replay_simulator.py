@@ -0,0 +1,205 @@
+import copy
+import pickle
+from io import BytesIO
+from game_controller import GameController, GameTimeLimitException, \
+    get_adjudicated_scores
+from log import logger
+import config
+
+
+class ReplayMismatchException(Exception):
+    pass
+
+
+class _RecordingStream:
+    '''
+    Readable stream which remembers all bytes read from `stream`.
+    '''
+    def __init__(self, stream):
+        self._stream = stream
+        self.data = b''
+
+    def readline(self, *args):
+        line = self._stream.readline(*args)
+        self.data += line
+        return line
+
+    def read(self, *args):
+        data = self._stream.read(*args)
+        self.data += data
+        return data
+
+
+class ReplyRecorder:
+    '''
+    Records raw replies of bots during the game.
+    Usage:
+        >> recorder = ReplyRecorder(players)
+        >> reply = recorder.start(player, deserialize)
+        >> move = bot.get_move(player_state, serialize, reply.deserialize)
+        >> recorder.finish(reply)  # or recorder.finish(reply, exception)
+    Examples:
+    # Replies in the order of moves: tuples (player index, bytes, error),
+    # `error` is the exception raised by bot outside of deserialization
+    >> recorder.replies
+    [(0, b'1 2\n', None), (1, b'', TimeLimitException())]
+    '''
+    def __init__(self, players):
+        self._players = players
+        self.replies = []
+
+    def start(self, player, deserialize):
+        return _Reply(self._players.index(player), deserialize)
+
+    def finish(self, reply, exception=None):
+        if reply.is_deserialized:
+            # Deserializer will raise the same exception on replay
+            exception = None
+        self.replies.append((reply.player_index, reply.data, exception))
+
+
+class _Reply:
+    def __init__(self, player_index, deserialize):
+        self.player_index = player_index
+        self._deserialize = deserialize
+        self._stream = None
+        self.is_deserialized = False
+
+    @property
+    def data(self):
+        return b'' if self._stream is None else self._stream.data
+
+    def deserialize(self, stream):
+        self._stream = _RecordingStream(stream)
+        try:
+            return self._deserialize(self._stream)
+        finally:
+            self.is_deserialized = True
+
+
+class Replay:
+    '''
+    Everything needed to re-simulate a game: signature (its seed
+    regenerates the start state), players, bots' replies, number of
+    ticks, whether the game was adjudicated and the number of replies
+    after which the game was stopped inside a tick (if it was).
+    '''
+    def __init__(self, signature, players, replies, ticks,
+                 is_adjudicated=False, scores=None, interrupted_reply=None):
+        self.signature = copy.copy(signature)
+        self.players = players
+        self.replies = replies
+        self.ticks = ticks
+        self.is_adjudicated = is_adjudicated
+        self.scores = scores
+        self.interrupted_reply = interrupted_reply
+
+    @classmethod
+    def from_controller(cls, game_controller):
+        return cls(game_controller.signature, game_controller.get_players(),
+                   game_controller.replies, game_controller.ticks,
+                   game_controller.is_adjudicated,
+                   game_controller.get_scores(),
+                   getattr(game_controller, 'interrupted_reply', None))
+
+    def save(self, path):
+        with open(path, 'wb') as replay_file:
+            pickle.dump(self, replay_file)
+
+
+def load_replay(path):
+    with open(path, 'rb') as replay_file:
+        return pickle.load(replay_file)
+
+
+class ReplaySimulator:
+    '''
+    Re-simulates recorded game with unchanged GameMaster of the game
+    config, feeding it bots' replies instead of running bots.
+    Usage:
+        >> replay = load_replay('logs/tournament1/0-0-0.replay')
+        >> game_controller = ReplaySimulator(replay).play()
+        >> game_controller.jury_states  # full history of the game
+    '''
+    def __init__(self, replay, start_state=None):
+        '''
+        `start_state` is regenerated from the seed of replay's
+        signature if it isn't given.
+        '''
+        self._replay = replay
+        if start_state is None:
+            start_state = self._generate_start_state()
+        self._replies = iter(replay.replies)
+        self._replies_count = 0
+        self._game_controller = GameController(
+            replay.players, replay.signature, start_state, self)
+
+    def _generate_start_state(self):
+        '''
+        Generates start positions of the round like Round does and
+        returns the one of the game.
+        '''
+        positions = list(config.Generator().generate_start_positions(
+            self._replay.signature, len(self._replay.players)))
+        game_id = self._replay.signature.game_id or 0
+        return positions[game_id % len(positions)]
+
+    def play(self):
+        '''
+        Plays the game and returns GameController with all jury states.
+        The game stopped inside a tick is stopped after the same reply.
+        '''
+        start_state = copy.deepcopy(self._game_controller.jury_states[0])
+        game_master = config.GameMaster(self, start_state)
+        ticks = 0
+        interrupted = getattr(self._replay, 'interrupted_reply', None)
+        while not self._game_controller.is_finished:
+            if (self._replay.is_adjudicated and interrupted is None and
+                    ticks >= self._replay.ticks):
+                self._adjudicate(game_master)
+                break
+            try:
+                game_master.tick(
+                    copy.deepcopy(self._game_controller.jury_states[-1]))
+            except GameTimeLimitException:
+                self._adjudicate(game_master)
+                break
+            ticks += 1
+        logger.info('game replayed in %d ticks', ticks)
+        return self._game_controller
+
+    def _adjudicate(self, game_master):
+        jury_state = copy.deepcopy(self._game_controller.jury_states[-1])
+        self.finish_game(get_adjudicated_scores(game_master, jury_state,
+                                                self.get_players()))
+        self._game_controller.is_adjudicated = True
+
+    def get_players(self):
+        return self._game_controller.get_players()
+
+    def get_move(self, player, player_state, serializer, deserializer):
+        '''
+        Returns move from the recorded reply of `player`,
+        re-raises recorded bot's error.
+        '''
+        if self._replies_count == getattr(self._replay, 'interrupted_reply',
+                                          None):
+            raise GameTimeLimitException()
+        self._replies_count += 1
+        try:
+            player_index, data, error = next(self._replies)
+        except StopIteration:
+            raise ReplayMismatchException('no more recorded replies')
+        if self.get_players()[player_index] != player:
+            raise ReplayMismatchException(
+                'recorded reply of another player')
+        if error is not None:
+            raise error
+        return deserializer(BytesIO(data))
+
+    def report_state(self, jury_state):
+        self._game_controller.jury_states.append(copy.deepcopy(jury_state))
+
+    def finish_game(self, scores):
+        self._game_controller.is_finished = True
+        self._game_controller._scores = scores
@@ -0,0 +1,114 @@
+GAME_PATH = 'games/pepelac'
+import config_helpers
+config_helpers.initialize_game_environment(GAME_PATH)
+
+import copy
+import os
+import pickle
+import tempfile
+import unittest
+from unittest.mock import patch
+import bot
+import config
+import player
+from game_simulator import GameSimulator
+from replay_simulator import Replay, ReplaySimulator, load_replay
+from tournament_stages.game_signature import GameSignature
+
+BOTS = ['inprocess:games/pepelac/bots/tompe_bot.py',
+        'inprocess:games/pepelac/bots/kamikadze.py']
+
+
+class ReplaySimulatorTest(unittest.TestCase):
+    def setUp(self):
+        self.players = [player.Player(command, 'author', 'bot {0}'.format(i))
+                        for i, command in enumerate(BOTS)]
+        self.signature = GameSignature(1, 2, 0, 0)
+
+    def _play(self):
+        start_state = next(config.Generator().generate_start_positions(
+            self.signature, len(self.players)))
+        with patch.object(config, 'record_replies', True, create=True):
+            simulator = GameSimulator(self.players, copy.deepcopy(start_state),
+                                      self.signature)
+            return start_state, simulator.play()
+
+    def _check_replay(self, controller, replayed):
+        self.assertEqual(replayed.get_scores(), controller.get_scores())
+        self.assertEqual(len(replayed.jury_states),
+                         len(controller.jury_states))
+        self.assertEqual(pickle.dumps(replayed.jury_states[-1].field),
+                         pickle.dumps(controller.jury_states[-1].field))
+
+    def test_replay(self):
+        start_state, controller = self._play()
+        self.assertTrue(controller.replies)
+        replay = Replay.from_controller(controller)
+        replayed = ReplaySimulator(replay, start_state).play()
+        self._check_replay(controller, replayed)
+
+    def test_regenerated_start_state(self):
+        start_state, controller = self._play()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'game.replay')
+            Replay.from_controller(controller).save(path)
+            replay = load_replay(path)
+        replayed = ReplaySimulator(replay).play()
+        self._check_replay(controller, replayed)
+
+    def test_time_limit(self):
+        get_move = bot.InProcessBot.get_move
+
+        def time_out_second(self, *args):
+            if self._bot_path == BOTS[1][len(bot.IN_PROCESS_PREFIX):]:
+                raise bot.TimeLimitException
+            return get_move(self, *args)
+
+        with patch.object(bot.InProcessBot, 'get_move', time_out_second):
+            start_state, controller = self._play()
+        errors = [error for _, _, error in controller.replies if error]
+        self.assertIsInstance(errors[0], bot.TimeLimitException)
+        saved = pickle.loads(pickle.dumps(controller))
+        self.assertIsInstance(saved.replies[1][2], bot.TimeLimitException)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'game.replay')
+            Replay.from_controller(controller).save(path)
+            replay = load_replay(path)
+        replayed = ReplaySimulator(replay).play()
+        self._check_replay(controller, replayed)
+    def test_adjudicated_without_hook(self):
+        game_master_class = config.GameMaster
+
+        class GameMaster:
+            '''Game master without `adjudicate`.'''
+            def __init__(self, simulator, start_state):
+                self._game_master = game_master_class(simulator, start_state)
+
+            def tick(self, jury_state):
+                self._game_master.tick(jury_state)
+
+        with patch.object(config, 'GameMaster', GameMaster), \
+                patch.object(config, 'max_ticks', 3, create=True):
+            start_state, controller = self._play()
+            replayed = ReplaySimulator(Replay.from_controller(controller),
+                                       start_state).play()
+        self.assertTrue(replayed.is_adjudicated)
+        self.assertEqual(set(replayed.get_scores().values()), {0})
+        self._check_replay(controller, replayed)
+
+    def test_interrupted_inside_tick(self):
+        # Time is checked at tick boundaries and before every move,
+        # it runs out before the second move of the first tick
+        is_cap_reached = iter([False] * 2 + [True] * 100)
+        with patch.object(GameSimulator, '_is_time_cap_reached',
+                          lambda *args: next(is_cap_reached)):
+            start_state, controller = self._play()
+        self.assertTrue(controller.is_adjudicated)
+        self.assertIsNotNone(controller.interrupted_reply)
+        replayed = ReplaySimulator(Replay.from_controller(controller),
+                                   start_state).play()
+        self._check_replay(controller, replayed)
+
+
+if __name__ == '__main__':
+    unittest.main()
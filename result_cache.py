@@ -0,0 +1,173 @@
+'''
+Content-addressed cache of game results for deterministic bots: the game
+of the same bots from the same start state with the same game code
+always ends with the same scores, so it is played only once.
+
+Key of the game is the hash of the game code (Python files of the game
+directory), fingerprints of bots (see incremental.py), hash of the start
+jury state and the tournament seed. Every entry is a file in the cache
+directory named by the key, it keeps scores of the game; copies of the
+logs of the game are kept next to it (`<key>.jstate`, `<key>.replay`), so
+they don't depend on logs of the tournament which played the game.
+Only games whose outcome doesn't depend on the environment are cached
+(see GameSimulator.is_reproducible).
+
+The cache is enabled by `cache_results = True` in game config, its
+directory is `results_cache_dir` ('cache/results' by default), entries
+are evicted when there are more than `results_cache_max_entries` of them
+(the oldest ones first) or they are older than
+`results_cache_max_age_seconds`.
+'''
+import glob
+import hashlib
+import os
+import pickle
+import shutil
+import threading
+import time
+from incremental import get_bot_fingerprint, get_state_fingerprint
+from log import logger
+
+
+def get_game_fingerprint(game_path):
+    '''
+    Returns hex digest of the Python files of the game directory.
+    '''
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(game_path, '*.py'))):
+        with open(path, 'rb') as game_file:
+            digest.update(os.path.basename(path).encode())
+            digest.update(hashlib.sha256(game_file.read()).digest())
+    return digest.hexdigest()
+
+
+class CachedResult:
+    '''
+    Entry of the cache: scores of players (in the order of the game)
+    and paths of the logs (.jstate and .replay files) of the game,
+    which are copied to the cache by ResultCache.put.
+    '''
+    def __init__(self, scores, log_paths):
+        self.scores = scores
+        self.log_paths = log_paths
+
+
+class ResultCache:
+    '''
+    Usage:
+        >> cache = ResultCache('cache/results', game_path='games/nim')
+        >> key = cache.get_key(players, jury_state, signature)
+        >> cache.get(key)  # None if the game wasn't played
+        <CachedResult>
+        >> cache.put(key, CachedResult([1, 0], ['logs/1/0-0-0.jstate']))
+        >> cache.get(key).log_paths
+        ['cache/results/<key>.jstate']
+    '''
+    def __init__(self, directory, game_path, max_entries=None, max_age=None):
+        self._directory = directory
+        self._game_fingerprint = get_game_fingerprint(game_path)
+        self._max_entries = max_entries
+        self._max_age = max_age
+        self._bot_fingerprints = {}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _get_bot_fingerprint(self, player):
+        if player not in self._bot_fingerprints:
+            self._bot_fingerprints[player] = get_bot_fingerprint(player)
+        return self._bot_fingerprints[player]
+
+    def get_key(self, players, jury_state, signature):
+        '''
+        Returns key of the game (hex digest), it should be computed
+        before the game changes `jury_state`.
+        '''
+        key = repr((self._game_fingerprint,
+                    [self._get_bot_fingerprint(player) for player in players],
+                    get_state_fingerprint(jury_state),
+                    getattr(signature, 'seed', None)))
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _get_path(self, key):
+        return os.path.join(self._directory, key + '.result')
+
+    def _is_expired(self, path):
+        return (self._max_age is not None and
+                time.time() - os.path.getmtime(path) > self._max_age)
+
+    def get(self, key):
+        '''
+        Returns CachedResult of the game or None.
+        '''
+        path = self._get_path(key)
+        with self._lock:
+            try:
+                if self._is_expired(path):
+                    self._remove(path)
+                    return None
+                with open(path, 'rb') as result_file:
+                    return pickle.load(result_file)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                return None
+
+    def put(self, key, result):
+        '''
+        Stores `result` with copies of its logs.
+        '''
+        with self._lock:
+            log_paths = []
+            for path in result.log_paths:
+                log_paths.append(os.path.join(
+                    self._directory, key + os.path.splitext(path)[1]))
+                shutil.copyfile(path, log_paths[-1])
+            with open(self._get_path(key), 'wb') as result_file:
+                pickle.dump(CachedResult(result.scores, log_paths),
+                            result_file)
+            self._evict()
+
+    def _remove(self, path):
+        '''
+        Removes the entry of the file `path` with its logs.
+        '''
+        prefix = glob.escape(os.path.splitext(path)[0])
+        for entry_path in glob.glob(prefix + '.*'):
+            os.remove(entry_path)
+
+    def _evict(self):
+        '''
+        Removes expired entries and the oldest ones
+        above `max_entries`.
+        '''
+        if self._max_entries is None and self._max_age is None:
+            return
+        paths = sorted(glob.glob(os.path.join(self._directory, '*.result')),
+                       key=os.path.getmtime)
+        for i, path in enumerate(paths):
+            over_limit = (self._max_entries is not None and
+                          len(paths) - i > self._max_entries)
+            if over_limit or self._is_expired(path):
+                self._remove(path)
+                logger.debug('evicted cached result %s', path)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    '''
+    Returns ResultCache of the game of config or None
+    if it isn't enabled.
+    '''
+    global _cache
+    import config
+    if not getattr(config, 'cache_results', False):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResultCache(
+                getattr(config, 'results_cache_dir', 'cache/results'),
+                os.path.dirname(os.path.abspath(config.__file__)),
+                getattr(config, 'results_cache_max_entries', None),
+                getattr(config, 'results_cache_max_age_seconds', None))
+        return _cache
@@ -0,0 +1,144 @@
+GAME_PATH = 'games/pepelac'
+import config_helpers
+config_helpers.initialize_game_environment(GAME_PATH)
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from player import Player
+from result_cache import CachedResult, ResultCache, get_game_fingerprint
+from tournament_stages.game_signature import GameSignature
+from tournament_stages import game
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+        self.game_path = os.path.join(self._directory.name, 'game')
+        os.makedirs(self.game_path)
+        self._write_game('GameMaster = None')
+        self.cache_path = os.path.join(self._directory.name, 'cache')
+        self.players = [Player('inprocess:games/nim/bots/ideal_bot.py'),
+                        Player('inprocess:games/nim/bots/idle_bot.py')]
+
+    def _write_game(self, source):
+        with open(os.path.join(self.game_path, 'config.py'), 'w') as file:
+            file.write(source)
+
+    def _write_log(self, path, data=b'log'):
+        path = os.path.join(self._directory.name, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as log_file:
+            log_file.write(data)
+        return path
+
+    def _get_cache(self, **kwargs):
+        return ResultCache(self.cache_path, self.game_path, **kwargs)
+
+    def test_game_fingerprint(self):
+        fingerprint = get_game_fingerprint(self.game_path)
+        self.assertEqual(get_game_fingerprint(self.game_path), fingerprint)
+        self._write_game('GameMaster = 1')
+        self.assertNotEqual(get_game_fingerprint(self.game_path),
+                            fingerprint)
+
+    def test_get_put(self):
+        cache = self._get_cache()
+        signature = GameSignature(1, 0, 0, 0)
+        key = cache.get_key(self.players, [3, 5, 7], signature)
+        self.assertIsNone(cache.get(key))
+        log_path = self._write_log('logs/0-0-0.jstate')
+        cache.put(key, CachedResult([1, 0], [log_path]))
+        # Logs of the tournament may be removed
+        os.remove(log_path)
+        result = self._get_cache().get(key)
+        self.assertEqual(result.scores, [1, 0])
+        self.assertEqual(result.log_paths,
+                         [os.path.join(self.cache_path, key + '.jstate')])
+        with open(result.log_paths[0], 'rb') as log_file:
+            self.assertEqual(log_file.read(), b'log')
+
+        # Other game, bots, start state or seed
+        self.assertNotEqual(cache.get_key(self.players[::-1], [3, 5, 7],
+                                          signature), key)
+        self.assertNotEqual(cache.get_key(self.players, [3, 5, 8],
+                                          signature), key)
+        signature.seed = 1
+        self.assertNotEqual(cache.get_key(self.players, [3, 5, 7],
+                                          signature), key)
+        signature.seed = None
+        self._write_game('GameMaster = 1')
+        self.assertNotEqual(self._get_cache().get_key(
+            self.players, [3, 5, 7], signature), key)
+
+    def test_max_entries(self):
+        cache = self._get_cache(max_entries=2)
+        for key in ['a', 'b', 'c']:
+            cache.put(key, CachedResult([0, 1], []))
+            # Entries differ in modification time
+            os.utime(cache._get_path(key), (time.time() - ord('z') +
+                                            ord(key),) * 2)
+        cache.put('d', CachedResult([0, 1], []))
+        self.assertEqual([cache.get(key) is None for key in 'abcd'],
+                         [True, True, False, False])
+
+    def test_max_age(self):
+        cache = self._get_cache(max_age=60)
+        cache.put('a', CachedResult([0, 1], [self._write_log('a.jstate')]))
+        self.assertIsNotNone(cache.get('a'))
+        os.utime(cache._get_path('a'), (time.time() - 120,) * 2)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(os.listdir(self.cache_path), [])
+
+    def _run_game(self, cache, tournament_id):
+        signature = GameSignature(tournament_id, 0, 0, 0)
+        log_path = os.path.join(self._directory.name,
+                                'tournament' + str(tournament_id),
+                                '0-0-0.jstate')
+        os.makedirs(os.path.dirname(log_path), exist_ok=True)
+        with patch.object(game, 'get_cache', return_value=cache), \
+                patch.object(game.Game, '_get_log_path',
+                             return_value=log_path), \
+                patch.object(game.Game, '_write_logs',
+                             side_effect=lambda: [self._write_log(log_path)]):
+            result = game.Game([3, 5, 7], signature, self.players)
+            result.run_engine()
+        return result, log_path
+
+    @patch.object(game, 'event_stream')
+    @patch.object(game, 'GameSimulator')
+    def test_game(self, mock_simulator, mock_events):
+        cache = self._get_cache()
+        mock_simulator().play().get_scores.return_value = {
+            self.players[0]: 1, self.players[1]: 0}
+        mock_simulator().is_reproducible.return_value = True
+        first, _ = self._run_game(cache, 1)
+        mock_simulator.reset_mock()
+        second, log_path = self._run_game(cache, 2)
+        mock_simulator.assert_not_called()
+        self.assertEqual(second.get_results(), first.get_results())
+        mock_events.emit.assert_called_once_with(
+            'game_finished', second.game_info,
+            scores={str(self.players[0]): 1, str(self.players[1]): 0},
+            cached=True)
+        # Logs are copied to the logs of the tournament
+        with open(log_path, 'rb') as log_file:
+            self.assertEqual(log_file.read(), b'log')
+
+    @patch.object(game, 'GameSimulator')
+    def test_game_not_reproducible(self, mock_simulator):
+        cache = self._get_cache()
+        mock_simulator().play().get_scores.return_value = {
+            self.players[0]: 1, self.players[1]: 0}
+        mock_simulator().is_reproducible.return_value = False
+        self._run_game(cache, 1)
+        mock_simulator.reset_mock()
+        second, _ = self._run_game(cache, 2)
+        mock_simulator.assert_called()
+        self.assertIsNone(second.cached_result)
+
+if __name__ == '__main__':
+    unittest.main()
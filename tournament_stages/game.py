@@ -3,48 +3,109 @@ import os
 import shutil
 from tournament_stages.game_signature import GameSignature
 from game_simulator import GameSimulator
+from replay_simulator import Replay
+from result_cache import CachedResult, get_cache
 from log import logger
+import event_stream
 
 
 class Game:
     '''Starts the game, writes logs and returns results of the game'''
 
-    def __init__(self, init_jury_state, game_info, players):
+    def __init__(self, init_jury_state, game_info, players,
+                 bot_health=None, spawner=None):
         self.jury_state = init_jury_state
         self.game_info = game_info
         self.result = dict()
         self.players = players
         self.game_controller = None
+        self.bot_health = bot_health
+        self.spawner = spawner
+        self.cached_result = None
 
-    def _write_logs(self):
-        '''writes the logs of the game'''
+    def _get_log_path(self):
         path = os.path.dirname(__file__)
         path = os.path.join(path,  '..', 'logs')
         path = os.path.normpath(path)
         path = os.path.join(path, 'tournament' +
                             str(self.game_info.tournament_id))
-        if (os.path.exists(path) == 0):
-            os.makedirs(path)
+        # Games of a round may run concurrently
+        os.makedirs(path, exist_ok=True)
         filename = str(self.game_info.round_id) + '-' +\
             str(self.game_info.series_id) + '-' +\
             str(self.game_info.game_id) + '.jstate'
-        path = os.path.join(path, filename)
+        return os.path.join(path, filename)
+
+    def _write_logs(self):
+        '''
+        writes the logs of the game, returns paths of the written files
+        '''
+        path = self._get_log_path()
         log_file = open(path, 'wb')
         pickle.dump(self.game_controller, log_file)
         log_file.close()
+        paths = [path]
+        if getattr(self.game_controller, 'replies', None) is not None:
+            replay_path = os.path.splitext(path)[0] + '.replay'
+            Replay.from_controller(self.game_controller).save(replay_path)
+            paths.append(replay_path)
+        return paths
+
+    def _copy_cached_logs(self, cached_result):
+        '''
+        Copies logs of the cached game to the logs of the game,
+        returns False if they can't be copied.
+        '''
+        path = os.path.splitext(self._get_log_path())[0]
+        try:
+            for cached_path in cached_result.log_paths:
+                shutil.copyfile(cached_path,
+                                path + os.path.splitext(cached_path)[1])
+        except OSError as exception:
+            logger.warning('logs of the cached game are lost: %s', exception)
+            return False
+        return True
 
     def run_engine(self):
-        '''launches the engine'''
+        '''
+        launches the engine, or takes results of the same game
+        from the results cache if it is enabled
+        '''
         logger.info('running game #%d', self.game_info.game_id)
+        cache = get_cache()
+        key = None
+        if cache is not None:
+            key = cache.get_key(self.players, self.jury_state, self.game_info)
+            self.cached_result = cache.get(key)
+            if (self.cached_result is not None and
+                    self._copy_cached_logs(self.cached_result)):
+                logger.info('game #%d is taken from cache',
+                            self.game_info.game_id)
+                event_stream.emit(
+                    'game_finished', self.game_info,
+                    scores={str(player): score for player, score
+                            in self.get_results().items()},
+                    cached=True)
+                if self.spawner is not None:
+                    self.spawner.release()
+                return
+            self.cached_result = None
         logger.info('launching engine')
         game_engine = GameSimulator(self.players, self.jury_state,
-                                    self.game_info)
+                                    self.game_info, self.bot_health,
+                                    self.spawner)
         logger.info('starting game')
         self.game_controller = game_engine.play()
         logger.info('writing logs')
         logger.info('game #%d finished', self.game_info.game_id)
-        self._write_logs()
+        log_paths = self._write_logs()
+        if key is not None and game_engine.is_reproducible():
+            scores = self.game_controller.get_scores()
+            cache.put(key, CachedResult(
+                [scores.get(player) for player in self.players], log_paths))
 
     def get_results(self):
         '''returns results of the game'''
+        if self.cached_result is not None:
+            return dict(zip(self.players, self.cached_result.scores))
         return self.game_controller.get_scores()
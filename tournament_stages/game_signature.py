@@ -1,6 +1,11 @@
+import hashlib
+
+
 class GameSignature:
 
     round_name = None
+    # Seed of the whole tournament (`random_seed` in config)
+    seed = None
 
     def __init__(self, tournament_id=None, round_id=None, series_id=None,
                  game_id=None):
@@ -9,12 +14,34 @@ class GameSignature:
         self.game_id = game_id
         self.tournament_id = tournament_id
 
+    def get_seed(self):
+        '''
+        Returns seed of start positions of the round. It depends only
+        on the tournament seed, tournament and round ids, so every
+        process generates the same positions for the round.
+        '''
+        key = repr((self.seed, self.tournament_id, self.round_id))
+        digest = hashlib.sha256(key.encode()).digest()
+        return int.from_bytes(digest[:8], 'big')
+
+    def get_key(self):
+        '''
+        Returns compact hashable key of the game:
+        tuple (tournament_id, round_id, series_id, game_id).
+        '''
+        return (self.tournament_id, self.round_id,
+                self.series_id, self.game_id)
+
     def __lt__(self, signature):
-        self_tuple = (self.tournament_id, self.round_id,
-                      self.series_id, self.game_id)
-        signature_tuple = (signature.tournament_id, signature.round_id,
-                           signature.series_id, signature.game_id)
-        return self_tuple < signature_tuple
+        return self.get_key() < signature.get_key()
+
+    def __eq__(self, signature):
+        if not isinstance(signature, GameSignature):
+            return NotImplemented
+        return self.get_key() == signature.get_key()
+
+    def __hash__(self):
+        return hash(self.get_key())
 
     def __repr__(self):
         if self.round_name is None:
@@ -0,0 +1,27 @@
+import unittest
+from tournament_stages.game_signature import GameSignature
+
+
+class GameSignatureTest(unittest.TestCase):
+    def test_seed(self):
+        signature = GameSignature(1, 2, 3, 4)
+        # Seed is the same for all games of the round
+        self.assertEqual(signature.get_seed(),
+                         GameSignature(1, 2, 5, 6).get_seed())
+        self.assertNotEqual(signature.get_seed(),
+                            GameSignature(1, 3, 3, 4).get_seed())
+        seeded = GameSignature(1, 2, 3, 4)
+        seeded.seed = 7
+        self.assertNotEqual(signature.get_seed(), seeded.get_seed())
+
+    def test_hash(self):
+        signature = GameSignature(1, 2, 3, 4)
+        other = GameSignature(1, 2, 3, 4)
+        other.round_name = 'final'
+        self.assertEqual(signature, other)
+        self.assertEqual({signature: 1}[other], 1)
+        self.assertNotEqual(signature, GameSignature(1, 2, 3, 5))
+        self.assertEqual(signature.get_key(), (1, 2, 3, 4))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,33 +1,107 @@
 import config
+import copy
 import tournament_stages.series as series
+from concurrent.futures import ThreadPoolExecutor
 from log import logger
 
 
 class Round:
     '''Manages and starts round'''
-    def __init__(self, players_list, game_info):
+    def __init__(self, players_list, game_info, bot_health=None,
+                 incremental_results=None):
+        '''
+        incremental_results - IncrementalResults of the previous runs
+        of the tournament, if it is incremental.
+        series_weights - {series_id: weight} of the series stopped early
+        (see Series.weight).
+        '''
         self._players_list = players_list
         self._jurystates_list = []
         self.games_results = {}
+        self.series_weights = {}
         self._game_info = game_info
+        self._bot_health = bot_health
+        self._incremental_results = incremental_results
         self._generate_series()
 
     def _generate_series(self):
-        '''Generates series for one round'''
-        self._jurystates_list = list(
-            config.Generator().generate_start_positions(self._game_info,
-                len(self._players_list[0])))
+        '''
+        Generates start positions of the round once, they are
+        seeded by the round's signature. Incremental tournament
+        reuses positions of the previous runs.
+        '''
+        players_count = len(self._players_list[0])
+
+        def generate():
+            return list(config.Generator().generate_start_positions(
+                self._game_info, players_count))
+        if self._incremental_results is None:
+            self._jurystates_list = generate()
+        else:
+            self._jurystates_list = \
+                self._incremental_results.get_start_positions(
+                    self._game_info.round_id, players_count, generate)
+
+    def get_start_positions(self):
+        '''
+        Returns copy of start positions of the round, so games
+        of different series (or workers) don't share jury states.
+        '''
+        return copy.deepcopy(self._jurystates_list)
 
     def run(self):
         '''Starts series of round'''
         logger.info('running round #{}'.format(self._game_info.round_id))
+        concurrent_games = getattr(config, 'concurrent_games', 1)
+        if concurrent_games > 1:
+            self._run_concurrently(concurrent_games)
+        else:
+            self._run_sequentially()
+        logger.info('running round #{}'.format(self._game_info.round_id))
 
+    def _run_sequentially(self):
+        '''Starts series one by one'''
+        spawner = None
         for series_id in range(len(self._players_list)):
             self._game_info.series_id = series_id
+            next_players_list = None
+            if series_id + 1 < len(self._players_list):
+                next_players_list = self._players_list[series_id + 1]
             self.series = series.Series(
-                initial_jurystates=self._jurystates_list,
+                initial_jurystates=self.get_start_positions(),
                 signature=self._game_info,
-                players_list=self._players_list[series_id])
+                players_list=self._players_list[series_id],
+                bot_health=self._bot_health,
+                spawner=spawner,
+                next_players_list=next_players_list,
+                incremental_results=self._incremental_results)
             self.series.run()
-            self.games_results.update(self.series.get_results())
-        logger.info('running round #{}'.format(self._game_info.round_id))
+            spawner = self.series.next_spawner
+            self._add_series_results(series_id, self.series)
+
+    def _run_concurrently(self, concurrent_games):
+        '''
+        Starts up to `concurrent_games` series at once, each in its own
+        thread. Bots are not pre-spawned in this mode.
+        '''
+        all_series = []
+        for series_id, players_list in enumerate(self._players_list):
+            signature = copy.copy(self._game_info)
+            signature.series_id = series_id
+            all_series.append(series.Series(
+                initial_jurystates=self.get_start_positions(),
+                signature=signature,
+                players_list=players_list,
+                bot_health=self._bot_health,
+                incremental_results=self._incremental_results))
+        with ThreadPoolExecutor(max_workers=concurrent_games) as executor:
+            # list() re-raises exceptions of the series
+            list(executor.map(lambda _series: _series.run(), all_series))
+        for series_id, self.series in enumerate(all_series):
+            self._add_series_results(series_id, self.series)
+
+    def _add_series_results(self, series_id, _series):
+        '''Adds results and weight of the finished series'''
+        self.games_results.update(_series.get_results())
+        if _series.weight != 1:
+            self.series_weights[series_id] = _series.weight
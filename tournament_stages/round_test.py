@@ -23,10 +23,21 @@ class RoundTest(unittest.TestCase):
             test_round._generate_series()
             self.assertEqual(test_round._jurystates_list[0], 42)
 
+    def test_get_start_positions(self):
+        with patch('config.Generator') as Generator:
+            Generator().generate_start_positions.return_value = [[42]]
+            test_round = Round(players_list=[[1, 2]],
+                               game_info=Mock())
+        positions = test_round.get_start_positions()
+        self.assertEqual(positions, [[42]])
+        positions[0].append(43)
+        self.assertEqual(test_round.get_start_positions(), [[42]])
+
     def test_run(self):
         with patch('config.Generator') as Generator:
             series.Series = Mock()
             series.Series().get_results.return_value = {'aba': 'caba'}
+            series.Series().weight = 2
             test_round = Round(players_list=[[1, 2]],
                                game_info=Mock())
             test_round._jurystates_list = [Mock()]
@@ -34,6 +45,7 @@ class RoundTest(unittest.TestCase):
             # logger = Mock()
             test_round.run()
             self.assertEqual(test_round.games_results, {'aba': 'caba'})
+            self.assertEqual(test_round.series_weights, {0: 2})
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,38 @@
 from tournament_stages.exceptions import NoResultsException
 from tournament_stages.game import Game
+from bot_spawner import BotSpawner
 from copy import copy
+from math import log
 from log import logger
+import event_stream
+
+
+def get_winner(points):
+    '''
+    Returns the only player with maximal score of the game or None.
+    '''
+    best = max(points.values())
+    winners = [player for player, score in points.items() if score == best]
+    return winners[0] if len(winners) == 1 else None
+
+
+def is_series_decided(wins, games_left, confidence, dominance=0.8):
+    '''
+    Sequential probability ratio test of the series. `wins` is dict
+    {player: number of won games}. Returns True if the leader can't be
+    caught in `games_left` games, or if the hypothesis that the leader
+    wins with probability `dominance` against the runner-up is accepted
+    against the hypothesis that they are equal, with error
+    probabilities of 1 - `confidence`.
+    '''
+    counts = sorted(wins.values(), reverse=True) + [0, 0]
+    leader, runner_up = counts[0], counts[1]
+    if leader - runner_up > games_left:
+        return True
+    error = 1 - confidence
+    likelihood_ratio = (leader * log(2 * dominance) +
+                        runner_up * log(2 * (1 - dominance)))
+    return likelihood_ratio >= log((1 - error) / error)
 
 
 class Series:
@@ -9,28 +40,136 @@ class Series:
     Series - a collection games of one round of involving the same members.
     '''
 
-    def __init__(self, initial_jurystates, signature, players_list):
+    def __init__(self, initial_jurystates, signature, players_list,
+                 bot_health=None, spawner=None, next_players_list=None,
+                 incremental_results=None):
         '''
         initial_jurystates_list - list of initial juristates.
+        bot_health - BotHealthTracker shared by the whole tournament.
+        spawner - BotSpawner with bots of the first game, if they were
+        started in advance.
+        next_players_list - players of the game which follows the series.
+        incremental_results - IncrementalResults of the previous runs,
+        games found there aren't played again.
+
+        If `prespawn_bots` is set in game config, bots of the next game
+        are started while the current game runs. BotSpawner for the game
+        after the series is stored in `next_spawner`.
+
+        If `series_confidence` is set in game config, the series stops
+        as soon as is_series_decided says its winner is known (with
+        `series_dominance` as the win rate of a dominating bot). Results
+        of the played games are kept as they are, `weight` of a stopped
+        series is the number of planned games per played game, so
+        tournament systems which add up points don't favour close series
+        over decided ones.
+        `max_series_games` limits number of games of the series.
         '''
         self._initial_jurystates = initial_jurystates
         self._signature = signature
         self._players_list = players_list
         self._results = None
+        self._bot_health = bot_health
+        self._spawner = spawner
+        self._next_players_list = next_players_list
+        self._incremental_results = incremental_results
+        self.next_spawner = None
+        self.weight = 1
 
     def run(self):
         '''
         Starts all games in series.
         '''
+        import config
         logger.info('running series #%d', self._signature.series_id)
         self._results = {}
+        self._initial_jurystates = self._initial_jurystates[
+            :getattr(config, 'max_series_games', None)]
+        confidence = getattr(config, 'series_confidence', None)
+        wins = {player: 0 for player in self._players_list}
+        spawner = self._spawner
         for game_id, initial_jurystate in enumerate(self._initial_jurystates):
             self._signature.game_id = game_id
-            _game = Game(initial_jurystate, self._signature,
-                         self._players_list)
-            _game.run_engine()
-            points = _game.get_results()
+            event_stream.emit('game_scheduled', self._signature,
+                              players=[str(player)
+                                       for player in self._players_list])
+            next_spawner = self._prespawn(game_id + 1)
+            key = self._get_key(initial_jurystate)
+            points = self._get_previous_results(key)
+            if points is None:
+                _game = Game(initial_jurystate, self._signature,
+                             self._players_list, self._bot_health, spawner)
+                try:
+                    _game.run_engine()
+                except:
+                    if next_spawner is not None:
+                        next_spawner.release()
+                    raise
+                points = _game.get_results()
+                if key is not None:
+                    self._incremental_results.add(key, self._players_list,
+                                                  points)
+            elif spawner is not None:
+                spawner.release()
+            spawner = next_spawner
             self._results[copy(self._signature)] = copy(points)
+            winner = get_winner(points) if points else None
+            if winner is not None:
+                wins[winner] = wins.get(winner, 0) + 1
+            games_left = len(self._initial_jurystates) - game_id - 1
+            if (confidence is not None and games_left and is_series_decided(
+                    wins, games_left, confidence,
+                    getattr(config, 'series_dominance', 0.8))):
+                logger.info('series #%d is decided after %d games',
+                            self._signature.series_id, game_id + 1)
+                if spawner is not None:
+                    # Bots of the next game of the series
+                    spawner.release()
+                    spawner = None
+                self.weight = len(self._initial_jurystates) / (game_id + 1)
+                break
+        self.next_spawner = spawner
+
+    def _get_key(self, initial_jurystate):
+        '''
+        Returns key of the game in incremental results (computed before
+        the game changes the jury state) or None.
+        '''
+        if self._incremental_results is None:
+            return None
+        return self._incremental_results.get_key(self._players_list,
+                                                 initial_jurystate)
+
+    def _get_previous_results(self, key):
+        '''
+        Returns results of the same game of the previous run of
+        incremental tournament or None.
+        '''
+        if key is None:
+            return None
+        points = self._incremental_results.get(key, self._players_list)
+        if points is not None:
+            logger.info('reusing results of game #%d',
+                        self._signature.game_id)
+            event_stream.emit('game_finished', self._signature,
+                              scores={str(player): score for player, score
+                                      in points.items()},
+                              reused=True)
+        return points
+
+    def _prespawn(self, game_id):
+        '''
+        Starts bots of the game `game_id` of the series (or of the game
+        after the series) in background. Returns BotSpawner or None.
+        '''
+        import config
+        if not getattr(config, 'prespawn_bots', False):
+            return None
+        if game_id < len(self._initial_jurystates):
+            return BotSpawner(self._players_list)
+        if self._next_players_list is not None:
+            return BotSpawner(self._next_players_list)
+        return None
 
     def get_results(self):
         '''
@@ -4,7 +4,8 @@ sys.path.append('/home/daniel/play/play/')
 import unittest
 from unittest.mock import Mock, patch
 from log import logger
-from tournament_stages.series import Series
+from tournament_stages.game_signature import GameSignature
+from tournament_stages.series import Series, is_series_decided
 
 
 class SeriesTest(unittest.TestCase):
@@ -27,6 +28,74 @@ class SeriesTest(unittest.TestCase):
         result = {signature: {'1': 123}}
         self.assertEqual(list(series1._results.values()), list(result.values()))
 
+    @patch('tournament_stages.series.BotSpawner')
+    @patch('tournament_stages.series.Game')
+    def test_prespawn(self, mock_game, mock_spawner):
+        logger.setLevel(10050000)
+        mock_game().get_results.return_value = {'1': 123}
+        series1 = Series([1, 2], Mock(), [1, 2], next_players_list=[3, 4])
+        config = Mock(prespawn_bots=True, max_series_games=None,
+                      series_confidence=None)
+        with patch.dict('sys.modules', {'config': config}):
+            series1.run()
+        self.assertEqual(mock_spawner.call_args_list[-1][0], ([3, 4],))
+        self.assertEqual(series1.next_spawner, mock_spawner())
+
+    @patch('tournament_stages.series.Game')
+    def test_early_stopping(self, mock_game):
+        logger.setLevel(10050000)
+        mock_game().get_results.return_value = {1: 10, 2: 0}
+        series1 = Series(list(range(20)), GameSignature(1, 0, 0), [1, 2])
+        config = Mock(prespawn_bots=False, max_series_games=None,
+                      series_confidence=0.95, series_dominance=0.8)
+        with patch.dict('sys.modules', {'config': config}):
+            series1.run()
+        results = series1.get_results()
+        self.assertEqual(len(results), 7)
+        # Results are kept as played, the weight covers 20 planned games
+        self.assertEqual(list(results.values()), [{1: 10, 2: 0}] * 7)
+        self.assertAlmostEqual(series1.weight, 20 / 7)
+
+    @patch('tournament_stages.series.Game')
+    def test_max_series_games(self, mock_game):
+        logger.setLevel(10050000)
+        mock_game().get_results.return_value = {1: 10, 2: 0}
+        series1 = Series(list(range(20)), GameSignature(1, 0, 0), [1, 2])
+        config = Mock(prespawn_bots=False, max_series_games=5,
+                      series_confidence=None)
+        with patch.dict('sys.modules', {'config': config}):
+            series1.run()
+        self.assertEqual(len(series1.get_results()), 5)
+
+    @patch('tournament_stages.series.event_stream')
+    @patch('tournament_stages.series.Game')
+    def test_incremental_results(self, mock_game, mock_events):
+        logger.setLevel(10050000)
+        mock_game().get_results.return_value = {1: 10, 2: 0}
+        incremental_results = Mock()
+        incremental_results.get.side_effect = [{1: 3, 2: 4}, None]
+        series1 = Series([1, 2], GameSignature(1, 0, 0), [1, 2],
+                         incremental_results=incremental_results)
+        config = Mock(prespawn_bots=False, max_series_games=None,
+                      series_confidence=None)
+        with patch.dict('sys.modules', {'config': config}):
+            series1.run()
+        self.assertEqual(list(series1.get_results().values()),
+                         [{1: 3, 2: 4}, {1: 10, 2: 0}])
+        incremental_results.add.assert_called_once_with(
+            incremental_results.get_key(), [1, 2], {1: 10, 2: 0})
+        mock_events.emit.assert_any_call(
+            'game_finished', series1._signature, scores={'1': 3, '2': 4},
+            reused=True)
+
+    def test_is_series_decided(self):
+        self.assertFalse(is_series_decided({1: 3, 2: 2}, 10, 0.95))
+        self.assertFalse(is_series_decided({1: 6, 2: 0}, 10, 0.95))
+        self.assertTrue(is_series_decided({1: 7, 2: 0}, 10, 0.95))
+        # Runner-up can't catch up
+        self.assertTrue(is_series_decided({1: 3, 2: 1}, 1, 0.95))
+        self.assertFalse(is_series_decided({1: 3, 2: 2}, 1, 0.95))
+
     def test_get_results(self):
         signature = Mock()
         series1 = Series([1], signature, [1, 2])
@@ -1,16 +1,30 @@
 from tournament_stages.round import Round
 from tournament_stages.game_signature import GameSignature
 from tournament_systems.tournament_system_factory import create
+from tournament_systems.results_store import create_results_store
 from tournament_stages.exceptions import NoResultsException
+from bot_health import BotHealthTracker
+import multiplexed_bot
+import event_stream
 from log import logger
+import config
 
 
 class Tournament:
-    def __init__(self, players_list, tournament_id):
+    def __init__(self, players_list, tournament_id, incremental_results=None):
+        '''
+        incremental_results - IncrementalResults of the previous runs,
+        they are updated and saved after the tournament.
+        '''
         self.players_list = players_list
         self.tournament_id = tournament_id
+        self.incremental_results = incremental_results
         self.results = None
         self.tournament_system = None
+        self.bot_health = None
+        max_failures = getattr(config, 'max_consecutive_failures', None)
+        if max_failures is not None:
+            self.bot_health = BotHealthTracker(max_failures)
 
     def run(self):
         '''
@@ -19,21 +33,49 @@ class Tournament:
         logger.info('running tournament #%d', self.tournament_id)
 
         game_signature = GameSignature(self.tournament_id)
+        game_signature.seed = getattr(config, 'random_seed', None)
+
+        self.tournament_system = create()(self.players_list,
+                                          create_results_store())
+        event_stream.open_stream(getattr(config, 'events_file', None),
+                                 getattr(config, 'events_socket', None))
+        try:
+            self._run_rounds(game_signature)
+        finally:
+            # Bots shared by games of the whole tournament
+            multiplexed_bot.shutdown()
+            event_stream.shutdown()
+            if self.incremental_results is not None:
+                self.incremental_results.save()
+        self.results = self.tournament_system.get_all_results()
+        if self.bot_health is not None:
+            for signature, player in self.bot_health.get_forfeits():
+                logger.info('%s forfeited %s', player, signature)
+        logger.info('tournament #%d finished', self.tournament_id)
 
-        self.tournament_system = create()(self.players_list)
+    def _run_rounds(self, game_signature):
+        '''
+        Runs all rounds of the tournament system.
+        '''
+        # Names are planned once, they are None if our tournament
+        # doesn't give names to rounds or number of rounds isn't known
+        round_names = self.tournament_system.get_round_names()
         for round_id, players in enumerate(self.tournament_system.get_rounds()):
             game_signature.round_id = round_id
-            # If our tournament can give names to rounds, e.g. olympic,
-            # we should also assign a name to the round. But it is also
-            # possible, that get_round_name returns None.
-            game_signature.round_name = self.tournament_system.get_round_name(
-                round_id, len(list(self.tournament_system.get_rounds())))
-            _round = Round(list(players), game_signature)
+            game_signature.round_name = None
+            if round_names is not None and round_id < len(round_names):
+                game_signature.round_name = round_names[round_id]
+            _round = Round(list(players), game_signature, self.bot_health,
+                           self.incremental_results)
             _round.run()
             _round_results = _round.games_results
-            self.tournament_system.add_round_results(_round_results)
-        self.results = self.tournament_system.get_all_results()
-        logger.info('tournament #%d finished', self.tournament_id)
+            self.tournament_system.add_round_results(_round_results,
+                                                     _round.series_weights)
+            if event_stream.is_open():
+                event_stream.emit('round_finished',
+                                  tournament_id=self.tournament_id,
+                                  round_id=round_id,
+                                  games=len(_round_results))
 
     def get_results(self):
         if self.results is None:
@@ -23,9 +23,26 @@ class TournamentTest(unittest.TestCase):
         tournament_file.create()().get_rounds.return_value = [{1: {1: 0, 2: 1}},
                                                       {2: {2: 0, 3: 1}}]
         tournament_file.create()().get_all_results.return_value = 'First player won'
+        tournament_file.create()().get_round_names.return_value = None
         tournament = tournament_file.Tournament([1, 2, 3], 1)
         tournament.run()
         self.assertEqual(tournament.get_results(), 'First player won')
 
+    def test_rounds_planned_once(self):
+        tournament_file.Round = Mock()
+        tournament_file.create = Mock()
+        tournament_system = tournament_file.create()()
+        tournament_system.get_rounds.return_value = iter([[[1, 2]], [[1, 3]]])
+        tournament_system.get_round_names.return_value = ['semifinal',
+                                                          'final']
+        signatures = []
+        tournament_file.Round.side_effect = \
+            lambda players, signature, *args: signatures.append(
+                signature.round_name) or Mock()
+        tournament = tournament_file.Tournament([1, 2, 3], 1)
+        tournament.run()
+        tournament_system.get_rounds.assert_called_once_with()
+        self.assertEqual(signatures, ['semifinal', 'final'])
+
 if __name__ == '__main__':
     unittest.main()
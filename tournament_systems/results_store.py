@@ -0,0 +1,275 @@
+'''
+Stores of results of tournament games: mappings
+{game_signature: {player: points, ...}, ...} with indexes by round,
+series, player and pair of players, so queries don't scan all games.
+
+ResultsStore keeps results in memory, SQLiteResultsStore keeps them in
+SQLite database for tournaments too large for memory. The store is
+chosen by `results_store` option of config ('memory' or 'sqlite',
+the database is `results_store_path`).
+'''
+from collections.abc import Mapping
+from itertools import combinations
+import pickle
+import sqlite3
+
+
+def _get_key(signature):
+    '''
+    Returns compact key of GameSignature, other keys are used as is.
+    '''
+    get_key = getattr(signature, 'get_key', None)
+    return signature if get_key is None else get_key()
+
+
+def _get_players(scores):
+    return scores.keys() if isinstance(scores, dict) else ()
+
+
+class ResultsStore(Mapping):
+    '''
+    In-memory store of results.
+    Usage:
+        >> store = ResultsStore()
+        >> store.update({signature: {player1: 1, player2: 0}})
+        >> store.filter(round_id=0)
+        {signature: {player1: 1, player2: 0}}
+        >> store.get_pair_results(player1, player2)
+        {signature: {player1: 1, player2: 0}}
+    '''
+    def __init__(self):
+        # key -> (signature, scores)
+        self._results = {}
+        # index -> {key: None, ...}, dicts keep the order of games
+        self._by_round = {}
+        self._by_series = {}
+        self._by_player = {}
+        self._by_pair = {}
+
+    def _get_indexes(self, signature, scores):
+        round_id = getattr(signature, 'round_id', None)
+        series_id = getattr(signature, 'series_id', None)
+        yield self._by_round, round_id
+        yield self._by_series, (round_id, series_id)
+        for player in _get_players(scores):
+            yield self._by_player, player
+        for pair in combinations(_get_players(scores), 2):
+            yield self._by_pair, frozenset(pair)
+
+    def add(self, signature, scores):
+        key = _get_key(signature)
+        if key in self._results:
+            self._remove(key)
+        self._results[key] = (signature, scores)
+        for index, value in self._get_indexes(signature, scores):
+            index.setdefault(value, {})[key] = None
+
+    def _remove(self, key):
+        signature, scores = self._results.pop(key)
+        for index, value in self._get_indexes(signature, scores):
+            del index[value][key]
+
+    def update(self, results):
+        for signature, scores in results.items():
+            self.add(signature, scores)
+
+    def __getitem__(self, signature):
+        return self._results[_get_key(signature)][1]
+
+    def __iter__(self):
+        return (signature for signature, _ in self._results.values())
+
+    def __len__(self):
+        return len(self._results)
+
+    def items(self):
+        return list(self._results.values())
+
+    def values(self):
+        return [scores for _, scores in self._results.values()]
+
+    def _select(self, keys):
+        return {self._results[key][0]: self._results[key][1] for key in keys}
+
+    def get_round_results(self, round_id):
+        return self._select(self._by_round.get(round_id, ()))
+
+    def get_series_results(self, round_id, series_id):
+        return self._select(self._by_series.get((round_id, series_id), ()))
+
+    def get_player_results(self, player):
+        return self._select(self._by_player.get(player, ()))
+
+    def get_pair_results(self, first, second):
+        return self._select(self._by_pair.get(frozenset((first, second)),
+                                              ()))
+
+    def filter(self, tournament_id=None, round_id=None, series_id=None,
+               game_id=None):
+        '''
+        Returns results of the games with given ids, None matches any id.
+        '''
+        if round_id is not None and series_id is not None:
+            keys = self._by_series.get((round_id, series_id), ())
+        elif round_id is not None:
+            keys = self._by_round.get(round_id, ())
+        else:
+            keys = self._results
+        wanted = (tournament_id, round_id, series_id, game_id)
+        results = {}
+        for key in keys:
+            signature, scores = self._results[key]
+            ids = (getattr(signature, 'tournament_id', None),
+                   getattr(signature, 'round_id', None),
+                   getattr(signature, 'series_id', None),
+                   getattr(signature, 'game_id', None))
+            if all(value is None or value == id_
+                   for value, id_ in zip(wanted, ids)):
+                results[signature] = scores
+        return results
+
+
+class SQLiteResultsStore(Mapping):
+    '''
+    Store of results in SQLite database `path`, keys should be
+    GameSignatures, players are stored pickled.
+    '''
+    def __init__(self, path=':memory:'):
+        self._connection = sqlite3.connect(path)
+        self._player_ids = {}
+        self._connection.executescript('''
+            CREATE TABLE IF NOT EXISTS games (
+                id INTEGER PRIMARY KEY, tournament_id, round_id,
+                series_id, game_id, signature BLOB,
+                UNIQUE (tournament_id, round_id, series_id, game_id));
+            CREATE TABLE IF NOT EXISTS players (
+                id INTEGER PRIMARY KEY, player BLOB UNIQUE);
+            CREATE TABLE IF NOT EXISTS scores (
+                game INTEGER, player INTEGER, score);
+            CREATE INDEX IF NOT EXISTS games_round
+                ON games (round_id, series_id);
+            CREATE INDEX IF NOT EXISTS scores_game ON scores (game);
+            CREATE INDEX IF NOT EXISTS scores_player ON scores (player);
+        ''')
+        self._players = {}
+        for player_id, player in self._connection.execute(
+                'SELECT id, player FROM players'):
+            self._players[player_id] = pickle.loads(player)
+            self._player_ids[self._players[player_id]] = player_id
+
+    def _get_player_id(self, player):
+        if player not in self._player_ids:
+            cursor = self._connection.execute(
+                'INSERT INTO players (player) VALUES (?)',
+                (pickle.dumps(player),))
+            self._player_ids[player] = cursor.lastrowid
+            self._players[cursor.lastrowid] = player
+        return self._player_ids[player]
+
+    def add(self, signature, scores):
+        self.update({signature: scores})
+
+    def update(self, results):
+        with self._connection:
+            for signature, scores in results.items():
+                self._add(signature, scores)
+
+    def _add(self, signature, scores):
+        key = signature.get_key()
+        self._connection.execute(
+            'DELETE FROM scores WHERE game IN (SELECT id FROM games WHERE '
+            'tournament_id IS ? AND round_id IS ? AND series_id IS ? '
+            'AND game_id IS ?)', key)
+        self._connection.execute(
+            'DELETE FROM games WHERE tournament_id IS ? AND round_id IS ? '
+            'AND series_id IS ? AND game_id IS ?', key)
+        cursor = self._connection.execute(
+            'INSERT INTO games (tournament_id, round_id, series_id, '
+            'game_id, signature) VALUES (?, ?, ?, ?, ?)',
+            key + (pickle.dumps(signature),))
+        self._connection.executemany(
+            'INSERT INTO scores (game, player, score) VALUES (?, ?, ?)',
+            [(cursor.lastrowid, self._get_player_id(player), score)
+             for player, score in scores.items()])
+
+    def _select(self, condition='1', parameters=()):
+        '''
+        Returns results of the games matching SQL `condition` on games.
+        '''
+        results = {}
+        signatures = {}
+        for game, signature, player, score in self._connection.execute(
+                'SELECT games.id, games.signature, scores.player, '
+                'scores.score FROM games JOIN scores ON scores.game = '
+                'games.id WHERE ' + condition + ' ORDER BY games.id',
+                parameters):
+            if game not in signatures:
+                signatures[game] = pickle.loads(signature)
+                results[signatures[game]] = {}
+            results[signatures[game]][self._players[player]] = score
+        return results
+
+    def __getitem__(self, signature):
+        results = self._select(
+            'tournament_id IS ? AND round_id IS ? AND series_id IS ? '
+            'AND game_id IS ?', signature.get_key())
+        if not results:
+            raise KeyError(signature)
+        return next(iter(results.values()))
+
+    def __iter__(self):
+        return iter(self._select())
+
+    def __len__(self):
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM games').fetchone()[0]
+
+    def items(self):
+        return list(self._select().items())
+
+    def get_round_results(self, round_id):
+        return self._select('round_id IS ?', (round_id,))
+
+    def get_series_results(self, round_id, series_id):
+        return self._select('round_id IS ? AND series_id IS ?',
+                            (round_id, series_id))
+
+    def get_player_results(self, player):
+        if player not in self._player_ids:
+            return {}
+        return self._select(
+            'games.id IN (SELECT game FROM scores WHERE player = ?)',
+            (self._player_ids[player],))
+
+    def get_pair_results(self, first, second):
+        if first not in self._player_ids or second not in self._player_ids:
+            return {}
+        return self._select(
+            'games.id IN (SELECT first.game FROM scores AS first JOIN '
+            'scores AS second ON first.game = second.game '
+            'WHERE first.player = ? AND second.player = ?)',
+            (self._player_ids[first], self._player_ids[second]))
+
+    def filter(self, tournament_id=None, round_id=None, series_id=None,
+               game_id=None):
+        conditions = ['1']
+        parameters = []
+        for column, value in (('tournament_id', tournament_id),
+                              ('round_id', round_id),
+                              ('series_id', series_id),
+                              ('game_id', game_id)):
+            if value is not None:
+                conditions.append(column + ' = ?')
+                parameters.append(value)
+        return self._select(' AND '.join(conditions), parameters)
+
+
+def create_results_store():
+    '''
+    Returns store of results chosen by config.
+    '''
+    import config
+    if getattr(config, 'results_store', 'memory') == 'sqlite':
+        return SQLiteResultsStore(getattr(config, 'results_store_path',
+                                          ':memory:'))
+    return ResultsStore()
@@ -0,0 +1,87 @@
+from tournament_systems.results_store import ResultsStore, \
+    SQLiteResultsStore
+from tournament_stages.game_signature import GameSignature
+from player import Player
+import os
+import tempfile
+import unittest
+
+PLAYERS = [Player('bot{0}'.format(i)) for i in range(3)]
+
+
+def get_results():
+    '''
+    Two rounds of round-robin of three players, two games per series.
+    '''
+    results = {}
+    for round_id in range(2):
+        pairs = [(0, 1), (0, 2), (1, 2)]
+        for series_id, (first, second) in enumerate(pairs):
+            for game_id in range(2):
+                signature = GameSignature(1, round_id, series_id, game_id)
+                results[signature] = {PLAYERS[first]: game_id,
+                                      PLAYERS[second]: round_id}
+    return results
+
+
+class ResultsStoreTest(unittest.TestCase):
+    def create_store(self):
+        return ResultsStore()
+
+    def setUp(self):
+        self.results = get_results()
+        self.store = self.create_store()
+        self.store.update(self.results)
+
+    def test_mapping(self):
+        self.assertEqual(len(self.store), 12)
+        self.assertEqual(dict(self.store.items()), self.results)
+        signature = GameSignature(1, 1, 2, 0)
+        self.assertEqual(self.store[signature],
+                         {PLAYERS[1]: 0, PLAYERS[2]: 1})
+        self.assertIn(signature, self.store)
+        self.assertNotIn(GameSignature(1, 2, 0, 0), self.store)
+
+    def test_replace(self):
+        signature = GameSignature(1, 0, 0, 0)
+        self.store.add(signature, {PLAYERS[0]: 5, PLAYERS[2]: 5})
+        self.assertEqual(len(self.store), 12)
+        self.assertEqual(self.store[GameSignature(1, 0, 0, 0)],
+                         {PLAYERS[0]: 5, PLAYERS[2]: 5})
+        self.assertEqual(len(self.store.get_pair_results(PLAYERS[0],
+                                                         PLAYERS[1])), 3)
+
+    def test_indexes(self):
+        self.assertEqual(len(self.store.get_round_results(0)), 6)
+        self.assertEqual(len(self.store.get_series_results(1, 2)), 2)
+        self.assertEqual(len(self.store.get_player_results(PLAYERS[0])), 8)
+        self.assertEqual(
+            set(self.store.get_pair_results(PLAYERS[2], PLAYERS[1])),
+            {GameSignature(1, round_id, 2, game_id)
+             for round_id in range(2) for game_id in range(2)})
+        self.assertEqual(self.store.get_player_results(Player('other')), {})
+
+    def test_filter(self):
+        self.assertEqual(len(self.store.filter(round_id=0)), 6)
+        self.assertEqual(len(self.store.filter(round_id=0, game_id=1)), 3)
+        self.assertEqual(list(self.store.filter(1, 1, 1, 1)),
+                         [GameSignature(1, 1, 1, 1)])
+        self.assertEqual(len(self.store.filter(series_id=0)), 4)
+        self.assertEqual(self.store.filter(tournament_id=2), {})
+
+
+class SQLiteResultsStoreTest(ResultsStoreTest):
+    def create_store(self):
+        return SQLiteResultsStore()
+
+    def test_reopen(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'results.db')
+            SQLiteResultsStore(path).update(self.results)
+            store = SQLiteResultsStore(path)
+            self.assertEqual(dict(store.items()), self.results)
+            store._connection.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+def _to_number(value):
+    '''
+    Converts NumPy float to int if it is integral, otherwise to float.
+    '''
+    value = value.item()
+    return int(value) if value.is_integer() else value
+
+
+class Standings:
+    '''
+    Standings of the tournament updated with every game result in
+    O(k^2) for the game of k players, so leaderboards and tables are
+    cheap to get at any moment. Games may have any number of players.
+    Usage:
+        >> standings = Standings(players)
+        >> standings.add_game({player1: 3, player2: 5})
+        >> standings.get_leaderboard()
+        [(player2, 5), (player1, 3)]
+        >> standings.get_pair_scores(player1, player2)
+        (3, 5)
+    Arrays (NumPy), indexes are the ones of players list:
+    totals[i] - sum of scores of player i
+    games_count[i] - number of games of player i
+    scores[i, j] - sum of scores of player i in games with player j
+    meetings[i, j] - number of games of players i and j
+    '''
+    def __init__(self, players):
+        import numpy as np
+        self.players = list(players)
+        self._indexes = {player: i for i, player in enumerate(self.players)}
+        count = len(self.players)
+        self.totals = np.zeros(count)
+        self.games_count = np.zeros(count, dtype=np.int64)
+        self.scores = np.zeros((count, count))
+        self.meetings = np.zeros((count, count), dtype=np.int64)
+
+    def add_game(self, game, weight=1):
+        '''
+        Adds results of the game {player: score, ...}, scores are
+        multiplied by `weight` (see Series.weight).
+        '''
+        indexes = [self._indexes[player] for player in game]
+        points = [score * weight for score in game.values()]
+        self.totals[indexes] += points
+        self.games_count[indexes] += 1
+        for i, score in zip(indexes, points):
+            for j in indexes:
+                if i != j:
+                    self.scores[i, j] += score
+                    self.meetings[i, j] += 1
+
+    def get_pair_scores(self, player, other):
+        '''
+        Returns tuple (score of `player`, score of `other`) of their
+        games or None if they didn't meet.
+        '''
+        i, j = self._indexes[player], self._indexes[other]
+        if not self.meetings[i, j]:
+            return None
+        return (_to_number(self.scores[i, j]), _to_number(self.scores[j, i]))
+
+    def get_leaderboard(self, top=None):
+        '''
+        Returns list of tuples (player, sum of scores) sorted by sum,
+        players with equal sums keep the order of players list.
+        '''
+        import numpy as np
+        order = np.argsort(-self.totals, kind='stable')[:top]
+        return [(self.players[i], _to_number(self.totals[i])) for i in order]
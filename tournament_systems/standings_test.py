@@ -0,0 +1,34 @@
+from tournament_systems.standings import Standings
+import unittest
+
+
+class StandingsTest(unittest.TestCase):
+    def setUp(self):
+        self.standings = Standings(['a', 'b', 'c', 'd'])
+
+    def test_add_game(self):
+        self.standings.add_game({'a': 1, 'b': 2, 'c': 3})
+        self.standings.add_game({'b': 0.5, 'd': 4})
+        self.assertEqual(self.standings.get_leaderboard(),
+                         [('d', 4), ('c', 3), ('b', 2.5), ('a', 1)])
+        self.assertEqual(self.standings.get_leaderboard(top=2),
+                         [('d', 4), ('c', 3)])
+        self.assertEqual(list(self.standings.games_count), [1, 2, 1, 1])
+
+    def test_pair_scores(self):
+        self.standings.add_game({'a': 1, 'b': 2})
+        self.standings.add_game({'b': 0, 'a': 3})
+        self.assertEqual(self.standings.get_pair_scores('a', 'b'), (4, 2))
+        self.assertEqual(self.standings.get_pair_scores('b', 'a'), (2, 4))
+        self.assertIsNone(self.standings.get_pair_scores('a', 'c'))
+        self.assertIsNone(self.standings.get_pair_scores('a', 'a'))
+
+    def test_equal_scores(self):
+        self.standings.add_game({'c': 1, 'b': 1})
+        self.assertEqual([player for player, _ in
+                          self.standings.get_leaderboard()],
+                         ['b', 'c', 'a', 'd'])
+
+
+if __name__ == '__main__':
+    unittest.main()
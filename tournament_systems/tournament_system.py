@@ -1,21 +1,27 @@
 from abc import abstractmethod
+from tournament_systems.results_store import ResultsStore
 
 
 class TournamentSystem:
     '''
     round_results format:
     {game_signature: {player: points, ...}, ...}
+    All results are kept in `results_store` (ResultsStore by default).
     '''
 
-    def __init__(self, players_list):
+    def __init__(self, players_list, results_store=None):
         self._players_list = players_list
-        self._results = {}
+        self._results = ResultsStore() if results_store is None \
+            else results_store
         self._all_rounds = [players_list]
         self._current_round_id = -1
 
-    def add_round_results(self, round_results):
+    def add_round_results(self, round_results, series_weights=None):
         '''
-        Add round_results to all results of tournament
+        Add round_results to all results of tournament.
+        series_weights - {series_id: weight} of the series of the round
+        stopped early, their games count `weight` times where points are
+        added up.
         '''
         self._results.update(round_results)
         self._current_round_id += 1
@@ -30,11 +36,7 @@ class TournamentSystem:
         '''
         Return results of round
         '''
-        results = {}
-        for game in self._results:
-            if game.round_id == round_id:
-                results.update({game: self._results[game]})
-        return results
+        return self._results.get_round_results(round_id)
 
     def get_current_round_results(self):
         '''
@@ -44,21 +46,39 @@ class TournamentSystem:
 
     def filter_results(self, tournament_id=None, round_id=None, series_id=None,
                        game_id=None):
-        results = {}
-        for game in self._results:
-            if not (tournament_id and tournament_id != game.tournament_id or
-                    round_id and round_id != game.round_id or
-                    series_id and series_id != game.series_id or
-                    game_id and game_id != game.game_id):
-                results.update({game: self._results[game]})
+        '''
+        Return results of the games with given ids, None matches any id
+        '''
+        return self._results.filter(tournament_id, round_id, series_id,
+                                    game_id)
 
     @abstractmethod
     def get_rounds(self):
         '''
-        Yield players_list for every round
+        Yield players_list for every round. The generator is iterated
+        once, results of the round are added before the next round
+        is taken.
         '''
         pass
 
+    def get_rounds_count(self):
+        '''
+        Return number of rounds of the tournament, known before
+        it starts, or None if it depends on results.
+        '''
+        return None
+
+    def get_round_names(self):
+        '''
+        Return list of names of all rounds (see get_round_name),
+        or None if number of rounds isn't known in advance.
+        '''
+        rounds_count = self.get_rounds_count()
+        if rounds_count is None:
+            return None
+        return [self.get_round_name(round_number, rounds_count)
+                for round_number in range(rounds_count)]
+
     @abstractmethod
     def get_table(self):
         '''
@@ -0,0 +1,106 @@
+from tournament_systems.tournament_system_each import TournamentSystemEach
+import tournament_systems.ascii_draw_table
+from itertools import combinations
+
+
+def get_covering(players_count, group_size, multiplicity=1):
+    '''
+    Greedily builds covering design: list of groups (lists of
+    `group_size` indexes of players) in which every pair of players
+    meets at least `multiplicity` times. Every next group is started by
+    the player with most pairs left and filled with the players
+    which cover most of the pairs left with the group.
+    Examples:
+    >> get_covering(4, 3)
+    [[0, 1, 2], [3, 0, 1], [2, 3, 0]]
+    '''
+    group_size = min(group_size, players_count)
+    if players_count < 2:
+        return []
+    if group_size == 2:
+        return [list(pair) for pair in combinations(range(players_count), 2)
+                for _ in range(multiplicity)]
+    # needed[i][j] - how many times players i and j have to meet yet
+    needed = [[multiplicity] * players_count for _ in range(players_count)]
+    for i in range(players_count):
+        needed[i][i] = 0
+    left = [multiplicity * (players_count - 1)] * players_count
+    groups = []
+    while any(left):
+        first = max(range(players_count), key=lambda i: left[i])
+        group = [first]
+        # gain[j] - pairs left between player j and the group
+        gain = list(needed[first])
+        while len(group) < group_size:
+            best = max((j for j in range(players_count) if j not in group),
+                       key=lambda j: (gain[j], left[j]))
+            group.append(best)
+            row = needed[best]
+            for j in range(players_count):
+                gain[j] += row[j]
+        for i in group:
+            for j in group:
+                if i != j and needed[i][j]:
+                    needed[i][j] -= 1
+                    left[i] -= 1
+        groups.append(group)
+    return groups
+
+
+class TournamentSystemCovering(TournamentSystemEach):
+    '''
+    Tournament of games of `players_per_game` players (option of config,
+    2 by default) in which every pair of players meets at least
+    `covering_multiplicity` times (1 by default). Groups are taken from
+    covering design, which needs about n^2 / k^2 games instead of
+    n^2 / 2 games of all pairs.
+    '''
+    def get_rounds(self):
+        '''
+        Yields one round with all groups of players.
+        '''
+        import config
+        groups = get_covering(len(self._players_list),
+                              getattr(config, 'players_per_game', 2),
+                              getattr(config, 'covering_multiplicity', 1))
+        yield [[self._players_list[i] for i in group] for group in groups]
+
+    def get_pair_scores(self):
+        '''
+        Returns dict {(player, other): (score, other's score), ...}
+        with sums of scores of the pair in all their common games.
+        '''
+        scores = {}
+        for player in self._players_list:
+            for other in self._players_list:
+                pair_scores = self._standings.get_pair_scores(player, other)
+                if pair_scores is not None:
+                    scores[(player, other)] = pair_scores
+        return scores
+
+    def get_table(self):
+        '''
+        Returns the table of scores of all pairs (list of strings),
+        players are sorted by number of opponents they outscored.
+        '''
+        standings = self._standings
+        # Opponents outscored by every player
+        wins = dict(zip(standings.players,
+                        (standings.scores > standings.scores.T).sum(axis=1)))
+        order = {player: i for i, player in enumerate(self._players_list)}
+        players = sorted(self._players_list,
+                         key=lambda player: (-wins[player], order[player]))
+
+        table = [[''] + [str(player) for player in players] + ['Wins']]
+        for player in players:
+            row = [str(player)]
+            for other in players:
+                pair_scores = standings.get_pair_scores(player, other)
+                if pair_scores is None:
+                    row.append('')
+                else:
+                    row.append(self._convert_score(pair_scores))
+            row.append(str(wins[player]))
+            table.append(row)
+        ascii_drawer = tournament_systems.ascii_draw_table.ASCIIDrawTable()
+        return ascii_drawer.draw_table(table)
@@ -0,0 +1,60 @@
+from tournament_systems.tournament_system_covering import \
+    TournamentSystemCovering, get_covering
+from itertools import combinations
+from types import SimpleNamespace
+from unittest.mock import patch
+import unittest
+
+
+def count_meetings(groups):
+    meetings = {}
+    for group in groups:
+        for pair in combinations(sorted(group), 2):
+            meetings[pair] = meetings.get(pair, 0) + 1
+    return meetings
+
+
+class GetCoveringTest(unittest.TestCase):
+    def test_covering(self):
+        for players_count, group_size, multiplicity in \
+                [(7, 3, 1), (20, 4, 1), (20, 4, 2), (10, 5, 3), (5, 2, 1)]:
+            groups = get_covering(players_count, group_size, multiplicity)
+            self.assertTrue(all(len(set(group)) == group_size
+                                for group in groups))
+            meetings = count_meetings(groups)
+            self.assertEqual(len(meetings),
+                             players_count * (players_count - 1) // 2)
+            self.assertGreaterEqual(min(meetings.values()), multiplicity)
+
+    def test_fewer_games(self):
+        self.assertLess(len(get_covering(60, 4)), 60 * 59 // 2 // 5)
+
+    def test_small(self):
+        self.assertEqual(get_covering(1, 3), [])
+        self.assertEqual(get_covering(2, 3), [[0, 1]])
+
+
+class TournamentSystemCoveringTest(unittest.TestCase):
+    def test_get_rounds(self):
+        ts = TournamentSystemCovering(['a', 'b', 'c', 'd'])
+        config = SimpleNamespace(players_per_game=3)
+        with patch.dict('sys.modules', {'config': config}):
+            rounds = list(ts.get_rounds())
+        self.assertEqual(rounds, [[['a', 'b', 'c'], ['d', 'a', 'b'],
+                                   ['c', 'd', 'a']]])
+
+    def test_get_table(self):
+        ts = TournamentSystemCovering(['a', 'b', 'c', 'd'])
+        ts.add_round_results({1: {'a': 1, 'b': 2, 'c': 3},
+                              2: {'d': 5, 'a': 0, 'b': 1}})
+        scores = ts.get_pair_scores()
+        self.assertEqual(scores[('a', 'b')], (1, 3))
+        self.assertEqual(scores[('b', 'a')], (3, 1))
+        self.assertNotIn(('c', 'd'), scores)
+        table = ts.get_table()
+        self.assertEqual(table[1], '|    | c  | d  | b  | a  |Wins|')
+        self.assertEqual(table[9], '| a  |1:3 |0:5 |1:3 |    | 0  |')
+
+
+if __name__ == '__main__':
+    unittest.main()
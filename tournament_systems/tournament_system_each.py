@@ -1,11 +1,34 @@
 from tournament_systems.tournament_system import TournamentSystem
+from tournament_systems.standings import Standings
 import tournament_systems.ascii_draw_table
 
 
 class TournamentSystemEach(TournamentSystem):
     '''
     In this tournament system every player competes with each other.
+    Standings are updated with every added result.
     '''
+    def __init__(self, players_list, results_store=None):
+        super().__init__(players_list, results_store)
+        self._standings = Standings(players_list)
+
+    def add_round_results(self, round_results, series_weights=None):
+        '''
+        Add round_results to all results of tournament and standings
+        '''
+        super().add_round_results(round_results, series_weights)
+        for signature, game in round_results.items():
+            weight = 1
+            if series_weights:
+                weight = series_weights.get(signature.series_id, 1)
+            self._standings.add_game(game, weight)
+
+    def get_standings(self):
+        return self._standings
+
+    def get_rounds_count(self):
+        return 1
+
     def get_rounds(self):
         '''
         Returns list of lists of players who plays in this round
@@ -32,34 +55,10 @@ class TournamentSystemEach(TournamentSystem):
         '''
         # List of list of cells
         table = []
-        # Gets tuple of score using tuple of players
-        scores = {}
-        # Used to sort players in correct order, tuple (player, score)
-        players = []
         # Current row
         row = []
-
-        # Fills scores dict
-        for game in self._results.values():
-            current_game = []
-            for player, score in game.items():
-                current_game.append((player, score))
-            ((first_player, first_score),
-             (second_player, second_score)) = current_game
-            scores[(first_player, second_player)] =\
-                  (first_score, second_score)
-            scores[(second_player, first_player)] =\
-                   (second_score, first_score)
-
-        # Fills players list
-        for player in self._players_list:
-            sum = 0
-            for second_player in self._players_list:
-                if player != second_player:
-                    sum += scores[(player, second_player)][0]
-            players.append((player, sum))
-        # Sort players by score
-        players.sort(reverse=True, key=lambda player: player[1])
+        # Players sorted by score, tuples (player, score)
+        players = self._standings.get_leaderboard()
 
         # Fills the header
         row.append('')
@@ -73,11 +72,12 @@ class TournamentSystemEach(TournamentSystem):
             # Player's name
             row = [str(first_player[0])]
             for second_player in players:
-                if first_player == second_player:
+                scores = self._standings.get_pair_scores(first_player[0],
+                                                         second_player[0])
+                if scores is None:
                     row.append('')
                 else:
-                    row.append(self._convert_score(scores[(first_player[0],
-                                                           second_player[0])]))
+                    row.append(self._convert_score(scores))
             # Fills the score cell
             row.append(str(first_player[1]))
             table.append(row)
@@ -1,4 +1,5 @@
 from tournament_systems.tournament_system_each import TournamentSystemEach
+from tournament_stages.game_signature import GameSignature
 import unittest
 
 PLAYERS_LIST = [1, 2]
@@ -21,6 +22,17 @@ class TournamentSystemEachTest(unittest.TestCase):
         for string in table:
             print(string)
 
+    def test_series_weights(self):
+        ts = TournamentSystemEach([1, 2, 3])
+        ts.add_round_results({GameSignature(0, 0, 0, 0): {1: 1, 2: 0},
+                              GameSignature(0, 0, 1, 0): {1: 0, 3: 1},
+                              GameSignature(0, 0, 1, 1): {1: 0, 3: 1}},
+                             {0: 2})
+        self.assertEqual(ts.get_standings().get_leaderboard(),
+                         [(1, 2), (3, 2), (2, 0)])
+        self.assertEqual(ts.get_all_results()[GameSignature(0, 0, 0, 0)],
+                         {1: 1, 2: 0})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -14,18 +14,16 @@ class TournamentSystemOlympic(TournamentSystem):
     system, generating a list of players for each round based
     on the results of the previous one.
     '''
-    def __init__(self, players_list):
-        self._players_list = players_list
-        self._results = {}
-        self._all_rounds = [players_list]
-        self._current_round_id = -1
+    def __init__(self, players_list, results_store=None):
+        super().__init__(players_list, results_store)
         self._list_of_rounds = []
         self._data = []
         self._tournament_id = 0
 
-    def add_round_results(self, round_results):
+    def add_round_results(self, round_results, series_weights=None):
         '''
-        Add round_results to all results of tournament
+        Add round_results to all results of tournament, winners of games
+        don't depend on `series_weights`.
         '''
         self._results.update(round_results)
         self._current_round_id += 1
@@ -38,6 +36,14 @@ class TournamentSystemOlympic(TournamentSystem):
             results_list.append(games_results)
         self._data.append(results_list)
 
+    def get_rounds_count(self):
+        '''
+        Returns number of rounds, log2 of number of players.
+        '''
+        if not self._players_list:
+            return 0
+        return round(log(len(self._players_list), 2))
+
     def get_rounds(self):
         '''
         Yields lists of players for each round.
@@ -46,7 +52,7 @@ class TournamentSystemOlympic(TournamentSystem):
         count_of_players = len(list_of_players)
         if count_of_players == 0:
             raise Exception("No players found. Can not create Olympic system.")
-        count_of_all_rounds = round(log(count_of_players, 2))
+        count_of_all_rounds = self.get_rounds_count()
         if log(count_of_players, 2) != count_of_all_rounds:
             raise Exception("Count of players have to be equal 2^N. Can not create Olympic system.")
         for game_round in range(count_of_all_rounds):
@@ -28,6 +28,12 @@ class TournamentSystemOlympicTest(unittest.TestCase):
         self.assertEqual(second_players, SECOND_ROUND)
         self.assertEqual(third_players, THIRD_ROUND)
 
+    def test_get_round_names(self):
+        test_rounds = TournamentSystemOlympic(PLAYERS_LIST)
+        self.assertEqual(test_rounds.get_rounds_count(), 3)
+        self.assertEqual(test_rounds.get_round_names(),
+                         ['quarterfinal', 'semifinal', 'final'])
+
     def test_get_table(self):
         test_rounds = TournamentSystemOlympic(PLAYERS_LIST)
         test_rounds.get_current_round_results = Mock()
@@ -0,0 +1,209 @@
+from tournament_systems.tournament_system import TournamentSystem
+from itertools import combinations
+from math import ceil, log, pi, sqrt
+
+Q = log(10) / 400
+INITIAL_RATING = 1500
+INITIAL_DEVIATION = 350
+MIN_DEVIATION = 30
+
+
+def _g(deviation):
+    return 1 / sqrt(1 + 3 * (Q * deviation / pi) ** 2)
+
+
+def expected_score(rating, other):
+    '''
+    Expected score of `rating` in the game with `other` (Rating objects).
+    '''
+    return 1 / (1 + 10 ** (-_g(other.deviation) *
+                           (rating.rating - other.rating) / 400))
+
+
+class Rating:
+    '''
+    Glicko rating of the player: `rating` and its standard
+    `deviation` (uncertainty), both in Elo points.
+    '''
+    def __init__(self, rating=INITIAL_RATING, deviation=INITIAL_DEVIATION):
+        self.rating = rating
+        self.deviation = deviation
+        self.games_count = 0
+
+    def _get_information(self, other):
+        '''
+        Returns 1/d^2 of Glicko: how much the game with `other`
+        tells about the player.
+        '''
+        expected = expected_score(self, other)
+        return (Q * _g(other.deviation)) ** 2 * expected * (1 - expected)
+
+    def get_deviation_after(self, other):
+        '''
+        Returns deviation of the player after the game with `other`.
+        '''
+        return max(MIN_DEVIATION, 1 / sqrt(1 / self.deviation ** 2 +
+                                           self._get_information(other)))
+
+    def updated(self, other, score):
+        '''
+        Returns new Rating after the game with `other` with `score`
+        (1 - win, 0.5 - draw, 0 - loss).
+        '''
+        information = self._get_information(other)
+        variance = 1 / (1 / self.deviation ** 2 + information)
+        new_rating = Rating(
+            self.rating + Q * variance * _g(other.deviation) *
+            (score - expected_score(self, other)),
+            max(MIN_DEVIATION, sqrt(variance)))
+        new_rating.games_count = self.games_count + 1
+        return new_rating
+
+    def __repr__(self):
+        return 'Rating({0:.0f}, {1:.0f})'.format(self.rating, self.deviation)
+
+
+class TournamentSystemRated(TournamentSystem):
+    '''
+    Rated tournament: every player has Glicko rating, which is updated
+    after every game in `add_round_results`. Every round pairs players
+    with the games which reduce uncertainty of ratings the most: close
+    ratings with large deviations. The tournament stops when the order
+    of the top `rated_top_k` players hasn't changed for
+    `rated_stable_rounds` rounds, or after `rated_max_rounds` rounds
+    (options of config).
+
+    Players are compared only with `rated_window` neighbours in the
+    ratings list, so planning of a round takes O(n log n).
+    '''
+    def __init__(self, players_list, results_store=None):
+        super().__init__(players_list, results_store)
+        self.ratings = {player: Rating() for player in players_list}
+        self._top = None
+        self._stable_rounds = 0
+
+    def _get_option(self, name, default):
+        import config
+        return getattr(config, name, default)
+
+    def _get_min_rounds(self):
+        return max(1, ceil(log(max(len(self._players_list), 2), 2)))
+
+    def add_round_results(self, round_results, series_weights=None):
+        '''
+        Updates ratings with results of the games of the round
+        in the order of games, ratings don't depend on `series_weights`.
+        '''
+        super().add_round_results(round_results, series_weights)
+        for signature in sorted(round_results):
+            self._add_game_results(round_results[signature])
+        top = self.get_standings()[:self._get_option('rated_top_k', 10)]
+        if top == self._top:
+            self._stable_rounds += 1
+        else:
+            self._stable_rounds = 0
+        self._top = top
+
+    def _add_game_results(self, game):
+        '''
+        Updates ratings of every pair of players of the game, the player
+        with greater score wins.
+        '''
+        new_ratings = {}
+        for first, second in combinations(game, 2):
+            score = 0.5 + 0.5 * ((game[first] > game[second]) -
+                                 (game[first] < game[second]))
+            new_ratings.setdefault(first, []).append(
+                self.ratings[first].updated(self.ratings[second], score))
+            new_ratings.setdefault(second, []).append(
+                self.ratings[second].updated(self.ratings[first], 1 - score))
+        for player, ratings in new_ratings.items():
+            # Changes of all pairs of the game are applied together
+            old = self.ratings[player]
+            rating = Rating(
+                old.rating + sum(r.rating - old.rating for r in ratings),
+                min(r.deviation for r in ratings))
+            rating.games_count = old.games_count + 1
+            self.ratings[player] = rating
+
+    def get_standings(self):
+        '''
+        Returns players sorted by rating, the best one first.
+        '''
+        order = {player: i for i, player in enumerate(self._players_list)}
+        return sorted(self._players_list,
+                      key=lambda player: (-self.ratings[player].rating,
+                                          order[player]))
+
+    def is_finished(self):
+        rounds_count = self._current_round_id + 1
+        max_rounds = self._get_option('rated_max_rounds',
+                                      4 * self._get_min_rounds())
+        if rounds_count >= max_rounds or len(self._players_list) < 2:
+            return True
+        return (rounds_count >= self._get_min_rounds() and
+                self._stable_rounds >=
+                self._get_option('rated_stable_rounds', 2))
+
+    def get_rounds(self):
+        '''
+        Yields pairs of players of every round until the top
+        of the standings becomes stable. Results of the round should
+        be added before the next round is taken.
+        '''
+        max_rounds = self._get_option('rated_max_rounds',
+                                      4 * self._get_min_rounds())
+        for _ in range(max_rounds):
+            if self.is_finished():
+                return
+            yield self._get_pairs()
+
+    def _get_information_gain(self, first, second):
+        '''
+        Returns expected reduction of variances of ratings of
+        `first` and `second` after their game.
+        '''
+        gain = 0
+        for player, other in ((first, second), (second, first)):
+            rating = self.ratings[player]
+            gain += (rating.deviation ** 2 -
+                     rating.get_deviation_after(self.ratings[other]) ** 2)
+        return gain
+
+    def _get_pairs(self):
+        '''
+        Greedily matches candidate pairs (neighbours in standings)
+        with the most information gain first. Players left without
+        a candidate are paired in the order of standings.
+        '''
+        standings = self.get_standings()
+        window = self._get_option('rated_window', 8)
+        candidates = []
+        for i, first in enumerate(standings):
+            for second in standings[i + 1:i + 1 + window]:
+                candidates.append(
+                    (-self._get_information_gain(first, second),
+                     i, first, second))
+        candidates.sort(key=lambda candidate: candidate[:2])
+        pairs = []
+        paired = set()
+        for _, _, first, second in candidates:
+            if first not in paired and second not in paired:
+                pairs.append([first, second])
+                paired.update((first, second))
+        left = [player for player in standings if player not in paired]
+        for i in range(0, len(left) - 1, 2):
+            pairs.append([left[i], left[i + 1]])
+        return pairs
+
+    def get_table(self):
+        '''
+        Returns standings of the tournament as list of strings.
+        '''
+        table = []
+        for place, player in enumerate(self.get_standings(), 1):
+            rating = self.ratings[player]
+            table.append('{0}. {1}: {2:.0f} +- {3:.0f} ({4} games)'.format(
+                place, player, rating.rating, 2 * rating.deviation,
+                rating.games_count))
+        return table
@@ -0,0 +1,81 @@
+from tournament_systems.tournament_system_rated import TournamentSystemRated, \
+    Rating, expected_score
+from tournament_stages.game_signature import GameSignature
+from types import SimpleNamespace
+from unittest.mock import patch
+import unittest
+
+
+def play_round(ts, round_id, pairs):
+    '''
+    Adds results of the round in which the player with greater
+    number wins.
+    '''
+    results = {}
+    for series_id, (first, second) in enumerate(pairs):
+        signature = GameSignature(1, round_id, series_id, 0)
+        results[signature] = {first: int(first > second),
+                              second: int(second > first)}
+    ts.add_round_results(results)
+
+
+class RatingTest(unittest.TestCase):
+    def test_expected_score(self):
+        self.assertAlmostEqual(expected_score(Rating(), Rating()), 0.5)
+        self.assertGreater(expected_score(Rating(1700), Rating()), 0.5)
+
+    def test_updated(self):
+        rating = Rating(1500, 200)
+        new_rating = rating.updated(Rating(1400, 30), 1)
+        self.assertAlmostEqual(new_rating.rating, 1563.4, places=1)
+        self.assertLess(new_rating.deviation, rating.deviation)
+        self.assertEqual(new_rating.games_count, 1)
+
+
+class TournamentSystemRatedTest(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.dict('sys.modules', {'config': SimpleNamespace()})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _play(self, players):
+        ts = TournamentSystemRated(players)
+        games_count = 0
+        for round_id, pairs in enumerate(ts.get_rounds()):
+            games_count += len(pairs)
+            play_round(ts, round_id, pairs)
+        return ts, games_count
+
+    def test_first_round(self):
+        ts = TournamentSystemRated([1, 2, 3, 4, 5])
+        pairs = next(ts.get_rounds())
+        self.assertEqual(len(pairs), 2)
+        self.assertEqual(len({player for pair in pairs for player in pair}),
+                         4)
+
+    def test_standings(self):
+        players = list(range(64))
+        ts, games_count = self._play(players)
+        self.assertLess(games_count, len(players) * (len(players) - 1) / 4)
+        standings = ts.get_standings()
+        self.assertEqual(standings[0], 63)
+        self.assertEqual(standings[-1], 0)
+        self.assertTrue(ts.is_finished())
+        # Ratings become more certain
+        self.assertTrue(all(rating.deviation < 350
+                            for rating in ts.ratings.values()))
+
+    def test_max_rounds(self):
+        with patch.dict('sys.modules',
+                        {'config': SimpleNamespace(rated_max_rounds=2)}):
+            self.assertEqual(self._play(list(range(16)))[1], 16)
+
+    def test_get_table(self):
+        ts, _ = self._play([1, 2])
+        table = ts.get_table()
+        self.assertEqual(len(table), 2)
+        self.assertTrue(table[0].startswith('1. 2: '))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+from tournament_systems.tournament_system import TournamentSystem
+from itertools import islice
+from math import ceil, log
+
+
+class TournamentSystemSwiss(TournamentSystem):
+    '''
+    Swiss system: every round players with similar points play with
+    each other, nobody plays with the same opponent twice if it can be
+    avoided. ceil(log2(n)) rounds (or `swiss_rounds` from config) of n/2
+    series each are enough to sort players like round-robin does.
+
+    Winner of the series (the player with greater sum of scores in its
+    games) gets 1 point, both players get 0.5 for a draw. If the number
+    of players is odd, the lowest player without bye gets 1 point
+    without playing. Ties are broken by Buchholz score, the sum of
+    points of the player's opponents.
+    '''
+    def get_rounds_count(self):
+        import config
+        players_count = len(self._players_list)
+        default = max(1, ceil(log(players_count, 2))) \
+            if players_count > 1 else 0
+        return min(getattr(config, 'swiss_rounds', default),
+                   max(players_count - 1, 0))
+
+    def get_rounds(self):
+        '''
+        Yields pairs of players of every round. Pairs of the round
+        depend on results of the previous rounds, so results should be
+        added before the next round is taken.
+        '''
+        for round_id in range(self.get_rounds_count()):
+            yield self._get_pairs()
+
+    def _get_series(self):
+        '''
+        Returns dict {(round_id, series_id): {player: score, ...}, ...}
+        with sums of scores of the games of every series.
+        '''
+        series = {}
+        for signature, game in self._results.items():
+            scores = series.setdefault(
+                (signature.round_id, signature.series_id), {})
+            for player, score in game.items():
+                scores[player] = scores.get(player, 0) + score
+        return series
+
+    def get_standings(self):
+        '''
+        Returns list of tuples (player, points, buchholz, byes) sorted
+        from the best player to the worst one. Players with equal points
+        and Buchholz score keep the order of the players list.
+        '''
+        series = self._get_series()
+        rounds = {round_id for round_id, _ in series}
+        points = {player: 0 for player in self._players_list}
+        opponents = {player: [] for player in self._players_list}
+        played_rounds = {player: set() for player in self._players_list}
+        for (round_id, _), scores in series.items():
+            best = max(scores.values())
+            winners = [player for player, score in scores.items()
+                       if score == best]
+            for player in scores:
+                played_rounds[player].add(round_id)
+                opponents[player].extend(other for other in scores
+                                         if other != player)
+                if player in winners:
+                    points[player] += 1 / len(winners)
+        # Player who didn't play in the round got bye
+        byes = {player: len(rounds - played_rounds[player])
+                for player in self._players_list}
+        for player in self._players_list:
+            points[player] += byes[player]
+        order = {player: i for i, player in enumerate(self._players_list)}
+        standings = [(player, points[player],
+                      sum(points[other] for other in opponents[player]),
+                      byes[player])
+                     for player in self._players_list]
+        standings.sort(key=lambda row: (-row[1], -row[2], order[row[0]]))
+        return standings
+
+    def _get_played(self):
+        '''
+        Returns set of frozensets of players which already played.
+        '''
+        return {frozenset(scores) for scores in self._get_series().values()}
+
+    def _get_pairs(self):
+        '''
+        Pairs players going down the standings: every player plays
+        with the nearest player below it who wasn't its opponent yet.
+        Rematches left at the bottom are repaired by exchanging opponents
+        with the pairs above, if possible.
+        '''
+        standings = self.get_standings()
+        players = [row[0] for row in standings]
+        if len(players) % 2:
+            # The lowest player among the ones with the least byes
+            least_byes = min(row[3] for row in standings)
+            bye = [row[0] for row in standings if row[3] == least_byes][-1]
+            players.remove(bye)
+        played = self._get_played()
+
+        pairs = []
+        paired = set()
+        for i, first in enumerate(players):
+            if first in paired:
+                continue
+            second = None
+            for player in islice(players, i + 1, None):
+                if player in paired:
+                    continue
+                if second is None:
+                    # Rematch if there is no new opponent
+                    second = player
+                if frozenset((first, player)) not in played:
+                    second = player
+                    break
+            pairs.append([first, second])
+            paired.update((first, second))
+
+        for i in range(len(pairs) - 1, -1, -1):
+            if frozenset(pairs[i]) in played:
+                self._repair(pairs, i, played)
+        return pairs
+
+    def _repair(self, pairs, i, played):
+        '''
+        Exchanges opponents of the pair `i` and the nearest pair above it,
+        so both new pairs are new.
+        '''
+        first, second = pairs[i]
+        for j in range(i - 1, -1, -1):
+            third, fourth = pairs[j]
+            for new_pairs in (([third, first], [fourth, second]),
+                              ([third, second], [fourth, first])):
+                if all(frozenset(pair) not in played for pair in new_pairs):
+                    pairs[j], pairs[i] = new_pairs
+                    return
+
+    def get_table(self):
+        '''
+        Returns standings of the tournament as list of strings.
+        '''
+        table = []
+        for place, (player, points, buchholz, byes) in \
+                enumerate(self.get_standings(), 1):
+            table.append('{0}. {1}: {2:g} points, Buchholz {3:g}'.format(
+                place, player, points, buchholz))
+        return table
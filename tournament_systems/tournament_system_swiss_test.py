@@ -0,0 +1,80 @@
+from tournament_systems.tournament_system_swiss import TournamentSystemSwiss
+from tournament_stages.game_signature import GameSignature
+from types import SimpleNamespace
+from unittest.mock import patch
+import unittest
+
+
+def play_round(ts, round_id, pairs):
+    '''
+    Adds results of the round in which the player with greater
+    number wins.
+    '''
+    results = {}
+    for series_id, (first, second) in enumerate(pairs):
+        signature = GameSignature(1, round_id, series_id, 0)
+        results[signature] = {first: int(first > second),
+                              second: int(second > first)}
+    ts.add_round_results(results)
+
+
+class TournamentSystemSwissTest(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.dict('sys.modules', {'config': SimpleNamespace()})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _play(self, players):
+        ts = TournamentSystemSwiss(players)
+        all_pairs = []
+        for round_id, pairs in enumerate(ts.get_rounds()):
+            all_pairs.extend(frozenset(pair) for pair in pairs)
+            play_round(ts, round_id, pairs)
+        return ts, all_pairs
+
+    def test_rounds_count(self):
+        self.assertEqual(TournamentSystemSwiss(
+            list(range(300))).get_rounds_count(), 9)
+        self.assertEqual(TournamentSystemSwiss([1, 2]).get_rounds_count(), 1)
+        with patch.dict('sys.modules',
+                        {'config': SimpleNamespace(swiss_rounds=3)}):
+            self.assertEqual(TournamentSystemSwiss(
+                list(range(8))).get_rounds_count(), 3)
+
+    def test_first_round(self):
+        ts = TournamentSystemSwiss([1, 2, 3, 4])
+        self.assertEqual(next(ts.get_rounds()), [[1, 2], [3, 4]])
+
+    def test_no_rematches(self):
+        ts, all_pairs = self._play(list(range(64)))
+        self.assertEqual(len(all_pairs), 6 * 32)
+        self.assertEqual(len(set(all_pairs)), len(all_pairs))
+
+    def test_standings(self):
+        ts, _ = self._play(list(range(16)))
+        standings = ts.get_standings()
+        self.assertEqual(standings[0][:2], (15, 4))
+        self.assertEqual(standings[-1][:2], (0, 0))
+        # Stronger half of players gets more points
+        points = {row[0]: row[1] for row in standings}
+        self.assertGreater(sum(points[player] for player in range(8, 16)),
+                           sum(points[player] for player in range(8)))
+
+    def test_odd_players(self):
+        ts, all_pairs = self._play(list(range(7)))
+        standings = ts.get_standings()
+        byes = [row[3] for row in standings]
+        self.assertEqual(sum(byes), ts.get_rounds_count())
+        self.assertEqual(max(byes), 1)
+        self.assertEqual(len(set(all_pairs)), len(all_pairs))
+        self.assertEqual(sum(row[1] for row in standings),
+                         len(all_pairs) + sum(byes))
+
+    def test_get_table(self):
+        ts, _ = self._play([1, 2])
+        self.assertEqual(ts.get_table(), ['1. 2: 1 points, Buchholz 0',
+                                          '2. 1: 0 points, Buchholz 1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -59,6 +59,22 @@ class TournamentSystemTest(unittest.TestCase):
         self.ts.add_round_results(round_results2)
         self.assertEqual(self.ts.get_current_round_results(), round_results1)
 
+    def test_filter_results(self):
+        round_results = {}
+        for round_id in range(2):
+            for game_id in range(2):
+                signature = GameSignature(1, round_id, 0, game_id)
+                round_results[signature] = {'player1': round_id,
+                                            'player2': game_id}
+        self.ts.add_round_results(round_results)
+        self.assertEqual(self.ts.filter_results(round_id=0),
+                         {GameSignature(1, 0, 0, 0): {'player1': 0,
+                                                      'player2': 0},
+                          GameSignature(1, 0, 0, 1): {'player1': 0,
+                                                      'player2': 1}})
+        self.assertEqual(len(self.ts.filter_results(tournament_id=1)), 4)
+        self.assertEqual(len(self.ts.filter_results(game_id=1)), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
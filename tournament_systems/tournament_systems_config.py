@@ -1,9 +1,18 @@
+from tournament_systems.tournament_system_covering \
+    import TournamentSystemCovering
 from tournament_systems.tournament_system_each \
     import TournamentSystemEach
 from tournament_systems.tournament_system_olympic \
     import TournamentSystemOlympic
+from tournament_systems.tournament_system_rated \
+    import TournamentSystemRated
+from tournament_systems.tournament_system_swiss \
+    import TournamentSystemSwiss
 
 tournament_systems = {
+    'covering': TournamentSystemCovering,
     'olympic': TournamentSystemOlympic,
-    'round-robin': TournamentSystemEach
+    'rated': TournamentSystemRated,
+    'round-robin': TournamentSystemEach,
+    'swiss': TournamentSystemSwiss
 }